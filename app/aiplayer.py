@@ -351,6 +351,14 @@ class AIPlayer:
         self.deck = deck_info["deck"]
         self.cheer_deck = deck_info["cheer_deck"]
 
+    def cancel_move(self):
+        # Greedy moves are instant, there is no search to stop.
+        pass
+
+    def stop_moves(self):
+        # The game is ending (resign, disconnect), no more moves are wanted.
+        self.cancel_move()
+
     def get_player_game_info(self):
         return {
             "player_id": self.player_id,
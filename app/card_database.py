@@ -17,9 +17,74 @@ ALLOWED_DECK_TYPES = [
     "support",
 ]
 
+class FrozenDict(dict):
+    """A read-only dict used for shared card definitions.
+
+    Deep copying a frozen definition returns plain, mutable dicts and lists,
+    so existing "deepcopy then modify" code keeps working unchanged.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Card definitions are read-only. Copy the card before modifying it.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+class FrozenList(list):
+    """A read-only list used inside shared card definitions."""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Card definitions are read-only. Copy the card before modifying it.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+def freeze_definition(value):
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze_definition(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze_definition(item) for item in value)
+    return value
+
 class CardDatabase:
     def __init__(self):
         self.all_cards = []
+        # card_id -> frozen definition
+        self.cards_by_id : Dict[str, FrozenDict] = {}
+        # alt_id -> card_ids of the original card and all of its alternates
+        self.card_ids_by_alt_id : Dict[str, List[str]] = {}
 
         # The card_definitions.json file is in root\decks\card_definitions.json
         # This file is in root\app
@@ -44,18 +109,33 @@ class CardDatabase:
                     alt_card["rarity"] = rarity
                     del alt_card["alternates"]
                     card_data.append(alt_card)
-            self.all_cards = card_data
+            self.all_cards = [freeze_definition(card) for card in card_data]
 
-    def get_card_by_id(self, card_id):
+        self.cards_by_id = {}
+        self.card_ids_by_alt_id = {}
         for card in self.all_cards:
-            if card["card_id"] == card_id:
-                return deepcopy(card)
-        return None
+            # Keep the first definition if an id is somehow duplicated, same as the old linear scan.
+            self.cards_by_id.setdefault(card["card_id"], card)
+            if "alt_id" in card:
+                self.card_ids_by_alt_id.setdefault(card["alt_id"], []).append(card["card_id"])
+
+    def get_card_definition(self, card_id):
+        # Shared, read-only definition. Use get_card_by_id if the card will be modified.
+        return self.cards_by_id.get(card_id)
+
+    def get_card_ids_for_alt_id(self, alt_id):
+        return self.card_ids_by_alt_id.get(alt_id, [])
+
+    def get_card_by_id(self, card_id):
+        card = self.cards_by_id.get(card_id)
+        if card is None:
+            return None
+        return deepcopy(card)
 
     def validate_deck(self, oshi_id : str, deck : Dict[str, int], cheer_deck: Dict[str, int]):
 
         # Validate the oshi ID is an existing oshi.
-        oshi_card = self.get_card_by_id(oshi_id)
+        oshi_card = self.get_card_definition(oshi_id)
         if not oshi_card or oshi_card["card_type"] != "oshi":
             logger.info("--Deck Invalid: Oshi")
             return False
@@ -64,7 +144,7 @@ class CardDatabase:
         deck_count = 0
         alt_copies = {}
         for card_id, count in deck.items():
-            deck_card = self.get_card_by_id(card_id)
+            deck_card = self.get_card_definition(card_id)
             if not deck_card or deck_card["card_type"] not in ALLOWED_DECK_TYPES:
                 if not deck_card:
                     logger.info("--Deck Invalid: Card not found %s" % card_id)
@@ -85,9 +165,8 @@ class CardDatabase:
                 if alt_id in alt_copies:
                     card_copies = alt_copies[alt_id]
                 else:
-                    for key in deck.keys():
-                        if key.startswith(alt_id):
-                            card_copies += deck[key]
+                    for alt_card_id in self.get_card_ids_for_alt_id(alt_id):
+                        card_copies += deck.get(alt_card_id, 0)
                     alt_copies[alt_id] = card_copies
             else:
                 card_copies = count
@@ -106,7 +185,7 @@ class CardDatabase:
         cheer_deck_count = 0
         for card_id, count in cheer_deck.items():
             cheer_deck_count += count
-            cheer_deck_card = self.get_card_by_id(card_id)
+            cheer_deck_card = self.get_card_definition(card_id)
             if not cheer_deck_card or cheer_deck_card["card_type"] != "cheer":
                 logger.info("--Deck Invalid: Cheer deck wrong")
                 return False
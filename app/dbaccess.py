@@ -1,9 +1,14 @@
 import os
 import json
+import gzip
+import io
 import secrets
 import string
-import aiofiles
 import logging
+import queue
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -12,8 +17,23 @@ logger = logging.getLogger(__name__)
 # 로컬 파일 시스템 경로 설정
 LOCAL_DATA_DIR = "data"
 MATCH_LOGS_DIR = os.path.join(LOCAL_DATA_DIR, "match_logs")
+MATCH_INDEX_FILENAME = "match_index.sqlite3"
+# Matches are appended to a segment file until it reaches this size.
+MATCH_SEGMENT_MAX_BYTES = int(os.getenv("MATCH_SEGMENT_MAX_BYTES", str(64 * 1024 * 1024)))
 GAME_PACKAGE_DIR = os.path.join(LOCAL_DATA_DIR, "game_package")
 
+# Compact match logs are gzipped newline delimited json.
+MATCH_LOG_EXTENSION = ".ndjson.gz"
+MATCH_LOG_FORMAT = "holoduel-match-log"
+MATCH_LOG_FORMAT_VERSION = 1
+# Level 9 is noticeably slower for almost no gain on interned logs.
+MATCH_LOG_COMPRESS_LEVEL = 6
+# Strings this short aren't worth interning.
+MIN_INTERNED_STRING_LENGTH = 4
+
+# Match logs waiting to be written before new ones are dropped.
+MATCH_LOG_QUEUE_LIMIT = int(os.getenv("MATCH_LOG_QUEUE_LIMIT", "64"))
+
 def ensure_directories():
     """필요한 디렉토리들을 생성합니다."""
     os.makedirs(MATCH_LOGS_DIR, exist_ok=True)
@@ -23,26 +43,406 @@ def generate_short_alphanumeric_id(length=8):
     characters = string.ascii_letters + string.digits
     return ''.join(secrets.choice(characters) for _ in range(length))
 
-def upload_match_to_local_storage(match_data):
+def get_match_log_filename(match_data):
+    # 고유한 파일명 생성
+    uuid = generate_short_alphanumeric_id()
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"match_{timestamp}_{uuid}_{match_data['player_info'][0]['username']}_VS_{match_data['player_info'][1]['username']}{MATCH_LOG_EXTENSION}"
+
+def is_match_log_file(filename):
+    return filename.endswith(MATCH_LOG_EXTENSION) or filename.endswith(".json")
+
+SCALAR_TYPES = (int, bool, float, type(None))
+
+class MatchLogStreamWriter:
+    """Writes a match log one record per line, with repeated strings interned.
+
+    Interned strings are written as "@<base 36 index>" into a string table that is
+    written ahead of the record that first uses them. Real strings starting with "@"
+    are escaped as "@@". Dict keys that aren't strings become strings the way json does it.
+    """
+    def __init__(self, file):
+        self.file = file
+        self.string_ids = {}
+        self.new_strings = []
+        self.write_line({"format": MATCH_LOG_FORMAT, "version": MATCH_LOG_FORMAT_VERSION})
+
+    def write_line(self, record):
+        self.file.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
+        self.file.write("\n")
+
+    def encode_string(self, value):
+        if len(value) < MIN_INTERNED_STRING_LENGTH:
+            return "@" + value if value[:1] == "@" else value
+        encoded = self.string_ids.get(value)
+        if encoded is None:
+            encoded = "@" + encode_base36(len(self.string_ids))
+            self.string_ids[value] = encoded
+            self.new_strings.append(value)
+        return encoded
+
+    def encode_key(self, key):
+        if type(key) is not str:
+            if key is not None and not isinstance(key, (int, float)):
+                raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+            key = json.dumps(key)
+        return self.string_ids.get(key) or self.encode_string(key)
+
+    def encode(self, value):
+        value_type = type(value)
+        if value_type is str:
+            return self.string_ids.get(value) or self.encode_string(value)
+        if value_type is dict or isinstance(value, dict):
+            string_ids = self.string_ids
+            encode_key = self.encode_key
+            encode = self.encode
+            return {
+                string_ids.get(key) or encode_key(key): item if type(item) in SCALAR_TYPES else encode(item)
+                for key, item in value.items()
+            }
+        if value_type is list or isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        return value
+
+    def write_record(self, record_type, value):
+        encoded = self.encode(value)
+        if self.new_strings:
+            self.write_line({"s": self.new_strings})
+            self.new_strings = []
+        self.write_line({record_type: encoded})
+
+    def write_header(self, match_info):
+        self.write_record("h", match_info)
+
+    def write_event(self, event):
+        self.write_record("e", event)
+
+    def write_message(self, message):
+        self.write_record("m", message)
+
+    def write_match(self, match_data):
+        self.write_header({key: value for key, value in match_data.items() if key not in ("all_events", "all_game_messages")})
+        for event in match_data.get("all_events", []):
+            self.write_event(event)
+        for message in match_data.get("all_game_messages", []):
+            self.write_message(message)
+
+def encode_base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    if number == 0:
+        return "0"
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 36)
+        encoded = digits[remainder] + encoded
+    return encoded
+
+class MatchLogStreamReader:
+    """Reads a file written by MatchLogStreamWriter one record at a time."""
+    def __init__(self, file):
+        self.file = file
+        self.strings = []
+        header = json.loads(file.readline())
+        if header.get("format") != MATCH_LOG_FORMAT:
+            raise ValueError("Not a match log.")
+        if header.get("version", 0) > MATCH_LOG_FORMAT_VERSION:
+            raise ValueError(f"Unsupported match log version: {header.get('version')}")
+
+    def decode_string(self, value):
+        if value.startswith("@"):
+            if value.startswith("@@"):
+                return value[1:]
+            return self.strings[int(value[1:], 36)]
+        return value
+
+    def decode(self, value):
+        if isinstance(value, str):
+            return self.decode_string(value)
+        if isinstance(value, dict):
+            return {self.decode_string(key): self.decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        return value
+
+    def __iter__(self):
+        """Yields ("header" | "event" | "message", value) in file order."""
+        record_types = {"h": "header", "e": "event", "m": "message"}
+        for line in self.file:
+            record = json.loads(line)
+            if "s" in record:
+                self.strings.extend(record["s"])
+                continue
+            for record_type, value in record.items():
+                yield record_types[record_type], self.decode(value)
+
+def iter_match_log_records(file_path):
+    """Streams the records of a compact match log without loading the whole match."""
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        yield from MatchLogStreamReader(f)
+
+def match_data_from_records(records):
+    match_data = {}
+    all_events = []
+    all_game_messages = []
+    for record_type, value in records:
+        if record_type == "header":
+            match_data.update(value)
+        elif record_type == "event":
+            all_events.append(value)
+        else:
+            all_game_messages.append(value)
+    match_data["all_events"] = all_events
+    match_data["all_game_messages"] = all_game_messages
+    return match_data
+
+def read_match_log(file_path):
+    """Loads a match log in either the compact or the old json format, as the match_data dict."""
+    if not file_path.endswith(MATCH_LOG_EXTENSION):
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return match_data_from_records(iter_match_log_records(file_path))
+
+def compress_match_log(match_data):
+    # Each match is its own gzip member, so members can be appended to a segment and read back alone.
+    buffer = io.BytesIO()
+    with io.TextIOWrapper(gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=MATCH_LOG_COMPRESS_LEVEL), encoding="utf-8") as compressed:
+        MatchLogStreamWriter(compressed).write_match(match_data)
+    return buffer.getvalue()
+
+def decompress_match_log(data):
+    text = gzip.decompress(data).decode("utf-8")
+    return match_data_from_records(MatchLogStreamReader(io.StringIO(text)))
+
+def write_match_log(file_path, match_data):
+    with open(file_path, "wb") as f:
+        f.write(compress_match_log(match_data))
+        f.flush()
+        os.fsync(f.fileno())
+
+class MatchStore:
+    """Match logs appended into rolling segment files, with a SQLite index to find them.
+
+    The index has one row per match with where it lives in its segment, plus one row
+    per player so queries by username or oshi only touch matching rows.
+    """
+    def __init__(self, store_dir=None):
+        self.store_dir = store_dir
+        self.lock = threading.Lock()
+        self.connection = None
+
+    def get_store_dir(self):
+        return self.store_dir or MATCH_LOGS_DIR
+
+    def connect(self):
+        if self.connection is None:
+            os.makedirs(self.get_store_dir(), exist_ok=True)
+            self.connection = sqlite3.connect(os.path.join(self.get_store_dir(), MATCH_INDEX_FILENAME), check_same_thread=False)
+            self.connection.row_factory = sqlite3.Row
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS matches (
+                    match_id INTEGER PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    filename TEXT NOT NULL,
+                    queue_name TEXT,
+                    game_type TEXT,
+                    winner TEXT,
+                    turn_number INTEGER,
+                    segment TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS match_players (
+                    match_id INTEGER NOT NULL,
+                    username TEXT,
+                    oshi_id TEXT
+                );
+                CREATE INDEX IF NOT EXISTS matches_timestamp ON matches (timestamp);
+                CREATE INDEX IF NOT EXISTS matches_queue ON matches (queue_name, timestamp);
+                CREATE INDEX IF NOT EXISTS matches_winner ON matches (winner, timestamp);
+                CREATE INDEX IF NOT EXISTS match_players_username ON match_players (username);
+                CREATE INDEX IF NOT EXISTS match_players_oshi ON match_players (oshi_id);
+            """)
+        return self.connection
+
+    def get_current_segment(self, connection):
+        row = connection.execute("SELECT segment FROM matches ORDER BY match_id DESC LIMIT 1").fetchone()
+        segment = row["segment"] if row else "segment_000000.ndjson.gz"
+        segment_path = os.path.join(self.get_store_dir(), segment)
+        if os.path.exists(segment_path) and os.path.getsize(segment_path) >= MATCH_SEGMENT_MAX_BYTES:
+            segment = f"segment_{int(segment[len('segment_'):-len(MATCH_LOG_EXTENSION)]) + 1:06d}{MATCH_LOG_EXTENSION}"
+        return segment
+
+    def append(self, match_data, filename=None, timestamp=None):
+        """Appends one match to the current segment and indexes it. Returns the match id."""
+        if filename is None:
+            filename = get_match_log_filename(match_data)
+        if timestamp is None:
+            timestamp = time.time()
+        data = compress_match_log(match_data)
+        with self.lock:
+            connection = self.connect()
+            segment = self.get_current_segment(connection)
+            with open(os.path.join(self.get_store_dir(), segment), "ab") as f:
+                offset = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO matches (timestamp, filename, queue_name, game_type, winner, turn_number, segment, offset, length)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (timestamp, filename, match_data.get("queue_name"), match_data.get("game_type"), match_data.get("winner"),
+                     match_data.get("turn_number"), segment, offset, len(data)),
+                )
+                match_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT INTO match_players (match_id, username, oshi_id) VALUES (?, ?, ?)",
+                    [(match_id, player.get("username"), player.get("oshi_id")) for player in match_data.get("player_info", [])],
+                )
+        return match_id
+
+    def find_matches(self, start_time=None, end_time=None, queue_name=None, username=None, oshi_id=None, winner=None):
+        """Returns index rows for matches that fit every given filter, oldest first.
+
+        start_time and end_time are unix timestamps or datetimes. Naive datetimes are local time.
+        """
+        conditions = []
+        params = []
+        if start_time is not None:
+            conditions.append("timestamp >= ?")
+            params.append(to_timestamp(start_time))
+        if end_time is not None:
+            conditions.append("timestamp <= ?")
+            params.append(to_timestamp(end_time))
+        for column, value in (("queue_name", queue_name), ("winner", winner)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        for column, value in (("username", username), ("oshi_id", oshi_id)):
+            if value is not None:
+                conditions.append(f"match_id IN (SELECT match_id FROM match_players WHERE {column} = ?)")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.lock:
+            return self.connect().execute(f"SELECT * FROM matches{where} ORDER BY timestamp", params).fetchall()
+
+    def read_match_bytes(self, row):
+        with open(os.path.join(self.get_store_dir(), row["segment"]), "rb") as f:
+            f.seek(row["offset"])
+            return f.read(row["length"])
+
+    def read_match(self, row):
+        return decompress_match_log(self.read_match_bytes(row))
+
+    def close(self):
+        with self.lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+match_store = MatchStore()
+
+def to_timestamp(value):
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+def import_match_log_file(file_path, store=None, remove_original=False):
+    """Adds a loose .json or .ndjson.gz match log to the store, dated by its file time."""
+    store = store or match_store
+    match_data = read_match_log(file_path)
+    filename = os.path.basename(file_path)
+    if filename.endswith(".json"):
+        filename = filename[:-len(".json")] + MATCH_LOG_EXTENSION
+    match_id = store.append(match_data, filename, os.path.getmtime(file_path))
+    if remove_original:
+        os.remove(file_path)
+    return match_id
+
+def convert_json_match_log(json_path, output_path=None, remove_original=False):
+    """Rewrites an old json match log in the compact format and returns the new path."""
+    if output_path is None:
+        output_path = json_path[:-len(".json")] + MATCH_LOG_EXTENSION
+    with open(json_path, "r", encoding="utf-8") as f:
+        match_data = json.load(f)
+    write_match_log(output_path, match_data)
+    # Keep the original file time so date range queries still find it.
+    stat = os.stat(json_path)
+    os.utime(output_path, (stat.st_atime, stat.st_mtime))
+    if remove_original:
+        os.remove(json_path)
+    return output_path
+
+def upload_match_to_local_storage(match_data, filename=None, timestamp=None):
     """매치 데이터를 로컬 파일 시스템에 저장합니다."""
     try:
         ensure_directories()
-        
-        # 고유한 파일명 생성
-        uuid = generate_short_alphanumeric_id()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"match_{timestamp}_{uuid}_{match_data['player_info'][0]['username']}_VS_{match_data['player_info'][1]['username']}.json"
-        file_path = os.path.join(MATCH_LOGS_DIR, filename)
-        
-        # 매치 데이터를 JSON 파일로 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(match_data, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Match data saved to local storage: {file_path}")
-        
+
+        match_id = match_store.append(match_data, filename, timestamp)
+
+        logger.info(f"Match data saved to local storage: match {match_id}")
+
     except Exception as e:
         logger.error(f"Error saving match data to local storage: {e}")
 
+class MatchLogWriter:
+    """Writes match logs on a background thread so game over handling never waits on disk."""
+    def __init__(self, max_pending=MATCH_LOG_QUEUE_LIMIT):
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.written_count = 0
+        self.dropped_count = 0
+
+    def submit(self, match_data):
+        # The filename and time are picked now so they are the time the match ended.
+        # The engine can still add events (emotes, observers) after game over, so the
+        # writer gets its own copy of the lists to serialize.
+        match_data = dict(match_data)
+        for key in ["all_events", "all_game_messages"]:
+            if key in match_data:
+                match_data[key] = list(match_data[key])
+        self.start()
+        try:
+            self.pending.put_nowait((get_match_log_filename(match_data), time.time(), match_data))
+        except queue.Full:
+            self.dropped_count += 1
+            logger.error(f"Match log queue full ({self.pending.maxsize}), dropping match log. Dropped so far: {self.dropped_count}")
+
+    def get_metrics(self):
+        return {
+            "written": self.written_count,
+            "dropped": self.dropped_count,
+            "pending": self.pending.qsize(),
+        }
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="MatchLogWriter", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            filename, timestamp, match_data = item
+            upload_match_to_local_storage(match_data, filename, timestamp)
+            self.written_count += 1
+
+    def stop(self, timeout=None):
+        """Writes everything still queued, then stops the thread."""
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread is None:
+            return
+        self.pending.put(None)
+        thread.join(timeout)
+
+match_log_writer = MatchLogWriter()
+
 def is_game_package_available(game_dir=None):
     """게임 패키지 디렉토리에 HTML 파일이 존재하는지 확인합니다."""
     if game_dir is None:
@@ -59,30 +459,27 @@ def download_match_logs_between_dates(start_date, end_date, download_path):
         if not os.path.exists(download_path):
             os.makedirs(download_path)
         
-        # 매치 로그 디렉토리의 모든 파일 검사
-        if not os.path.exists(MATCH_LOGS_DIR):
-            logger.warning(f"Match logs directory not found: {MATCH_LOGS_DIR}")
-            return
-        
-        for filename in os.listdir(MATCH_LOGS_DIR):
-            if filename.endswith('.json'):
-                file_path = os.path.join(MATCH_LOGS_DIR, filename)
-                file_modified_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                
-                # 날짜 범위 확인
-                if start_date <= file_modified_time <= end_date:
-                    destination_path = os.path.join(download_path, filename)
-                    import shutil
-                    shutil.copy2(file_path, destination_path)
-                    logger.info(f"Downloaded match log: {filename}")
-        
+        # 인덱스에서 날짜 범위의 매치만 찾습니다.
+        for row in match_store.find_matches(start_time=start_date, end_time=end_date):
+            destination_path = os.path.join(download_path, row["filename"])
+            with open(destination_path, "wb") as f:
+                f.write(match_store.read_match_bytes(row))
+            os.utime(destination_path, (row["timestamp"], row["timestamp"]))
+            logger.info(f"Downloaded match log: {row['filename']}")
+
         logger.info("Match logs download complete.")
         
     except Exception as e:
         logger.error(f"Error downloading match logs: {e}")
 
 def upload_match_to_blob_storage(match_data):
-    upload_match_to_local_storage(match_data)
+    match_log_writer.submit(match_data)
+
+def flush_match_logs():
+    match_log_writer.stop()
+
+def get_match_log_metrics():
+    return match_log_writer.get_metrics()
 
 def download_blobs_between_dates(start_date, end_date, download_path):
     download_match_logs_between_dates(start_date, end_date, download_path)
\ No newline at end of file
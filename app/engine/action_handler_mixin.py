@@ -144,6 +144,8 @@ class ActionHandlerMixin:
             })
             if not self.is_game_over():
                 self.end_game(player_id, GameOverReason.GameOverReason_Resign)
+        if self.debug_card_index:
+            self.check_card_indexes()
         if not handled:
             # Put out a warning log line with the action that was sent.
             logger.error(f"Game Message: Player({username}) - {player_id} Action {action_type} was not handled: {action_data}.")
@@ -602,23 +604,24 @@ class ActionHandlerMixin:
         action_effects = player.get_oshi_action_effects(skill_id)
         add_ids_to_effects(action_effects, player_id, player.oshi_card["game_card_id"])
 
-        def after_oshi_effects():
-            gift_timing = "on_sp_oshi_skill" if skill_limit == "once_per_game" else "on_oshi_skill"
-            gift_effects = []
-            for holomem in player.get_holomem_on_stage():
-                if "gift_effects" in holomem:
-                    effects = filter_effects_at_timing(holomem["gift_effects"], gift_timing)
-                    add_ids_to_effects(effects, player_id, holomem["game_card_id"])
-                    gift_effects.extend(effects)
-            if gift_effects:
-                self.begin_resolving_effects(gift_effects, continuation)
-                return
-            continuation()
-
-        self.begin_resolving_effects(action_effects, after_oshi_effects)
+        self.begin_resolving_effects(action_effects, Continuation(self, "after_oshi_skill_effects", player, skill_limit, continuation))
 
         return True
 
+    @continuation_step
+    def after_oshi_skill_effects(self, player, skill_limit, continuation):
+        gift_timing = "on_sp_oshi_skill" if skill_limit == "once_per_game" else "on_oshi_skill"
+        gift_effects = []
+        for holomem in player.get_holomem_on_stage():
+            if "gift_effects" in holomem:
+                effects = filter_effects_at_timing(holomem["gift_effects"], gift_timing)
+                add_ids_to_effects(effects, player.player_id, holomem["game_card_id"])
+                gift_effects.extend(effects)
+        if gift_effects:
+            self.begin_resolving_effects(gift_effects, continuation)
+            return
+        continuation()
+
     def validate_main_step_play_support(self, player_id:str, action_data:dict):
         if not self.validate_decision_base(player_id, action_data, DecisionType.DecisionMainStep, GameAction.MainStepPlaySupportFields):
             return False
@@ -717,16 +720,18 @@ class ActionHandlerMixin:
         card_effects = card["effects"]
         add_ids_to_effects(card_effects, player.player_id, card_id)
         self.floating_cards.append(card)
+        player.index_card(card, "floating", position=len(self.floating_cards) - 1)
         
-        # Create a new continuation that clears stage_selected_holomems after the card effect is complete
-        def card_completion_continuation():
-            self.stage_selected_holomems = []
-            continuation()
-        
-        self.begin_resolving_effects(card_effects, card_completion_continuation, [card])
+        # Clear stage_selected_holomems after the card effect is complete
+        self.begin_resolving_effects(card_effects, Continuation(self, "complete_support_card", continuation), [card])
 
         return True
 
+    @continuation_step
+    def complete_support_card(self, continuation):
+        self.stage_selected_holomems = []
+        continuation()
+
     def validate_main_step_baton_pass(self, player_id:str, action_data:dict):
         if not self.validate_decision_base(player_id, action_data, DecisionType.DecisionMainStep, GameAction.MainStepBatonPassFields):
             return False
@@ -745,23 +750,7 @@ class ActionHandlerMixin:
         # Validate that there is enough cheer in the cheer ids and the cheer are all on the center.
         player = self.get_player(player_id)
         center_mem = player.center[0]
-        baton_cost = center_mem["baton_cost"]
-        # Apply baton cost reductions (same logic as determine_available_actions)
-        reduce_cost_effects = player.get_effects_at_timing("on_baton_cost_check", center_mem, "")
-        for effect in reduce_cost_effects:
-            if effect["effect_type"] == EffectType.EffectType_ReduceBatonCost:
-                conditions = effect.get("conditions", [])
-                target_matches = True
-                for cond in conditions:
-                    if cond.get("condition") == "this_card_is_target":
-                        required_id = cond.get("required_id", "")
-                        if required_id != center_mem["game_card_id"]:
-                            target_matches = False
-                            break
-                if not target_matches:
-                    continue
-                reduction_amount = effect.get("amount", 0)
-                baton_cost = max(0, baton_cost - reduction_amount)
+        baton_cost = self.get_baton_cost(player, center_mem)
         if len(cheer_ids) < baton_cost:
             self.send_event(self.make_error_event(player_id, "invalid_cheer", "Not enough cheer to pass the baton."))
             return False
@@ -1551,11 +1540,13 @@ class ActionHandlerMixin:
         # Use player.bloom() in order to "bloom" the debut over this card.
         # This will keep all the cheer in place conveniently.
         if debut["game_card_id"] != card_id:
-            effect_player.bloom(debut["game_card_id"], card_id, lambda :
-                # Finally, move the debut card back to original target card back to hand
-                # since it got stacked as part of the bloom.
-                effect_player.move_card(card_id, "hand")
-            )
+            # Finally, move the debut card back to original target card back to hand
+            # since it got stacked as part of the bloom.
+            effect_player.bloom(debut["game_card_id"], card_id, Continuation(self, "move_card_to_hand", effect_player, card_id))
+
+    @continuation_step
+    def move_card_to_hand(self, player, card_id):
+        player.move_card(card_id, "hand")
 
     def handle_choose_cards_result(self, decision_info_copy, performing_player_id:str, card_ids:List[str], continuation):
         from_zone = decision_info_copy["from_zone"]
@@ -1603,41 +1594,26 @@ class ActionHandlerMixin:
             to_exclude_performer = decision_info_copy.get("to_exclude_performer", False)
             exclude_card_id = source_card_id if to_exclude_performer else ""
 
+            attach_limitations = {
+                "to_limitation": to_limitation,
+                "to_limitation_colors": to_limitation_colors,
+                "to_limitation_tags": to_limitation_tags,
+                "to_limitation_name": to_limitation_name,
+                "exclude_card_id": exclude_card_id,
+                "attach_to_card_id": source_card_id,
+            }
+            # Finish the cleanup of the remaining cards.
+            cleanup_continuation = Continuation(self, "choose_cards_cleanup_remaining", performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
             if attach_each_separately and len(card_ids) > 1:
                 # Attach each card separately to potentially different holomems
-                def attach_cards_sequentially(remaining_cards_to_attach):
-                    if len(remaining_cards_to_attach) == 0:
-                        self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
-                        return
-                    current_card_id = remaining_cards_to_attach[0]
-                    next_cards = remaining_cards_to_attach[1:]
-                    attach_effect = {
-                        "effect_type": EffectType.EffectType_AttachCardToHolomem,
-                        "source_card_id": current_card_id,
-                        "to_limitation": to_limitation,
-                        "to_limitation_colors": to_limitation_colors,
-                        "to_limitation_tags": to_limitation_tags,
-                        "to_limitation_name": to_limitation_name,
-                        "exclude_card_id": exclude_card_id,
-                        "attach_to_card_id": source_card_id,
-                        "continuation": lambda nc=next_cards: attach_cards_sequentially(nc),
-                    }
-                    self.do_effect(player, attach_effect)
-                attach_cards_sequentially(card_ids)
+                self.attach_chosen_cards_sequentially(player, card_ids, attach_limitations, cleanup_continuation)
             else:
                 # Original behavior: attach single card
                 attach_effect = {
                     "effect_type": EffectType.EffectType_AttachCardToHolomem,
                     "source_card_id": card_ids[0],
-                    "to_limitation": to_limitation,
-                    "to_limitation_colors": to_limitation_colors,
-                    "to_limitation_tags": to_limitation_tags,
-                    "to_limitation_name": to_limitation_name,
-                    "exclude_card_id": exclude_card_id,
-                    "attach_to_card_id": source_card_id,
-                    "continuation": lambda :
-                        # Finish the cleanup of the remaining cards.
-                        self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation),
+                    **attach_limitations,
+                    "continuation": cleanup_continuation,
                 }
                 self.do_effect(player, attach_effect)
         elif from_zone == "stage" and to_zone == "stage":
@@ -1701,8 +1677,7 @@ class ActionHandlerMixin:
                         "min_choice": 0,
                         "max_choice": len(choice) - 1,
                         "resolution_func": self.handle_choice_effects,
-                        "continuation": lambda :
-                            self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
+                        "continuation": Continuation(self, "choose_cards_cleanup_remaining", performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation),
                     })
         elif to_zone == "bottom_of_deck":
             stage_zones = {"center", "collab", "backstage"}
@@ -1727,50 +1702,13 @@ class ActionHandlerMixin:
 
                 for sh in stacked_holomems_extracted:
                     self.floating_cards.append(sh)
+                    player.index_card(sh, "floating", position=len(self.floating_cards) - 1)
                     cards_for_ordering.append(sh["game_card_id"])
 
-            def after_return_timing():
-                if (include_stacked or order_chosen) and len(cards_for_ordering) > 1:
-                    order_cards_event = {
-                        "event_type": EventType.EventType_Decision_OrderCards,
-                        "desired_response": GameAction.EffectResolution_OrderCards,
-                        "effect_player_id": performing_player_id,
-                        "card_ids": cards_for_ordering,
-                        "from": from_zone,
-                        "to_zone": "deck",
-                        "bottom": True,
-                        "hidden_info_player": performing_player_id,
-                        "hidden_info_fields": ["card_ids"],
-                    }
-                    self.broadcast_event(order_cards_event)
-                    self.set_decision({
-                        "decision_type": DecisionType.DecisionEffect_OrderCards,
-                        "decision_player": performing_player_id,
-                        "card_ids": cards_for_ordering,
-                        "from": from_zone,
-                        "to_zone": "deck",
-                        "bottom": True,
-                        "resolution_func": self.handle_effect_resolution_order_cards,
-                        "continuation": lambda:
-                            self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation),
-                    })
-                else:
-                    self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
-
+            cleanup_continuation = Continuation(self, "choose_cards_cleanup_remaining", performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
+            after_return_timing = Continuation(self, "order_cards_returned_to_deck_bottom", performing_player_id, cards_for_ordering, from_zone, include_stacked or order_chosen, cleanup_continuation)
             if returned_holomem_cards:
-                def fire_return_timing(remaining_cards, final_continuation):
-                    if not remaining_cards:
-                        final_continuation()
-                        return
-                    returned_card = remaining_cards[0]
-                    self.returned_to_deck_card = returned_card
-                    timing_effects = player.get_effects_at_timing("on_holomem_return_to_deck", returned_card)
-                    def after_timing():
-                        self.returned_to_deck_card = None
-                        fire_return_timing(remaining_cards[1:], final_continuation)
-                    self.begin_resolving_effects(timing_effects, after_timing)
-
-                fire_return_timing(returned_holomem_cards, after_return_timing)
+                self.fire_return_to_deck_timing(player, returned_holomem_cards, after_return_timing)
             else:
                 after_return_timing()
         elif to_zone == "cheer_deck_bottom":
@@ -1784,6 +1722,62 @@ class ActionHandlerMixin:
                 player.shuffle_deck()
             self.choose_cards_cleanup_remaining(performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, from_zone, continuation)
 
+    @continuation_step
+    def attach_chosen_cards_sequentially(self, player, remaining_cards_to_attach, attach_limitations, continuation):
+        if len(remaining_cards_to_attach) == 0:
+            continuation()
+            return
+        attach_effect = {
+            "effect_type": EffectType.EffectType_AttachCardToHolomem,
+            "source_card_id": remaining_cards_to_attach[0],
+            **attach_limitations,
+            "continuation": Continuation(self, "attach_chosen_cards_sequentially", player, remaining_cards_to_attach[1:], attach_limitations, continuation),
+        }
+        self.do_effect(player, attach_effect)
+
+    @continuation_step
+    def order_cards_returned_to_deck_bottom(self, performing_player_id, cards_for_ordering, from_zone, choose_order, continuation):
+        if choose_order and len(cards_for_ordering) > 1:
+            order_cards_event = {
+                "event_type": EventType.EventType_Decision_OrderCards,
+                "desired_response": GameAction.EffectResolution_OrderCards,
+                "effect_player_id": performing_player_id,
+                "card_ids": cards_for_ordering,
+                "from": from_zone,
+                "to_zone": "deck",
+                "bottom": True,
+                "hidden_info_player": performing_player_id,
+                "hidden_info_fields": ["card_ids"],
+            }
+            self.broadcast_event(order_cards_event)
+            self.set_decision({
+                "decision_type": DecisionType.DecisionEffect_OrderCards,
+                "decision_player": performing_player_id,
+                "card_ids": cards_for_ordering,
+                "from": from_zone,
+                "to_zone": "deck",
+                "bottom": True,
+                "resolution_func": self.handle_effect_resolution_order_cards,
+                "continuation": continuation,
+            })
+        else:
+            continuation()
+
+    def fire_return_to_deck_timing(self, player, remaining_cards, final_continuation):
+        if not remaining_cards:
+            final_continuation()
+            return
+        returned_card = remaining_cards[0]
+        self.returned_to_deck_card = returned_card
+        timing_effects = player.get_effects_at_timing("on_holomem_return_to_deck", returned_card)
+        self.begin_resolving_effects(timing_effects, Continuation(self, "after_return_to_deck_timing", player, remaining_cards, final_continuation))
+
+    @continuation_step
+    def after_return_to_deck_timing(self, player, remaining_cards, final_continuation):
+        self.returned_to_deck_card = None
+        self.fire_return_to_deck_timing(player, remaining_cards[1:], final_continuation)
+
+    @continuation_step
     def choose_cards_cleanup_remaining(self, performing_player_id, remaining_card_ids, remaining_cards_action, from_zone, to_zone, continuation):
         player = self.get_player(performing_player_id)
         # Deal with unchosen cards.
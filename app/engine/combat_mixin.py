@@ -104,17 +104,19 @@ class CombatMixin:
         center_card = target_player.center[0] if target_player.center else None
         collab_card = target_player.collab[0] if target_player.collab else None
 
-        def deal_to_collab():
-            if collab_card and collab_card in target_player.get_holomem_on_stage():
-                self.deal_damage(dealing_player, target_player, self.performance_performer_card, collab_card, damage, special, False, art_info, continuation)
-            else:
-                continuation()
-
+        deal_to_collab = Continuation(self, "deal_damage_to_collab", dealing_player, target_player, collab_card, damage, special, art_info, continuation)
         if center_card:
             self.deal_damage(dealing_player, target_player, self.performance_performer_card, center_card, damage, special, False, art_info, deal_to_collab)
         else:
             deal_to_collab()
 
+    @continuation_step
+    def deal_damage_to_collab(self, dealing_player, target_player, collab_card, damage, special, art_info, continuation):
+        if collab_card and collab_card in target_player.get_holomem_on_stage():
+            self.deal_damage(dealing_player, target_player, self.performance_performer_card, collab_card, damage, special, False, art_info, continuation)
+        else:
+            continuation()
+
     def process_life_lost(self, life_lost: int, life_to_distribute: list, target_player: PlayerState, game_over: bool, game_over_reason: str, continuation):
         logger.debug(f"process_life_lost: life_lost={life_lost} game_over={game_over} game_over_reason={game_over_reason} life_to_distribute_count={len(life_to_distribute)}")
         if game_over:
@@ -193,8 +195,8 @@ class CombatMixin:
             # Check if the card is still on stage - if so, trigger death processing
             if target_card in target_player.get_holomem_on_stage():
                 # Card should be dead but wasn't processed - trigger death now
-                self.begin_down_holomem(dealing_player, target_player, dealing_card, target_card, art_info, lambda:
-                    self.complete_deal_damage(dealing_player, target_player, dealing_card, target_card, 0, special, prevent_life_loss, True, art_info, continuation))
+                self.begin_down_holomem(dealing_player, target_player, dealing_card, target_card, art_info,
+                    Continuation(self, "complete_deal_damage", dealing_player, target_player, dealing_card, target_card, 0, special, prevent_life_loss, True, art_info, continuation))
                 return
             # Already processed (in archive), just call continuation
             continuation()
@@ -222,8 +224,8 @@ class CombatMixin:
         on_deal_damage_effects = dealing_player.get_effects_at_timing("on_deal_damage", dealing_card)
         on_damage_effects = target_player.get_effects_at_timing("on_take_damage", target_card)
         all_damage_effects = on_deal_damage_effects + on_damage_effects
-        self.begin_resolving_effects(all_damage_effects, lambda :
-            self.continue_deal_damage(dealing_player, target_player, dealing_card, target_card, damage, special, prevent_life_loss, art_info, continuation)
+        self.begin_resolving_effects(all_damage_effects,
+            Continuation(self, "continue_deal_damage", dealing_player, target_player, dealing_card, target_card, damage, special, prevent_life_loss, art_info, continuation)
         )
 
     def restore_holomem_hp(self, target_player : PlayerState, target_card_id, amount, continuation):
@@ -237,6 +239,7 @@ class CombatMixin:
         else:
             continuation()
 
+    @continuation_step
     def continue_deal_damage(self, dealing_player : PlayerState, target_player : PlayerState, dealing_card, target_card, damage, special, prevent_life_loss, art_info, continuation):
         if self.take_damage_state.added_damage:
             target_card["damage"] += self.take_damage_state.added_damage
@@ -271,19 +274,21 @@ class CombatMixin:
 
         died = actual_target["damage"] >= actual_target_player.get_card_hp(actual_target)
         if died:
-            self.begin_down_holomem(dealing_player, actual_target_player, dealing_card, actual_target, art_info, lambda :
-                self.complete_deal_damage(dealing_player, actual_target_player, dealing_card, actual_target, damage, special, prevent_life_loss, died, art_info, continuation))
+            self.begin_down_holomem(dealing_player, actual_target_player, dealing_card, actual_target, art_info,
+                Continuation(self, "complete_deal_damage", dealing_player, actual_target_player, dealing_card, actual_target, damage, special, prevent_life_loss, died, art_info, continuation))
         else:
             self.complete_deal_damage(dealing_player, actual_target_player, dealing_card, actual_target, damage, special, prevent_life_loss, died, art_info, continuation)
 
+    @continuation_step
     def complete_deal_damage(self, dealing_player : PlayerState, target_player : PlayerState, dealing_card, target_card, damage, special, prevent_life_loss, died, art_info, continuation):
         if died:
-            self.process_downed_holomem(target_player, target_card, prevent_life_loss, lambda :
-                self.begin_after_deal_damage(dealing_player, target_player, dealing_card, target_card, damage, special, art_info, continuation)
+            self.process_downed_holomem(target_player, target_card, prevent_life_loss,
+                Continuation(self, "begin_after_deal_damage", dealing_player, target_player, dealing_card, target_card, damage, special, art_info, continuation)
             )
         else:
             self.begin_after_deal_damage(dealing_player, target_player, dealing_card, target_card, damage, special, art_info, continuation)
 
+    @continuation_step
     def begin_after_deal_damage(self, dealing_player : PlayerState, target_player : PlayerState, dealing_card, target_card, damage, special, art_info, continuation):
         logger.debug(f"begin_after_deal_damage: target={target_card['game_card_id']} damage={damage} target_on_stage={target_card in target_player.get_holomem_on_stage()}")
         after_effects = []
@@ -306,10 +311,9 @@ class CombatMixin:
         self.after_damage_state.target_card_zone = target_player.get_holomem_zone(target_card)
         self.after_damage_state.target_still_on_stage = target_card in target_player.get_holomem_on_stage()
 
-        self.begin_resolving_effects(after_effects, lambda :
-            self.complete_after_deal_damage(continuation)
-        )
+        self.begin_resolving_effects(after_effects, Continuation(self, "complete_after_deal_damage", continuation))
 
+    @continuation_step
     def complete_after_deal_damage(self, continuation):
         self.after_damage_state = self.after_damage_state.nested_state
         continuation()
@@ -341,16 +345,18 @@ class CombatMixin:
         }
         self.broadcast_event(pre_down_event)
 
-        def resolve_target_effects():
-            self.begin_resolving_effects(target_player_effects, continuation, simultaneous_choice=True)
+        self.begin_resolving_effects(dealing_player_effects, Continuation(self, "resolve_down_target_effects", target_player_effects, continuation), simultaneous_choice=True)
 
-        self.begin_resolving_effects(dealing_player_effects, resolve_target_effects, simultaneous_choice=True)
+    @continuation_step
+    def resolve_down_target_effects(self, target_player_effects, continuation):
+        self.begin_resolving_effects(target_player_effects, continuation, simultaneous_choice=True)
 
     def down_holomem(self, dealing_player : PlayerState, target_player : PlayerState, dealing_card, target_card, prevent_life_loss, continuation):
-        self.begin_down_holomem(dealing_player, target_player, dealing_card, target_card, [], lambda :
-            self.process_downed_holomem(target_player, target_card, prevent_life_loss, continuation)
+        self.begin_down_holomem(dealing_player, target_player, dealing_card, target_card, [],
+            Continuation(self, "process_downed_holomem", target_player, target_card, prevent_life_loss, continuation)
         )
 
+    @continuation_step
     def process_downed_holomem(self, target_player : PlayerState, target_card, prevent_life_loss, continuation):
         logger.debug(f"process_downed_holomem: target={target_card['game_card_id']} prevent_life_loss={prevent_life_loss}")
         self.down_holomem_state = self.down_holomem_state.nested_state
@@ -16,14 +16,16 @@ class EffectMixin:
             # There is already an effects resolution going down.
             # The current resolution will continue after this one.
             outer_resolution_state = self.effect_resolution_state
-            def new_continuation():
-                # Reset the previous effect resolution state before calling the continuation.
-                self.effect_resolution_state = outer_resolution_state
-                continuation()
-            effect_continuation = new_continuation
+            effect_continuation = Continuation(self, "resume_outer_resolution", outer_resolution_state, continuation)
         self.effect_resolution_state = EffectResolutionState(effects, effect_continuation, cards_to_cleanup, simultaneous_choice)
         self.continue_resolving_effects()
 
+    @continuation_step
+    def resume_outer_resolution(self, outer_resolution_state, continuation):
+        # Reset the previous effect resolution state before calling the continuation.
+        self.effect_resolution_state = outer_resolution_state
+        continuation()
+
     def continue_resolving_effects(self):
         if not self.effect_resolution_state.effects_to_resolve:
             for cleanup_card in self.effect_resolution_state.cards_to_cleanup:
@@ -32,6 +34,7 @@ class EffectMixin:
                     self.floating_cards.remove(cleanup_card)
                     owner = self.get_player(cleanup_card["owner_id"])
                     owner.archive.insert(0, cleanup_card)
+                    owner.index_card(cleanup_card, "archive", position=0)
                     cleanup_event = {
                         "event_type": EventType.EventType_MoveCard,
                         "moving_player_id": owner.player_id,
@@ -228,12 +228,7 @@ def handle_archive_this_attachment(engine, effect_player, effect):
 
     before_effects = effect_player.get_effects_at_timing("before_archive_attachment", attachment_card, "") if attachment_card else []
     if before_effects:
-        def archive_continuation():
-            if not engine.archive_attachment_replaced:
-                effect_player.archive_attached_cards([attachment_id])
-            engine.archiving_attachment_card = None
-            engine.archiving_attachment_holomem = None
-        engine.begin_resolving_effects(before_effects, archive_continuation)
+        engine.begin_resolving_effects(before_effects, Continuation(engine, "finish_archive_this_attachment", effect_player, attachment_id))
         return True
 
     effect_player.archive_attached_cards([attachment_id])
@@ -242,6 +237,14 @@ def handle_archive_this_attachment(engine, effect_player, effect):
     return False
 
 
+@continuation_step
+def finish_archive_this_attachment(engine, effect_player, attachment_id):
+    if not engine.archive_attachment_replaced:
+        effect_player.archive_attached_cards([attachment_id])
+    engine.archiving_attachment_card = None
+    engine.archiving_attachment_holomem = None
+
+
 def handle_replace_archive_with_move(engine, effect_player, effect):
     """Replaces an about-to-be-archived attachment by moving it to a different holomem instead."""
     if not engine.archiving_attachment_card:
@@ -379,13 +382,19 @@ def handle_archive_stacked_holomem(engine, effect_player, effect):
             "cards_can_choose": candidates,
             "amount_min": 1,
             "amount_max": 1,
-            "effect_resolution": lambda engine, ids: effect_player.archive_attached_cards(ids),
+            "effect_resolution": Continuation(engine, "archive_chosen_stacked_holomem", effect_player),
             "continuation": engine.continue_resolving_effects,
         })
         return True
     return False
 
 
+@continuation_step
+def archive_chosen_stacked_holomem(engine, effect_player, decision_info_copy, performing_player_id, card_ids, continuation):
+    effect_player.archive_attached_cards(card_ids)
+    continuation()
+
+
 def handle_attach_card_to_holomem(engine, effect_player, effect):
     """Returns True if continuation was passed on, False otherwise."""
     effect_player_id = effect_player.player_id
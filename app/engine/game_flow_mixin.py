@@ -85,8 +85,8 @@ class GameFlowMixin:
         self.phase = GamePhase.Mulligan
         self.handle_mulligan_phase()
 
-    def get_observer_catchup_events(self):
-        observer_events = [{
+    def get_observer_start_event(self):
+        return {
             "event_player_id": "observer",
             "event_type": EventType.EventType_GameStartInfo,
             "event_number": -1,
@@ -96,30 +96,47 @@ class GameFlowMixin:
             "your_username": self.player_states[0].username,
             "opponent_username": self.player_states[1].username,
             "game_card_map": self.all_game_cards_map,
-        }]
-        for i in range(len(self.all_events)):
-            event = self.all_events[i]
-            observer_events.append(self.create_observer_event(event))
+        }
+
+    def get_observer_catchup_event_count(self):
+        # The game start info event followed by every observer event so far.
+        return 1 + len(self.observer_event_log)
+
+    def get_observer_catchup_events(self, starting_index = 0, count = None):
+        # Index 0 is the game start info, index i is observer_event_log[i - 1].
+        ending_index = self.get_observer_catchup_event_count() if count is None else starting_index + count
+        observer_events = []
+        if starting_index <= 0 < ending_index:
+            observer_events.append(self.get_observer_start_event())
+        log_start = max(starting_index - 1, 0)
+        log_end = max(ending_index - 1, 0)
+        observer_events.extend(self.observer_event_log[log_start:log_end])
         return observer_events
 
-    def create_observer_event(self, event):
-        event_copy = event.copy()
-        event_copy["event_player_id"] = "observer"
-        event_copy["your_clock_used"] = self.player_states[0].clock_time_used
-        event_copy["opponent_clock_used"] = self.player_states[1].clock_time_used
-        # Always sanitize.
+    def sanitize_event(self, event):
+        # Returns a copy with the hidden info removed, or the event itself if nothing is hidden.
         hidden_fields = event.get("hidden_info_fields", [])
+        if not hidden_fields:
+            return event
         hidden_erase = event.get("hidden_info_erase", [])
+        sanitized_event = event.copy()
         for field in hidden_fields:
             if field in hidden_erase:
-                event_copy[field] = None
+                sanitized_event[field] = None
             else:
                 # If the field is a single id, replace it.
                 # If it is a list, replace them all.
-                if isinstance(event_copy[field], str):
-                    event_copy[field] = UNKNOWN_CARD_ID
-                elif isinstance(event_copy[field], list):
-                    event_copy[field] = [UNKNOWN_CARD_ID] * len(event_copy[field])
+                if isinstance(sanitized_event[field], str):
+                    sanitized_event[field] = UNKNOWN_CARD_ID
+                elif isinstance(sanitized_event[field], list):
+                    sanitized_event[field] = [UNKNOWN_CARD_ID] * len(sanitized_event[field])
+        return sanitized_event
+
+    def create_observer_event(self, sanitized_event):
+        event_copy = sanitized_event.copy()
+        event_copy["event_player_id"] = "observer"
+        event_copy["your_clock_used"] = self.player_states[0].clock_time_used
+        event_copy["opponent_clock_used"] = self.player_states[1].clock_time_used
         return event_copy
 
     def handle_mulligan_phase(self):
@@ -148,34 +165,43 @@ class GameFlowMixin:
         self.latest_events.append(event)
 
     def broadcast_event(self, event):
+        if self.headless:
+            self.send_headless_decision_event(event)
+            return
         event["event_number"] = len(self.all_events)
         event["last_game_message_number"] = len(self.all_game_messages) - 1
-        self.latest_observer_events.append(self.create_observer_event(event))
+        # Sanitize once and share the result between every audience that can't see the hidden info.
+        sanitized_event = self.sanitize_event(event)
+        observer_event = self.create_observer_event(sanitized_event)
+        self.latest_observer_events.append(observer_event)
+        self.observer_event_log.append(observer_event)
         self.all_events.append(event)
-        hidden_fields = event.get("hidden_info_fields", [])
-        hidden_erase = event.get("hidden_info_erase", [])
+        hidden_info_player = event.get("hidden_info_player")
         for player_state in self.player_states:
-            should_sanitize = not (player_state.player_id == event.get("hidden_info_player"))
+            audience_event = event if player_state.player_id == hidden_info_player else sanitized_event
             new_event = {
                 "event_player_id": player_state.player_id,
-                **event,
+                **audience_event,
                 "your_clock_used": player_state.clock_time_used,
                 "opponent_clock_used": self.other_player(player_state.player_id).clock_time_used,
             }
-            if should_sanitize:
-                for field in hidden_fields:
-                    if field in hidden_erase:
-                        new_event[field] = None
-                    else:
-                        # If the field is a single id, replace it.
-                        # If it is a list, replace them all.
-                        if isinstance(new_event[field], str):
-                            new_event[field] = UNKNOWN_CARD_ID
-                        elif isinstance(new_event[field], list):
-                            new_event[field] = [UNKNOWN_CARD_ID] * len(new_event[field])
             self.latest_events.append(new_event)
 
+    def send_headless_decision_event(self, event):
+        # Headless games keep no history and only tell the acting player what to decide.
+        if "desired_response" not in event:
+            return
+        acting_player_id = event.get("effect_player_id", event.get("active_player"))
+        audience_event = event if event.get("hidden_info_player") == acting_player_id else self.sanitize_event(event)
+        self.latest_events.append({
+            "event_player_id": acting_player_id,
+            **audience_event,
+        })
+
     def broadcast_bonus_hp_updates(self):
+        if self.headless:
+            # Only clients show bonus hp, the engine works it out when it needs it.
+            return
         for player in self.player_states:
             updates = {}
             for card in player.get_holomem_on_stage():
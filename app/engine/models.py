@@ -1,10 +1,142 @@
 from __future__ import annotations
 from typing import List, Dict, Any, TYPE_CHECKING
+from collections.abc import Mapping, MutableMapping
 from copy import deepcopy
+from random import Random
+from types import MethodType
+
+from app.card_database import FrozenDict, FrozenList
 
 if TYPE_CHECKING:
     from app.engine.player_state import PlayerState
 
+# Definition fields that the engine only ever reads, so every instance can share them.
+SHARED_DEFINITION_FIELDS = {"card_names", "colors", "tags", "text"}
+
+class GameCard(MutableMapping):
+    """A card instance in a game.
+
+    Holds a reference to the shared, read-only card definition and stores only
+    the per-game fields (ids, damage, attachments, flags) itself.
+    Reading a nested definition field (like "effects" or "arts") gives this
+    card its own copy the first time, so engine code that adjusts effects in
+    place never touches the shared definition.
+    """
+    __slots__ = ("definition", "state")
+
+    def __init__(self, definition, state=None):
+        self.definition = definition
+        self.state = state if state is not None else {}
+
+    def __getitem__(self, key):
+        state = self.state
+        if key in state:
+            return state[key]
+        value = self.definition[key]
+        if isinstance(value, (FrozenDict, FrozenList)) and key not in SHARED_DEFINITION_FIELDS:
+            value = deepcopy(value)
+            state[key] = value
+        return value
+
+    def get(self, key, default=None):
+        if key in self.state or key in self.definition:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        self.state[key] = value
+
+    def __delitem__(self, key):
+        # Definition fields can't be removed, only per-game ones.
+        del self.state[key]
+
+    def __contains__(self, key):
+        return key in self.state or key in self.definition
+
+    def __iter__(self):
+        yield from self.state
+        for key in self.definition:
+            if key not in self.state:
+                yield key
+
+    def __bool__(self):
+        # A card is never empty, and "if card:" is everywhere in the engine.
+        return True
+
+    def __len__(self):
+        return len(self.state) + sum(1 for key in self.definition if key not in self.state)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        # Different game cards are never equal, skip the full comparison.
+        if self.get("game_card_id") != other.get("game_card_id"):
+            return False
+        return dict(self.items()) == dict(other.items())
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GameCard({self.get('game_card_id')!r}, {self.get('card_id')!r})"
+
+    def __copy__(self):
+        return GameCard(self.definition, dict(self.state))
+
+    def __deepcopy__(self, memo):
+        copied = GameCard(self.definition)
+        memo[id(self)] = copied
+        copied.state = deepcopy(self.state, memo)
+        return copied
+
+    def __reduce__(self):
+        return (GameCard, (self.definition, self.state))
+
+# Engine steps that a Continuation can run, by name.
+continuation_registry = {}
+
+def continuation_step(function):
+    """Registers an engine method (or a function taking the engine first) for use in a Continuation."""
+    if function.__name__ in continuation_registry:
+        raise ValueError(f"Continuation step {function.__name__} is already registered.")
+    continuation_registry[function.__name__] = function
+    return function
+
+class Continuation:
+    """A pending engine step stored as data: the registered step name and its arguments.
+
+    Decisions and effect resolution keep these instead of closures so the whole engine
+    can be pickled, restored and copied. Calling it runs the step with the engine,
+    the stored arguments and then any arguments given to the call.
+    """
+    __slots__ = ("engine", "step_name", "args")
+
+    def __init__(self, engine, step_name, *args):
+        if step_name not in continuation_registry:
+            raise ValueError(f"Unknown continuation step {step_name}.")
+        self.engine = engine
+        self.step_name = step_name
+        self.args = args
+
+    def __call__(self, *call_args):
+        return continuation_registry[self.step_name](self.engine, *self.args, *call_args)
+
+    def __deepcopy__(self, memo):
+        # Like a closure, copying an effect that holds a continuation shares it.
+        # Only a copy of the whole engine gets continuations that point at the copy.
+        if id(self.engine) not in memo:
+            return self
+        copied = Continuation.__new__(Continuation)
+        memo[id(self)] = copied
+        copied.engine = memo[id(self.engine)]
+        copied.step_name = self.step_name
+        copied.args = deepcopy(self.args, memo)
+        return copied
+
+    def __repr__(self):
+        return f"Continuation({self.step_name})"
+
 class ArtStatBoosts:
     def __init__(self):
         self.power = 0
@@ -182,3 +314,57 @@ class EffectResolutionState:
         self.simultaneous_choice = simultaneous_choice
 
         self.simultaneous_choice_index = -1
+
+# Values that are never changed in place, so a copied game can keep them.
+IMMUTABLE_STATE_TYPES = {str, int, float, bool, type(None), FrozenDict, FrozenList}
+
+def copy_game_state(value, memo):
+    """A faster deepcopy for engine state.
+
+    Knows the types the engine keeps (dicts, lists, cards and the engine's own state
+    objects) and shares card definitions. memo works like deepcopy's, so anything
+    put in it up front (like the card database) is kept as is.
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_STATE_TYPES:
+        return value
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+    if value_type is dict:
+        copied = {}
+        memo[id(value)] = copied
+        for key, item in value.items():
+            copied[key] = item if type(item) in IMMUTABLE_STATE_TYPES else copy_game_state(item, memo)
+    elif value_type is list:
+        copied = []
+        memo[id(value)] = copied
+        for item in value:
+            copied.append(item if type(item) in IMMUTABLE_STATE_TYPES else copy_game_state(item, memo))
+    elif value_type is GameCard:
+        copied = GameCard(value.definition)
+        memo[id(value)] = copied
+        copied.state = copy_game_state(value.state, memo)
+    elif value_type is tuple:
+        copied = tuple([item if type(item) in IMMUTABLE_STATE_TYPES else copy_game_state(item, memo) for item in value])
+        memo[id(value)] = copied
+    elif value_type is Continuation:
+        copied = Continuation.__new__(Continuation)
+        memo[id(value)] = copied
+        copied.engine = copy_game_state(value.engine, memo)
+        copied.step_name = value.step_name
+        copied.args = copy_game_state(value.args, memo)
+    elif value_type is Random:
+        copied = Random.__new__(Random)
+        copied.setstate(value.getstate())
+        memo[id(value)] = copied
+    elif value_type is MethodType:
+        copied = MethodType(value.__func__, copy_game_state(value.__self__, memo))
+    elif value_type.__module__.startswith("app.") and not hasattr(value_type, "__deepcopy__") and hasattr(value, "__dict__"):
+        # Engine, player and resolution state objects.
+        copied = value_type.__new__(value_type)
+        memo[id(value)] = copied
+        copied.__dict__ = copy_game_state(value.__dict__, memo)
+    else:
+        copied = deepcopy(value, memo)
+    return copied
@@ -12,6 +12,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Zones searched by find_card, in lookup order.
+INDEXED_ZONES = ("hand", "archive", "backstage", "center", "collab", "deck", "cheer_deck", "holopower", "floating")
+STAGE_ZONES = ("center", "collab", "backstage")
+ATTACHMENT_FIELDS = ("attached_support", "attached_cheer", "stacked_cards")
+# Zones that gain and lose cards at the front. Positions in them are kept counted from the end
+# (negative) so putting a card on top doesn't move every other card's position.
+FROM_END_ZONES = ("archive", "deck", "cheer_deck", "holopower", "life")
+
 
 class PlayerState:
     def __init__(self, card_db:CardDatabase, player_info:Dict[str, Any], engine: 'GameEngine'):
@@ -66,34 +74,41 @@ class PlayerState:
         self.sp_oshi_skill_used_this_turn = False
         self.die_rolls_this_turn = 0
         self.extra_turn_pending = False
+        # Timing -> effects of the stage and the oshi, see get_stage_effect_registry.
+        self.stage_effect_registry_key = None
+        self.stage_effect_registry = None
+        self.oshi_effects_by_timing = None
 
         # Set up Oshi.
         self.oshi_id = player_info["oshi_id"]
-        self.oshi_card = card_db.get_card_by_id(self.oshi_id)
-        self.oshi_card["game_card_id"] = self.player_id + "_oshi"
+        self.oshi_card = GameCard(card_db.get_card_definition(self.oshi_id), {
+            "game_card_id": self.player_id + "_oshi",
+        })
 
         self.deck_list = player_info["deck"]
         # Generate unique cards for all cards in the deck.
         self.deck = []
         card_number = 1
         for card_id, count in self.deck_list.items():
-            card = card_db.get_card_by_id(card_id)
+            card = card_db.get_card_definition(card_id)
             for _ in range(int(count)):
-                generated_card = deepcopy(card)
-                generated_card["owner_id"] = self.player_id
-                generated_card["game_card_id"] = self.player_id + "_" + str(card_number)
-                generated_card["played_this_turn"] = False
-                generated_card["bloomed_this_turn"] = False
-                generated_card["attached_cheer"] = []
-                generated_card["attached_support"] = []
-                generated_card["stacked_cards"] = []
-                generated_card["zone_when_downed"] = ""
-                generated_card["zone_when_returned_to_hand"] = ""
-                generated_card["attached_when_downed"] = []
-                generated_card["damage"] = 0
-                generated_card["resting"] = False
-                generated_card["rest_extra_turn"] = False
-                generated_card["used_art_this_turn"] = False
+                # Only the per-game fields live on the instance, the definition is shared.
+                generated_card = GameCard(card, {
+                    "owner_id": self.player_id,
+                    "game_card_id": self.player_id + "_" + str(card_number),
+                    "played_this_turn": False,
+                    "bloomed_this_turn": False,
+                    "attached_cheer": [],
+                    "attached_support": [],
+                    "stacked_cards": [],
+                    "zone_when_downed": "",
+                    "zone_when_returned_to_hand": "",
+                    "attached_when_downed": [],
+                    "damage": 0,
+                    "resting": False,
+                    "rest_extra_turn": False,
+                    "used_art_this_turn": False,
+                })
                 card_number += 1
                 self.deck.append(generated_card)
 
@@ -102,22 +117,33 @@ class PlayerState:
         self.cheer_deck = []
         card_number = 1001
         for card_id, count in player_info["cheer_deck"].items():
-            card = card_db.get_card_by_id(card_id)
+            card = card_db.get_card_definition(card_id)
             for _ in range(int(count)):
-                generated_card = deepcopy(card)
-                generated_card["owner_id"] = self.player_id
-                generated_card["game_card_id"] = self.player_id + "_" + str(card_number)
+                generated_card = GameCard(card, {
+                    "owner_id": self.player_id,
+                    "game_card_id": self.player_id + "_" + str(card_number),
+                })
                 card_number += 1
                 self.cheer_deck.append(generated_card)
 
         self.game_cards_map = {card["game_card_id"]: card["card_id"] for card in self.deck + self.cheer_deck}
         self.game_cards_map[self.oshi_card["game_card_id"]] = self.oshi_card["card_id"]
 
+        # game_card_id -> (card, zone name, holder card, position), see locate_card.
+        self.card_locations = {}
+        self.card_index_misses = 0
+        for position, card in enumerate(self.deck):
+            self.index_card(card, "deck", position=position)
+        for position, card in enumerate(self.cheer_deck):
+            self.index_card(card, "cheer_deck", position=position)
+
     def initialize_life(self):
         # Move cards from the cheer deck to the life area equal to the oshi's life.
         self.life = self.cheer_deck[:self.oshi_card["life"]]
         # Remove them from the cheer deck.
         self.cheer_deck = self.cheer_deck[self.oshi_card["life"]:]
+        for position, card in enumerate(self.life):
+            self.index_card(card, "life", position=position)
 
     def draw(self, amount: int, from_bottom: bool = False):
         amount = min(amount, len(self.deck))
@@ -129,6 +155,8 @@ class PlayerState:
             drawn_cards = self.deck[:amount]
             self.deck = self.deck[amount:]
         self.hand += drawn_cards
+        for card in drawn_cards:
+            self.index_card(card, "hand")
 
         draw_event = {
             "event_type": EventType.EventType_Draw,
@@ -521,6 +549,57 @@ class PlayerState:
     def has_used_once_per_game_effect(self, effect_id):
         return effect_id in self.effects_used_this_game
 
+    def get_stage_effect_registry(self):
+        """Effects of the holomems on stage and their attached cards, indexed by timing.
+
+        Rebuilt only when a holomem enters or leaves the stage or an attachment
+        changes, which the key (the stage holomems, each followed by its attached
+        support cards) catches. Comparing it is an identity check per card.
+        Entries point at the cards' own effects, get_effects_at_timing copies the ones it returns.
+        """
+        stage = self.get_holomem_on_stage()
+        key = []
+        for holomem in stage:
+            key.append(holomem)
+            key.extend(holomem["attached_support"])
+        if key == self.stage_effect_registry_key:
+            return self.stage_effect_registry
+
+        # timing -> [(source card, effect)] in stage order.
+        gift_effects = {}
+        attached_effects = {}
+        global_attached_effects = {}
+        for holomem in stage:
+            for effect in holomem.get("gift_effects", []):
+                gift_effects.setdefault(effect.get("timing"), []).append((holomem, effect))
+        for holomem in stage:
+            for attached_card in holomem["attached_support"]:
+                for effect in attached_card.get("attached_effects", []):
+                    if not isinstance(effect, dict):
+                        continue
+                    attached_effects.setdefault(effect.get("timing"), []).append((attached_card, effect))
+                    if effect.get("global_trigger", False):
+                        global_attached_effects.setdefault(effect.get("timing"), []).append((attached_card, effect))
+        self.stage_effect_registry_key = key
+        self.stage_effect_registry = {
+            "gift": gift_effects,
+            "attached": attached_effects,
+            "global_attached": global_attached_effects,
+        }
+        return self.stage_effect_registry
+
+    def get_oshi_effects_by_timing(self):
+        # The oshi never changes, so its effects are indexed once.
+        if self.oshi_effects_by_timing is None:
+            self.oshi_effects_by_timing = {}
+            for oshi_effect in self.oshi_card.get("effects", []):
+                oshi_timing = oshi_effect.get("timing")
+                if not oshi_timing:
+                    logger.debug("Skipping oshi effect without timing for card_id=%s", self.oshi_card.get("card_id"))
+                    continue
+                self.oshi_effects_by_timing.setdefault(oshi_timing, []).append(oshi_effect)
+        return self.oshi_effects_by_timing
+
     def get_effects_at_timing(self, timing, card, timing_source_requirement = ""):
         effects = []
 
@@ -528,53 +607,38 @@ class PlayerState:
             effects.extend(self.performance_cleanup_effects_pending)
             self.performance_cleanup_effects_pending = []
 
+        registry = self.get_stage_effect_registry()
+
         # For now, prioritize Gift effects before oshi effects
         # due to zeta's reduce damage gift that can fail which wants to go first.
         # If needed, on_take_damage will have to become a simultaneous decision resolution.
-        for holomem in self.get_holomem_on_stage():
-            if "gift_effects" in holomem:
-                gift_effects = filter_effects_at_timing(holomem["gift_effects"], timing)
-                add_ids_to_effects(gift_effects, self.player_id, holomem["game_card_id"])
-                effects.extend(gift_effects)
-
-        for oshi_effect in self.oshi_card.get("effects", []):
-            oshi_timing = oshi_effect.get("timing")
-            if not oshi_timing:
-                logger.debug("Skipping oshi effect without timing for card_id=%s", self.oshi_card.get("card_id"))
+        for holomem, gift_effect in registry["gift"].get(timing, []):
+            gift_effect = deepcopy(gift_effect)
+            add_ids_to_effects([gift_effect], self.player_id, holomem["game_card_id"])
+            effects.append(gift_effect)
+
+        for oshi_effect in self.get_oshi_effects_by_timing().get(timing, []):
+            if "timing_source_requirement" in oshi_effect and oshi_effect["timing_source_requirement"] != timing_source_requirement:
                 continue
-            if oshi_timing == timing:
-                if "timing_source_requirement" in oshi_effect and oshi_effect["timing_source_requirement"] != timing_source_requirement:
-                    continue
-                add_ids_to_effects([oshi_effect], self.player_id, self.oshi_card["game_card_id"])
-                effects.append(oshi_effect)
+            add_ids_to_effects([oshi_effect], self.player_id, self.oshi_card["game_card_id"])
+            effects.append(oshi_effect)
 
         turn_effects = filter_effects_at_timing(self.turn_effects, timing)
         add_ids_to_effects(turn_effects, self.player_id, "")
         effects.extend(turn_effects)
 
         if timing == "before_die_roll" and not card:
-            for holomem in self.get_holomem_on_stage():
-                for attached_card in holomem.get("attached_support", []):
-                    attached_effects = attached_card.get("attached_effects", [])
-                    for attached_effect in attached_effects:
-                        if not isinstance(attached_effect, dict):
-                            continue
-                        if attached_effect.get("timing") == timing:
-                            if "timing_source_requirement" in attached_effect and attached_effect["timing_source_requirement"] != timing_source_requirement:
-                                continue
-                            ae_copy = deepcopy(attached_effect)
-                            add_ids_to_effects([ae_copy], self.player_id, attached_card["game_card_id"])
-                            effects.append(ae_copy)
+            for attached_card, attached_effect in registry["attached"].get(timing, []):
+                if "timing_source_requirement" in attached_effect and attached_effect["timing_source_requirement"] != timing_source_requirement:
+                    continue
+                ae_copy = deepcopy(attached_effect)
+                add_ids_to_effects([ae_copy], self.player_id, attached_card["game_card_id"])
+                effects.append(ae_copy)
 
-        for holomem in self.get_holomem_on_stage():
-            for attached_card in holomem.get("attached_support", []):
-                for ae in attached_card.get("attached_effects", []):
-                    if not isinstance(ae, dict):
-                        continue
-                    if ae.get("timing") == timing and ae.get("global_trigger", False):
-                        ae_copy = deepcopy(ae)
-                        add_ids_to_effects([ae_copy], self.player_id, attached_card["game_card_id"])
-                        effects.append(ae_copy)
+        for attached_card, attached_effect in registry["global_attached"].get(timing, []):
+            ae_copy = deepcopy(attached_effect)
+            add_ids_to_effects([ae_copy], self.player_id, attached_card["game_card_id"])
+            effects.append(ae_copy)
 
         if card and card["card_type"] not in ["support", "oshi"]:
             card_effects = filter_effects_at_timing(card.get("effects", []), timing)
@@ -697,45 +761,142 @@ class PlayerState:
             case self.holopower: return "holopower"
             case _: return "unknown"
 
-    def find_card(self, card_id, include_stacked_cards = False):
-        zones = [self.hand, self.archive, self.backstage, self.center, self.collab, self.deck, self.cheer_deck, self.holopower]
-        for zone in zones:
-            for card in zone:
+    def get_zone_by_name(self, zone_name):
+        match zone_name:
+            case "hand": return self.hand
+            case "archive": return self.archive
+            case "backstage": return self.backstage
+            case "center": return self.center
+            case "collab": return self.collab
+            case "deck": return self.deck
+            case "cheer_deck": return self.cheer_deck
+            case "holopower": return self.holopower
+            case "life": return self.life
+            case "floating": return self.engine.floating_cards
+            case _: return None
+
+    def index_card(self, card, zone_name, holder=None, position=-1):
+        # Remember where a card is so later lookups can skip the zone scans.
+        # For attachments, zone_name is the holder's list field ("attached_cheer", etc.).
+        # Position is only a hint, lookups always verify it.
+        if holder is None and zone_name in FROM_END_ZONES and position >= 0:
+            position -= len(self.get_zone_by_name(zone_name))
+        self.card_locations[card["game_card_id"]] = (card, zone_name, holder, position)
+
+    def index_attachments(self, holomem):
+        for field in ATTACHMENT_FIELDS:
+            for position, attached in enumerate(holomem.get(field, [])):
+                self.index_card(attached, field, holomem, position)
+
+    def unindex_card(self, card_id):
+        self.card_locations.pop(card_id, None)
+
+    def _verify_location(self, card, zone):
+        # The index can be stale if a zone list was changed directly, so confirm
+        # the card is still in the zone. Returns the position or -1.
+        if zone is None:
+            return -1
+        for position, zone_card in enumerate(zone):
+            if zone_card is card:
+                return position
+        return -1
+
+    def _scan_card_location(self, card_id):
+        # Full search in the same order find_card/find_attachment always used.
+        for zone_name in INDEXED_ZONES:
+            zone = self.get_zone_by_name(zone_name)
+            for position, card in enumerate(zone):
                 if card["game_card_id"] == card_id:
-                    zone_name = self.get_zone_name(zone)
-                    return card, zone, zone_name
-        for card in self.engine.floating_cards:
+                    return card, zone_name, None, position
+        for holomem in self.get_holomem_on_stage():
+            for field in ATTACHMENT_FIELDS:
+                for position, attached in enumerate(holomem[field]):
+                    if attached["game_card_id"] == card_id:
+                        return attached, field, holomem, position
+        for position, card in enumerate(self.life):
             if card["game_card_id"] == card_id:
-                return card, self.engine.floating_cards, "floating"
+                return card, "life", None, position
+        return None, None, None, -1
+
+    def locate_card(self, card_id):
+        """Find a card in any of this player's zones or stage attachments.
+
+        Returns (card, zone_name, holder, position). For attached cards, zone_name
+        is the holder's list field and holder is the holomem it is on.
+        """
+        location = self.card_locations.get(card_id)
+        if location:
+            card, zone_name, holder, position = location
+            zone = self.get_zone_by_name(zone_name) if holder is None else holder.get(zone_name)
+            if holder is None or self._is_holder_on_stage(holder):
+                if zone is not None and -len(zone) <= position < len(zone) and zone[position] is card:
+                    return location
+                position = self._verify_location(card, zone)
+                if position >= 0:
+                    self.index_card(card, zone_name, holder, position)
+                    return self.card_locations[card_id]
+            self.card_index_misses += 1
+
+        location = self._scan_card_location(card_id)
+        if location[0]:
+            self.index_card(*location)
+            location = self.card_locations[card_id]
+        else:
+            self.card_locations.pop(card_id, None)
+        return location
+
+    def _is_holder_on_stage(self, holder):
+        _, zone_name, holder_of_holder, _ = self.locate_card(holder["game_card_id"])
+        return holder_of_holder is None and zone_name in STAGE_ZONES
+
+    def find_card(self, card_id, include_stacked_cards = False):
         if self.oshi_card["game_card_id"] == card_id:
             return self.oshi_card, None, "oshi"
 
+        card, zone_name, holder, _ = self.locate_card(card_id)
+        if card and holder is None and zone_name != "life":
+            return card, self.get_zone_by_name(zone_name), zone_name
+
         if include_stacked_cards:
-            attached_card = self.find_attachment(card_id)
+            attached_card = card if card and holder is not None else None
             return attached_card, None, None
 
         # Card, Zone, Zone Name
         return None, None, None
 
     def find_attachment(self, attachment_id):
-        for holomem in self.get_holomem_on_stage():
-            for attachment in holomem["attached_support"]:
-                if attachment["game_card_id"] == attachment_id:
-                    return attachment
-            for attachment in holomem["attached_cheer"]:
-                if attachment["game_card_id"] == attachment_id:
-                    return attachment
-            for attachment in holomem["stacked_cards"]:
-                if attachment["game_card_id"] == attachment_id:
-                    return attachment
+        card, _, holder, _ = self.locate_card(attachment_id)
+        if card and holder is not None:
+            return card
         return None
 
     def find_and_remove_card(self, card_id):
         card, zone, zone_name = self.find_card(card_id)
         if card and zone:
-            zone.remove(card)
+            _, _, _, position = self.card_locations[card_id]
+            del zone[position]
+            self.unindex_card(card_id)
         return card, zone, zone_name
 
+    def check_card_index(self):
+        """Debug helper: compare every indexed lookup with a full scan.
+
+        Returns a list of error strings, empty if the index agrees.
+        """
+        errors = []
+        all_ids = []
+        for zone_name in INDEXED_ZONES + ("life",):
+            all_ids.extend(ids_from_cards(self.get_zone_by_name(zone_name)))
+        for holomem in self.get_holomem_on_stage():
+            for field in ATTACHMENT_FIELDS:
+                all_ids.extend(ids_from_cards(holomem[field]))
+        for card_id in all_ids:
+            expected = self._scan_card_location(card_id)
+            actual = self.locate_card(card_id)
+            if expected[0] is not actual[0] or expected[1] != actual[1] or expected[2] is not actual[2]:
+                errors.append(f"{self.player_id}: card {card_id} indexed at {actual[1]} but found in {expected[1]}")
+        return errors
+
     def move_card(self, card_id, to_zone, zone_card_id="", hidden_info=False, add_to_bottom=False, no_events=False):
         card, _, from_zone_name = self.find_and_remove_card(card_id)
         if not card:
@@ -759,6 +920,7 @@ class PlayerState:
             )
             for attached in all_attached:
                 self.archive.insert(0, attached)
+                self.index_card(attached, "archive", position=0)
                 if not no_events:
                     self.engine.broadcast_event({
                         "event_type": EventType.EventType_MoveAttachedCard,
@@ -803,9 +965,18 @@ class PlayerState:
             case "holomem":
                 holomem_card, _, _ = self.find_card(zone_card_id)
                 attach_card(card, holomem_card)
+                self.index_attachments(holomem_card)
             case "holopower":
                 self.holopower.insert(0, card)
 
+        if to_zone != "holomem":
+            zone_name = "deck" if to_zone == "top_of_deck" else to_zone
+            zone = self.get_zone_by_name(zone_name)
+            if zone is not None:
+                # Cards are only ever added at the front or the back.
+                position = len(zone) - 1 if zone and zone[-1] is card else 0
+                self.index_card(card, zone_name, position=position)
+
         if to_zone in ["center", "backstage", "collab", "holomem"] and from_zone_name in ["hand", "deck"]:
             card["played_this_turn"] = True
 
@@ -909,6 +1080,7 @@ class PlayerState:
                     rested_card_ids.append(card["game_card_id"])
 
                 self.backstage.append(card)
+                self.index_card(card, "backstage", position=len(self.backstage) - 1)
                 moved_backstage_card_ids.append(card["game_card_id"])
             self.collab = []
 
@@ -932,11 +1104,12 @@ class PlayerState:
                     if stacked["game_card_id"] == bloom_card_id:
                         bloom_card = stacked
                         holomem["stacked_cards"].pop(i)
+                        self.unindex_card(bloom_card_id)
                         bloom_from_zone_name = "stacked"
                         break
                 if bloom_card:
                     break
-        target_card, zone, _ = self.find_and_remove_card(target_card_id)
+        target_card, zone, target_zone_name = self.find_and_remove_card(target_card_id)
 
         previous_bloom_level = 0
         if "bloom_level" in target_card:
@@ -965,6 +1138,8 @@ class PlayerState:
 
         # Put the bloom card where the target card was.
         zone.append(bloom_card)
+        self.index_card(bloom_card, target_zone_name, position=len(zone) - 1)
+        self.index_attachments(bloom_card)
 
         # For any ongoing turn effects, make sure to point them at the new card.
         for effect in self.turn_effects:
@@ -1017,6 +1192,7 @@ class PlayerState:
         for _ in range(amount):
             if len(self.deck) > 0:
                 self.holopower.insert(0, self.deck.pop(0))
+                self.index_card(self.holopower[0], "holopower", position=0)
                 generated_something = True
         if generated_something and not skip_event:
             generate_hp_event = {
@@ -1030,6 +1206,7 @@ class PlayerState:
         # Move the card and generate holopower.
         collab_card, _, _ = self.find_and_remove_card(collab_card_id)
         self.collab.append(collab_card)
+        self.index_card(collab_card, "collab", position=len(self.collab) - 1)
         self.collabed_this_turn = True
         self.generate_holopower(1, skip_event=True)
 
@@ -1084,50 +1261,37 @@ class PlayerState:
     def find_and_remove_attached(self, attached_id):
         previous_holder_id = None
         found_card = None
-        for card in self.get_holomem_on_stage():
-            if attached_id in ids_from_cards(card["attached_cheer"]):
-                found_card = next(c for c in card["attached_cheer"] if c["game_card_id"] == attached_id)
-                previous_holder_id = card["game_card_id"]
-                card["attached_cheer"].remove(found_card)
-                break
-            if attached_id in ids_from_cards(card["attached_support"]):
-                found_card = next(c for c in card["attached_support"] if c["game_card_id"] == attached_id)
-                previous_holder_id = card["game_card_id"]
-                card["attached_support"].remove(found_card)
-                break
-            if attached_id in ids_from_cards(card["stacked_cards"]):
-                found_card = next(c for c in card["stacked_cards"] if c["game_card_id"] == attached_id)
-                previous_holder_id = card["game_card_id"]
-                card["stacked_cards"].remove(found_card)
-                break
-        if not previous_holder_id:
-            if attached_id in ids_from_cards(self.life):
-                found_card = next(c for c in self.life if c["game_card_id"] == attached_id)
-                self.life.remove(found_card)
-                previous_holder_id = "life"
-            elif attached_id in ids_from_cards(self.archive):
-                found_card = next(c for c in self.archive if c["game_card_id"] == attached_id)
-                self.archive.remove(found_card)
-                previous_holder_id = "archive"
-            elif attached_id in ids_from_cards(self.cheer_deck):
-                found_card = next(c for c in self.cheer_deck if c["game_card_id"] == attached_id)
-                self.cheer_deck.remove(found_card)
-                previous_holder_id = "cheer_deck"
+        card, zone_name, holder, position = self.locate_card(attached_id)
+        if card and holder is not None:
+            found_card = card
+            previous_holder_id = holder["game_card_id"]
+            del holder[zone_name][position]
+        elif card and zone_name in ["life", "archive", "cheer_deck"]:
+            found_card = card
+            previous_holder_id = zone_name
+            del self.get_zone_by_name(zone_name)[position]
+        if found_card:
+            self.unindex_card(attached_id)
         return found_card, previous_holder_id
 
     def find_and_remove_support(self, support_id):
         previous_holder_id = None
         support_card = None
-        for card in self.get_holomem_on_stage():
-            if support_id in ids_from_cards(card["attached_support"]):
-                support_card = next(c for c in card["attached_support"] if c["game_card_id"] == support_id)
-                previous_holder_id = card["game_card_id"]
-                card["attached_support"].remove(support_card)
-                break
+        card, zone_name, holder, position = self.locate_card(support_id)
+        if card and holder is not None and zone_name == "attached_support":
+            support_card = card
+            previous_holder_id = holder["game_card_id"]
+            del holder["attached_support"][position]
+            self.unindex_card(support_id)
         return support_card, previous_holder_id
 
     def move_cheer_between_holomems(self, placements):
+        # Callers try both players with the same placements. The other player's cheer was never
+        # indexed here, so skip it instead of scanning every zone to find it isn't here.
+        other_player = self.engine.other_player(self.player_id)
         for cheer_id, target_id in placements.items():
+            if cheer_id not in self.card_locations and cheer_id in other_player.game_cards_map:
+                continue
             # Find and remove the cheer from its current spot.
             if target_id == "archive":
                 self.archive_attached_cards([cheer_id])
@@ -1135,6 +1299,7 @@ class PlayerState:
                 cheer_card, previous_holder_id = self.find_and_remove_attached(cheer_id)
                 if cheer_card:
                     self.cheer_deck.append(cheer_card)
+                    self.index_card(cheer_card, "cheer_deck", position=len(self.cheer_deck) - 1)
                     move_cheer_event = {
                         "event_type": EventType.EventType_MoveAttachedCard,
                         "owning_player_id": self.player_id,
@@ -1149,6 +1314,7 @@ class PlayerState:
                     # Attach to the target.
                     target_card, _, _ = self.find_card(target_id)
                     target_card["attached_cheer"].append(cheer_card)
+                    self.index_card(cheer_card, "attached_cheer", target_card, len(target_card["attached_cheer"]) - 1)
 
                     move_cheer_event = {
                         "event_type": EventType.EventType_MoveAttachedCard,
@@ -1164,6 +1330,7 @@ class PlayerState:
             attached_card, previous_holder_id = self.find_and_remove_attached(attached_id)
             if attached_card:
                 self.archive.insert(0, attached_card)
+                self.index_card(attached_card, "archive", position=0)
                 move_attached_event = {
                     "event_type": EventType.EventType_MoveAttachedCard,
                     "owning_player_id": self.player_id,
@@ -1202,11 +1369,14 @@ class PlayerState:
             to_hand.append(card)
         else:
             self.archive.insert(0, card)
+            self.index_card(card, "archive", position=0)
 
         for extra_card in to_archive:
             self.archive.insert(0, extra_card)
+            self.index_card(extra_card, "archive", position=0)
         for hand_card in to_hand:
             self.hand.append(hand_card)
+            self.index_card(hand_card, "hand", position=len(self.hand) - 1)
             self.reset_card_stats(hand_card)
 
         hand_ids = ids_from_cards(to_hand)
@@ -1232,8 +1402,10 @@ class PlayerState:
 
         for card in to_archive:
             self.archive.insert(0, card)
+            self.index_card(card, "archive", position=0)
         for card in to_hand:
             self.hand.append(card)
+            self.index_card(card, "hand", position=len(self.hand) - 1)
             self.reset_card_stats(card)
         archived_ids = ids_from_cards(to_archive)
         hand_ids = ids_from_cards(to_hand)
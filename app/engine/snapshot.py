@@ -0,0 +1,43 @@
+import io
+import pickle
+from app.card_database import CardDatabase, FrozenDict
+
+# Serialized engine state, used by replay checkpoints.
+# The card database and card definitions are never written, they are looked up
+# again from the card database the snapshot is loaded with.
+# Pending steps are Continuation records, so the engine pickles without closures.
+
+class EngineSnapshotPickler(pickle.Pickler):
+    def __init__(self, file, card_db : CardDatabase):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.card_db = card_db
+        self.definition_ids = {id(definition): card_id for card_id, definition in card_db.cards_by_id.items()}
+
+    def persistent_id(self, obj):
+        if obj is self.card_db:
+            return ("card_db",)
+        if type(obj) is FrozenDict and id(obj) in self.definition_ids:
+            return ("card", self.definition_ids[id(obj)])
+        return None
+
+class EngineSnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, card_db : CardDatabase):
+        super().__init__(file)
+        self.card_db = card_db
+
+    def persistent_load(self, pid):
+        if pid[0] == "card_db":
+            return self.card_db
+        if pid[0] == "card":
+            return self.card_db.get_card_definition(pid[1])
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+def save_engine_snapshot(engine) -> bytes:
+    """Serializes the whole engine: player zones, turn flags, pending decisions,
+    effect_resolution_state and the random generator state."""
+    buffer = io.BytesIO()
+    EngineSnapshotPickler(buffer, engine.card_db).dump(engine)
+    return buffer.getvalue()
+
+def load_engine_snapshot(snapshot : bytes, card_db : CardDatabase):
+    return EngineSnapshotUnpickler(io.BytesIO(snapshot), card_db).load()
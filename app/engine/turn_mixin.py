@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 class TurnMixin:
+    @continuation_step
     def begin_player_turn(self, switch_active_player : bool):
         if switch_active_player:
             self.switch_active_player()
@@ -144,18 +145,33 @@ class TurnMixin:
         # Determine available actions.
         available_actions = []
 
+        # The hand is sorted by card type once, each section below only looks at its own cards.
+        place_cards = []
+        bloom_cards = []
+        support_cards = []
+        for card in active_player.hand:
+            card_type = card["card_type"]
+            if card_type in ["holomem_debut", "holomem_spot"]:
+                place_cards.append(card)
+            elif card_type == "holomem_bloom":
+                if not card.get("bloom_blocked"):
+                    bloom_cards.append((card, card["game_card_id"], card["bloom_level"], card["card_names"]))
+            elif card_type == "support":
+                support_cards.append(card)
+
         # A. Place debut/spot cards.
         on_stage_mems = active_player.get_holomem_on_stage()
         if len(on_stage_mems) < MAX_MEMBERS_ON_STAGE:
-            for card in active_player.hand:
-                if card["card_type"] in ["holomem_debut", "holomem_spot"]:
-                    available_actions.append({
-                        "action_type": GameAction.MainStepPlaceHolomem,
-                        "card_id": card["game_card_id"]
-                    })
+            for card in place_cards:
+                available_actions.append({
+                    "action_type": GameAction.MainStepPlaceHolomem,
+                    "card_id": card["game_card_id"]
+                })
 
         # B. Bloom
-        if not active_player.first_turn:
+        # Bloom cards and their hp are looked up once, not once per holomem on stage.
+        bloom_card_hp = {}
+        if not active_player.first_turn and bloom_cards:
             for mem_card in on_stage_mems:
                 if mem_card["played_this_turn"]:
                     # Can't bloom if played this turn.
@@ -166,17 +182,18 @@ class TurnMixin:
 
                 accepted_bloom_levels = active_player.get_accepted_bloom_for_card(mem_card)
                 if accepted_bloom_levels:
-                    for card in active_player.hand:
-                        if "bloom_blocked" in card and card["bloom_blocked"]:
-                            continue
-                        if card["card_type"] == "holomem_bloom" and card["bloom_level"] in accepted_bloom_levels:
+                    mem_names = mem_card["card_names"]
+                    for card, card_id, bloom_level, card_names in bloom_cards:
+                        if bloom_level in accepted_bloom_levels:
                             # Check the names of the bloom card, at last one must match a name from the base card.
-                            if any(name in card["card_names"] for name in mem_card["card_names"]):
+                            if any(name in card_names for name in mem_names):
                                 # Check the damage, if the bloom version would die, you can't.
-                                if mem_card["damage"] < active_player.get_card_hp(card):
+                                if card_id not in bloom_card_hp:
+                                    bloom_card_hp[card_id] = active_player.get_card_hp(card)
+                                if mem_card["damage"] < bloom_card_hp[card_id]:
                                     available_actions.append({
                                         "action_type": GameAction.MainStepBloom,
-                                        "card_id": card["game_card_id"],
+                                        "card_id": card_id,
                                         "target_id": mem_card["game_card_id"],
                                     })
 
@@ -247,38 +264,40 @@ class TurnMixin:
                         })
 
         # F. Use Support Cards
-        for card in active_player.hand:
-            if card["card_type"] == "support":
-                if is_card_limited(card):
-                    if active_player.limited_uses_count_this_turn >= active_player.limited_uses_allowed_this_turn:
-                        continue
-                    if self.first_turn_player_id == active_player.player_id and active_player.first_turn:
-                        continue
-
-                # event card whit magic tag limited can only be used once per turn
-                if is_event_card_whit_magic_tag_limited(card):
-                    if active_player.event_card_whit_magic_tag:
-                        continue
+        # Every playable support card gets the same cheer listing, made on first use.
+        cheer_on_each_mem = None
+        for card in support_cards:
+            if is_card_limited(card):
+                if active_player.limited_uses_count_this_turn >= active_player.limited_uses_allowed_this_turn:
+                    continue
+                if self.first_turn_player_id == active_player.player_id and active_player.first_turn:
+                    continue
 
-                if "play_conditions" in card:
-                    if not self.are_conditions_met(active_player, card["game_card_id"], card["play_conditions"]):
-                        continue
+            # event card whit magic tag limited can only be used once per turn
+            if is_event_card_whit_magic_tag_limited(card):
+                if active_player.event_card_whit_magic_tag:
+                    continue
 
-                # Restrictions for mascots and tools with regards to attaching to holomem.
-                if not self.card_has_available_target_to_attach_to(active_player, card):
+            if "play_conditions" in card:
+                if not self.are_conditions_met(active_player, card["game_card_id"], card["play_conditions"]):
                     continue
 
-                play_requirements = {}
-                if "play_requirements" in card:
-                    play_requirements = card["play_requirements"]
+            # Restrictions for mascots and tools with regards to attaching to holomem.
+            if not self.card_has_available_target_to_attach_to(active_player, card):
+                continue
+
+            play_requirements = {}
+            if "play_requirements" in card:
+                play_requirements = card["play_requirements"]
 
+            if cheer_on_each_mem is None:
                 cheer_on_each_mem = active_player.get_cheer_on_each_holomem(exclude_empty_members=True)
-                available_actions.append({
-                    "action_type": GameAction.MainStepPlaySupport,
-                    "card_id": card["game_card_id"],
-                    "play_requirements": play_requirements,
-                    "cheer_on_each_mem": cheer_on_each_mem,
-                })
+            available_actions.append({
+                "action_type": GameAction.MainStepPlaySupport,
+                "card_id": card["game_card_id"],
+                "play_requirements": play_requirements,
+                "cheer_on_each_mem": cheer_on_each_mem,
+            })
 
         # G. Pass the baton
         # If center holomem is not resting, can swap with a back who is not resting by archiving Cheer.
@@ -286,31 +305,15 @@ class TurnMixin:
         if len(active_player.center) > 0:
             center_mem = active_player.center[0]
             cheer_on_mem = center_mem["attached_cheer"]
-            baton_cost = center_mem["baton_cost"]
-            # Apply baton cost reductions from turn effects
-            reduce_cost_effects = active_player.get_effects_at_timing("on_baton_cost_check", center_mem, "")
-            for effect in reduce_cost_effects:
-                if effect["effect_type"] == EffectType.EffectType_ReduceBatonCost:
-                    # Check if this effect targets the center member
-                    conditions = effect.get("conditions", [])
-                    target_matches = True
-                    for cond in conditions:
-                        if cond.get("condition") == "this_card_is_target":
-                            required_id = cond.get("required_id", "")
-                            if required_id != center_mem["game_card_id"]:
-                                target_matches = False
-                                break
-                    if not target_matches:
-                        continue
-                    reduction_amount = effect.get("amount", 0)
-                    baton_cost = max(0, baton_cost - reduction_amount)
             if active_player.can_move_front_stage() and not active_player.baton_pass_this_turn and \
-                not is_card_resting(center_mem) and len(cheer_on_mem) >= baton_cost:
+                not is_card_resting(center_mem):
                 backstage_options = []
                 for card in active_player.backstage:
                     if not is_card_resting(card):
                         backstage_options.append(card["game_card_id"])
-                if backstage_options:
+                # The cost needs an effect lookup, so only work it out if a pass is otherwise possible.
+                baton_cost = self.get_baton_cost(active_player, center_mem) if backstage_options else 0
+                if backstage_options and len(cheer_on_mem) >= baton_cost:
                     available_actions.append({
                         "action_type": GameAction.MainStepBatonPass,
                         "center_id": center_mem["game_card_id"],
@@ -332,6 +335,27 @@ class TurnMixin:
 
         return available_actions
 
+    def get_baton_cost(self, player, center_mem):
+        baton_cost = center_mem["baton_cost"]
+        # Apply baton cost reductions from turn effects
+        reduce_cost_effects = player.get_effects_at_timing("on_baton_cost_check", center_mem, "")
+        for effect in reduce_cost_effects:
+            if effect["effect_type"] == EffectType.EffectType_ReduceBatonCost:
+                # Check if this effect targets the center member
+                conditions = effect.get("conditions", [])
+                target_matches = True
+                for cond in conditions:
+                    if cond.get("condition") == "this_card_is_target":
+                        required_id = cond.get("required_id", "")
+                        if required_id != center_mem["game_card_id"]:
+                            target_matches = False
+                            break
+                if not target_matches:
+                    continue
+                reduction_amount = effect.get("amount", 0)
+                baton_cost = max(0, baton_cost - reduction_amount)
+        return baton_cost
+
     def send_main_step_actions(self):
         # Determine available actions.
         available_actions = self.get_available_mainstep_actions()
@@ -409,9 +433,7 @@ class TurnMixin:
         }
         self.broadcast_event(end_turn_event)
 
-        self.reset_step_replace_center(lambda :
-            self.begin_player_turn(switch_active_player=switch_player)
-        )
+        self.reset_step_replace_center(Continuation(self, "begin_player_turn", switch_player))
 
     def send_performance_step_actions(self):
         # Determine available actions.
@@ -573,27 +595,29 @@ class TurnMixin:
                     add_ids_to_effects(gift_effects, opponent_player.player_id, holomem["game_card_id"])
                     opponent_effects.extend(gift_effects)
 
-            def after_all_perf_start_effects():
-                self.in_performance_step_start_effects = False
-                self.continue_performance_step()
-
-            def after_active_effects():
-                if opponent_effects:
-                    self.begin_resolving_effects(opponent_effects, after_all_perf_start_effects)
-                else:
-                    after_all_perf_start_effects()
-
             if active_effects or opponent_effects:
                 self.in_performance_step_start_effects = True
             if active_effects:
-                self.begin_resolving_effects(active_effects, after_active_effects)
+                self.begin_resolving_effects(active_effects, Continuation(self, "resolve_opponent_performance_step_start_effects", opponent_effects))
                 return
             elif opponent_effects:
-                self.begin_resolving_effects(opponent_effects, after_all_perf_start_effects)
+                self.begin_resolving_effects(opponent_effects, Continuation(self, "finish_performance_step_start_effects"))
                 return
 
         self.continue_performance_step()
 
+    @continuation_step
+    def resolve_opponent_performance_step_start_effects(self, opponent_effects):
+        if opponent_effects:
+            self.begin_resolving_effects(opponent_effects, Continuation(self, "finish_performance_step_start_effects"))
+        else:
+            self.finish_performance_step_start_effects()
+
+    @continuation_step
+    def finish_performance_step_start_effects(self):
+        self.in_performance_step_start_effects = False
+        self.continue_performance_step()
+
     def continue_performance_step(self):
         if self.performance_artstatboosts.repeat_art and self.performance_target_card["damage"] < self.performance_target_player.get_card_hp(self.performance_target_card):
             self.begin_perform_art(
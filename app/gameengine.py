@@ -1,5 +1,6 @@
 from typing import List, Dict, Any
 from app.card_database import CardDatabase
+import os
 import random
 from copy import deepcopy
 import traceback
@@ -19,19 +20,32 @@ from app.engine.effect_mixin import EffectMixin
 from app.engine.action_handler_mixin import ActionHandlerMixin
 
 
+# Set up when the game is created and only read after, so clones share them.
+CLONE_SHARED_FIELDS = ("match_player_info", "all_game_cards_map")
+CLONE_SHARED_PLAYER_FIELDS = ("deck_list", "cheer_deck_list", "game_cards_map")
+# Event and message history that a clone can leave behind.
+CLONE_HISTORY_FIELDS = ("all_events", "all_game_messages", "observer_event_log", "latest_events", "latest_observer_events")
+
 class GameEngine(GameFlowMixin, TurnMixin, CombatMixin, ConditionMixin, EffectMixin, ActionHandlerMixin):
     def __init__(self,
         card_db:CardDatabase,
         game_type : str,
         player_infos : List[Dict[str, Any]],
+        headless : bool = False,
     ):
         self.phase = GamePhase.Initializing
+        # For AI vs AI simulations: no event history, observer events or per-player copies.
+        # Only decision events are sent, to the player who has to decide.
+        # The game can still be rebuilt in full from the seed and all_game_messages.
+        self.headless = headless
         self.game_first_turn = True
         self.card_db = card_db
         self.latest_events = []
         self.latest_observer_events = []
         self.all_game_messages = []
         self.all_events = []
+        # Sanitized copy of every broadcast event, used to catch up observers.
+        self.observer_event_log = []
         self.game_over_event = {}
         self.current_decision = None
         self.effect_resolution_state = None
@@ -57,6 +71,8 @@ class GameEngine(GameFlowMixin, TurnMixin, CombatMixin, ConditionMixin, EffectMi
         self.current_clock_player_id = None
         self.clock_accumulation_start_time = 0
         self.match_player_info = player_infos
+        # Compare the card location index against full scans after every message.
+        self.debug_card_index = os.getenv("DEBUG_CARD_INDEX", "false").lower() == "true"
         self.last_chosen_holomem_id = ""
         
         # 블룸 출처 추적을 위한 변수
@@ -109,6 +125,25 @@ class GameEngine(GameFlowMixin, TurnMixin, CombatMixin, ConditionMixin, EffectMi
         }
         return match_data
 
+    def clone(self, keep_history=True):
+        """Returns an independent copy of the game in its current state.
+
+        The card database and card definitions are shared, zones, cards and flags are copied.
+        Without keep_history the copy starts with no events or game messages (so its
+        event numbers start over), which is much faster for lookahead that only cares
+        about the game state.
+        """
+        memo = {id(self.card_db): self.card_db}
+        for field in CLONE_SHARED_FIELDS:
+            memo[id(getattr(self, field))] = getattr(self, field)
+        for player_state in self.player_states:
+            for field in CLONE_SHARED_PLAYER_FIELDS:
+                memo[id(getattr(player_state, field))] = getattr(player_state, field)
+        if not keep_history:
+            for field in CLONE_HISTORY_FIELDS:
+                memo[id(getattr(self, field))] = []
+        return copy_game_state(self, memo)
+
     def set_random_test_hook(self, random_override):
         self.test_random_override = random_override
 
@@ -141,23 +176,21 @@ class GameEngine(GameFlowMixin, TurnMixin, CombatMixin, ConditionMixin, EffectMi
         return self.phase == GamePhase.GameOver
 
     def find_card(self, game_card_id):
-        for player_state in self.player_states:
-            card, _, _ = player_state.find_card(game_card_id)
-            if not card:
-                for holomem in player_state.get_holomem_on_stage():
-                    for attachment in holomem["attached_support"]:
-                        if attachment["game_card_id"] == game_card_id:
-                            card = attachment
-                            return card
-                    for cheer in holomem["attached_cheer"]:
-                        if cheer["game_card_id"] == game_card_id:
-                            card = cheer
-                            return card
-                    for stacked in holomem["stacked_cards"]:
-                        if stacked["game_card_id"] == game_card_id:
-                            card = stacked
-                            return card
-            else:
+        # Ask the card's owner first, so the other player's index never misses and scans every zone for it.
+        # Cards made during the game aren't in game_cards_map, those still try each player.
+        player_states = self.player_states
+        if game_card_id in player_states[1].game_cards_map:
+            player_states = [player_states[1], player_states[0]]
+        for player_state in player_states:
+            card, _, _ = player_state.find_card(game_card_id, include_stacked_cards=True)
+            if card:
                 return card
-        if not card:
-            raise Exception(f"Card not found: {game_card_id}")
+        raise Exception(f"Card not found: {game_card_id}")
+
+    def check_card_indexes(self):
+        errors = []
+        for player_state in self.player_states:
+            errors.extend(player_state.check_card_index())
+        for error in errors:
+            logger.error(f"Card index mismatch: {error}")
+        return errors
@@ -2,11 +2,14 @@ import traceback
 import json
 import os
 import time
-from typing import List
-from app.playermanager import Player
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from app.playermanager import Player, serialize_event_data, build_game_event_messages
 from app.gameengine import GameEngine, GameAction, EventType
 from app.card_database import CardDatabase
 from app.aiplayer import AIPlayer, DefaultAIDeck, get_ai_deck_by_name
+from app.mcts_ai import MCTSAIPlayer
 from app.dbaccess import upload_match_to_blob_storage
 import logging
 logger = logging.getLogger(__name__)
@@ -15,6 +18,23 @@ logger = logging.getLogger(__name__)
 EMOTE_COOLDOWN_MS = 2000  # 2초 쿨다운
 VALID_EMOTE_IDS = [0, 1, 2, 3, 4]  # 허용된 감정표현 ID
 
+# Observers catch up on a match this many events at a time.
+OBSERVER_CATCHUP_PAGE_SIZE = 50
+
+# AI player class by the ai_strength the player asked for.
+AI_PLAYER_TIERS = {
+    "normal": AIPlayer,
+    "strong": MCTSAIPlayer,
+}
+
+# AI moves are computed on a thread of the room's own so a search never holds up the event loop,
+# and a slow or stuck move in one room never waits on or blocks another room's.
+# The strong AI's search itself runs in its own process pool (see app/mcts_ai.py).
+# Past this (counted from when the move starts running) the room cancels the AI's search and takes its greedy move instead.
+AI_MOVE_TIMEOUT_SECONDS = float(os.getenv("AI_MOVE_TIMEOUT_SECONDS", "10"))
+# A cancelled move that still hasn't finished after this is stuck, and the AI resigns.
+AI_MOVE_CANCEL_TIMEOUT_SECONDS = float(os.getenv("AI_MOVE_CANCEL_TIMEOUT_SECONDS", "5"))
+
 class GameRoom:
     def __init__(self, room_id : str, room_name : str, players : List[Player], game_type : str, queue_name : str):
         self.room_id = room_id
@@ -22,11 +42,20 @@ class GameRoom:
         self.players = players
         self.observers : List[Player] = []
         self.ai_player = None
+        # Created when the game starts.
+        self.engine : GameEngine = None
+        # Set on resign or disconnect, the AI makes no more moves.
+        self.ai_moves_stopped = False
+        self.ai_move_executor : ThreadPoolExecutor = None
+        # Only one game message (and the AI moves that follow it) is processed at a time.
+        self.engine_lock = asyncio.Lock()
         self.game_type = game_type
         self.queue_name = queue_name
         self.cleanup_room = False
         # 감정표현 쿨다운 추적
         self.player_emote_cooldowns = {}
+        # Encoded observer catch up events, shared by every observer that joins.
+        self.serialized_observer_catchup = []
         for player in self.players:
             player.current_game_room = self
 
@@ -50,7 +79,9 @@ class GameRoom:
         player_info = [player.get_player_game_info() for player in self.players]
         if self.is_ai_game():
             logger.info(f"AI GAME: Creating AI player for game {self.room_id}")
-            self.ai_player = AIPlayer(player_id="aiplayer" + self.players[0].player_id)
+            ai_strength = getattr(self.players[0], "ai_strength", "normal")
+            ai_player_class = AI_PLAYER_TIERS.get(ai_strength, AIPlayer)
+            self.ai_player = ai_player_class(player_id="aiplayer" + self.players[0].player_id)
             ai_custom_deck = getattr(self.players[0], "ai_custom_deck", None)
             if ai_custom_deck:
                 ai_deck = ai_custom_deck
@@ -66,44 +97,54 @@ class GameRoom:
             player_infos=player_info,
             game_type=self.game_type
         )
+        if isinstance(self.ai_player, MCTSAIPlayer):
+            # The search plays out copies of the live game.
+            self.ai_player.set_engine(self.engine)
 
-        self.engine.begin_game()
-        events = self.engine.grab_events()
-        await self.send_events(events)
-        observer_events = self.engine.grab_observer_events()
-        await self.send_observer_events(observer_events)
+        async with self.engine_lock:
+            self.engine.begin_game()
+            events = self.engine.grab_events()
+            await self.send_events(events)
+            observer_events = self.engine.grab_observer_events()
+            await self.send_observer_events(observer_events)
 
-        if self.is_ai_game():
-            logger.info(f"AI GAME: Processing AI actions for game {self.room_id}")
-            # In case the AI has to mulligan first!
-            ai_performing_action, ai_action = self.ai_player.ai_process_events(events)
-            logger.info(f"AI GAME: AI action result - performing: {ai_performing_action}, action: {ai_action}")
-            #logger.info("AI Action: %s %s" % (ai_performing_action, ai_action))
-            if ai_performing_action:
-                player_id = self.ai_player.player_id
-                action_type = ai_action["action_type"]
-                action_data = ai_action["action_data"]
-
-                await self.handle_game_message(player_id, action_type, action_data)
+            if self.is_ai_game():
+                logger.info(f"AI GAME: Processing AI actions for game {self.room_id}")
+                # In case the AI has to mulligan first!
+                ai_performing_action, ai_action = await self.get_ai_action(events)
+                logger.info(f"AI GAME: AI action result - performing: {ai_performing_action}, action: {ai_action}")
+                #logger.info("AI Action: %s %s" % (ai_performing_action, ai_action))
+                if ai_performing_action:
+                    player_id = self.ai_player.player_id
+                    action_type = ai_action["action_type"]
+                    action_data = ai_action["action_data"]
+
+                    await self.process_game_message(player_id, action_type, action_data)
+
+    async def send_events_to_players(self, players : List[Player], events):
+        # Encode each event once and build each message format at most once for all recipients.
+        players = [player for player in players if player.connected]
+        if not players or not events:
+            return
+        event_texts = [serialize_event_data(event) for event in events]
+        messages_by_mode = {}
+        for player in players:
+            if player.event_batching not in messages_by_mode:
+                messages_by_mode[player.event_batching] = build_game_event_messages(event_texts, player.event_batching)
+            for message in messages_by_mode[player.event_batching]:
+                await player.send_serialized_game_event(message)
 
     async def send_events(self, events):
-        for event in events:
-            for player in self.players:
-                if player.connected and player.player_id == event["event_player_id"]:
-                    await player.send_game_event(event)
+        for player in self.players:
+            player_events = [event for event in events if event["event_player_id"] == player.player_id]
+            await self.send_events_to_players([player], player_events)
 
     async def send_observer_events(self, events):
-        for event in events:
-            for player in self.observers:
-                if player.connected:
-                    await player.send_game_event(event)
+        await self.send_events_to_players(self.observers, events)
 
     async def send_emote_events(self, events):
         """감정표현 이벤트를 모든 플레이어에게 전송"""
-        for event in events:
-            for player in self.players:
-                if player.connected:
-                    await player.send_game_event(event)
+        await self.send_events_to_players(self.players, events)
 
     async def handle_game_message(self, player_id: str, action_type:str, action_data: dict):
         for observer in self.observers:
@@ -113,6 +154,15 @@ class GameRoom:
                 self.observers.remove(observer)
                 return
 
+        if self.is_ai_game() and action_type == GameAction.Resign and player_id != self.ai_player.player_id:
+            # Don't make a leaving player wait for the AI to finish thinking.
+            self.stop_ai_moves()
+
+        async with self.engine_lock:
+            await self.process_game_message(player_id, action_type, action_data)
+
+    async def process_game_message(self, player_id: str, action_type:str, action_data: dict):
+        """Plays the message and the AI moves that follow it. Call with engine_lock held."""
         if self.engine.is_game_over():
             logger.info(f"Room {self.room_id} already game over, ignoring message player {player_id} action {action_type} data {action_data}")
             return
@@ -129,7 +179,7 @@ class GameRoom:
             observer_events = self.engine.grab_observer_events()
             await self.send_observer_events(observer_events)
             if self.is_ai_game():
-                ai_performing_action, ai_action = self.ai_player.ai_process_events(events)
+                ai_performing_action, ai_action = await self.get_ai_action(events)
                 #logger.info("AI Action: %s %s" % (ai_performing_action, ai_action))
                 if ai_performing_action:
                     player_id = self.ai_player.player_id
@@ -147,8 +197,55 @@ class GameRoom:
                 if match_data["turn_number"] >= 0:
                     match_data["queue_name"] = self.queue_name
                     upload_match_to_blob_storage(match_data)
+            self.shutdown_ai_move_executor()
             self.cleanup_room = True
 
+    def get_ai_move_executor(self):
+        if self.ai_move_executor is None:
+            self.ai_move_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ai_move_{self.room_id}")
+        return self.ai_move_executor
+
+    def shutdown_ai_move_executor(self):
+        # A stuck move keeps its thread, but nothing else is queued behind it.
+        if self.ai_move_executor is not None:
+            self.ai_move_executor.shutdown(wait=False, cancel_futures=True)
+            self.ai_move_executor = None
+
+    async def get_ai_action(self, events):
+        """Runs the AI's move on an AI thread. Returns (performing_action, action) like ai_process_events."""
+        if self.ai_moves_stopped:
+            return False, None
+        loop = asyncio.get_running_loop()
+        move_started = asyncio.Event()
+        def process_events():
+            loop.call_soon_threadsafe(move_started.set)
+            return self.ai_player.ai_process_events(events)
+        future = loop.run_in_executor(self.get_ai_move_executor(), process_events)
+        # The time limit is for the move itself, not for waiting on the thread.
+        await move_started.wait()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=AI_MOVE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(f"AI GAME: AI move in room {self.room_id} took over {AI_MOVE_TIMEOUT_SECONDS}s, cancelling its search")
+            self.ai_player.cancel_move()
+            try:
+                result = await asyncio.wait_for(future, timeout=AI_MOVE_CANCEL_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                # The thread can't be stopped, so the AI resigns rather than keep the player waiting forever.
+                # That ends the game properly, the player gets the game over like any other resign.
+                logger.error(f"AI GAME: AI move in room {self.room_id} is stuck, the AI resigns")
+                self.stop_ai_moves()
+                self.shutdown_ai_move_executor()
+                return True, {"action_type": GameAction.Resign, "action_data": {}}
+        if self.ai_moves_stopped:
+            return False, None
+        return result
+
+    def stop_ai_moves(self):
+        self.ai_moves_stopped = True
+        if self.ai_player:
+            self.ai_player.stop_moves()
+
     async def handle_emote_message(self, player_id: str, emote_id: int):
         """감정표현 메시지 처리"""
         current_time = time.time() * 1000  # 밀리초 단위
@@ -168,14 +265,16 @@ class GameRoom:
         # 쿨다운 업데이트
         self.player_emote_cooldowns[player_id] = current_time
         
-        # 게임 엔진을 통해 감정표현 이벤트 생성
-        self.engine.handle_emote(player_id, emote_id)
-        
-        # 게임 엔진에서 생성된 이벤트들을 가져와서 브로드캐스트
-        events = self.engine.grab_events()
-        await self.send_emote_events(events)  # 감정표현 전용 전송 메서드 사용
-        observer_events = self.engine.grab_observer_events()
-        await self.send_observer_events(observer_events)
+        # The AI can be reading the engine on its own thread, wait for its move to finish.
+        async with self.engine_lock:
+            # 게임 엔진을 통해 감정표현 이벤트 생성
+            self.engine.handle_emote(player_id, emote_id)
+
+            # 게임 엔진에서 생성된 이벤트들을 가져와서 브로드캐스트
+            events = self.engine.grab_events()
+            await self.send_emote_events(events)  # 감정표현 전용 전송 메서드 사용
+            observer_events = self.engine.grab_observer_events()
+            await self.send_observer_events(observer_events)
         
         logger.info(f"Emote sent: player {player_id} sent emote {emote_id}")
 
@@ -188,16 +287,25 @@ class GameRoom:
 
         await self.observer_request_next_events(player, 0)
 
-    async def observer_request_next_events(self, player: Player, starting_event_index):
-        events = self.engine.get_observer_catchup_events()
+    def get_serialized_observer_catchup(self, starting_event_index, count):
+        # The observer log only grows, so encode each event the first time any observer needs it.
+        ending_event_index = min(starting_event_index + count, self.engine.get_observer_catchup_event_count())
+        cached_count = len(self.serialized_observer_catchup)
+        if ending_event_index > cached_count:
+            new_events = self.engine.get_observer_catchup_events(cached_count, ending_event_index - cached_count)
+            self.serialized_observer_catchup.extend(serialize_event_data(event) for event in new_events)
+        return self.serialized_observer_catchup[starting_event_index:ending_event_index]
 
-        # Only send the next 50 events.
-        ending_event_index = starting_event_index + 50
-        for event in events[starting_event_index:ending_event_index]:
-            await player.send_game_event(event)
+    async def observer_request_next_events(self, player: Player, starting_event_index):
+        # Only send the next page of events.
+        event_texts = self.get_serialized_observer_catchup(starting_event_index, OBSERVER_CATCHUP_PAGE_SIZE)
+        ending_event_index = starting_event_index + OBSERVER_CATCHUP_PAGE_SIZE
+        if event_texts:
+            for message in build_game_event_messages(event_texts, player.event_batching):
+                await player.send_serialized_game_event(message)
 
         # If this is the end, send the catch up event.
-        if ending_event_index >= len(events):
+        if ending_event_index >= self.engine.get_observer_catchup_event_count():
             await player.send_game_event({"event_type": EventType.EventType_ObserverCaughtUp})
 
 
@@ -220,4 +328,47 @@ class GameRoom:
         # TODO: Reconnect logic.
         # all_players_disconnected = all([not player.connected for player in self.players])
         # if all_players_disconnected:
-        #     self.cleanup_room = True
\ No newline at end of file
+        #     self.cleanup_room = True
+
+
+class GameRoomRegistry:
+    """Live game rooms indexed by room id and by the ids of the players and observers in them."""
+    def __init__(self):
+        self.rooms_by_id : Dict[str, GameRoom] = {}
+        self.rooms_by_player_id : Dict[str, GameRoom] = {}
+
+    def __iter__(self):
+        return iter(list(self.rooms_by_id.values()))
+
+    def __len__(self):
+        return len(self.rooms_by_id)
+
+    def add_room(self, room: GameRoom):
+        self.rooms_by_id[room.room_id] = room
+        for player in room.players:
+            self.rooms_by_player_id[player.player_id] = room
+
+    def remove_room(self, room: GameRoom):
+        self.rooms_by_id.pop(room.room_id, None)
+        for player in room.players + room.observers:
+            if self.rooms_by_player_id.get(player.player_id) is room:
+                del self.rooms_by_player_id[player.player_id]
+
+    def add_observer(self, room: GameRoom, player: Player):
+        # A player seated in a game who watches another keeps their own game as their room.
+        current_room = self.get_player_room(player)
+        if current_room is None or player not in current_room.players:
+            self.rooms_by_player_id[player.player_id] = room
+
+    def get_room(self, room_id: str):
+        return self.rooms_by_id.get(room_id)
+
+    def get_player_room(self, player: Player):
+        room = self.rooms_by_player_id.get(player.player_id)
+        if room is None:
+            return None
+        # Observers leave rooms on their own, so check the entry is still current.
+        if room.room_id in self.rooms_by_id and (player in room.players or player in room.observers):
+            return room
+        del self.rooms_by_player_id[player.player_id]
+        return None
@@ -0,0 +1,225 @@
+import csv
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from app.dbaccess import MATCH_LOG_EXTENSION, is_match_log_file, iter_match_log_records, match_store, MatchStore
+from app.engine.constants import EventType
+
+# Matches handed to a worker at a time.
+ANALYTICS_CHUNK_SIZE = 32
+
+COUNTER_FIELDS = [
+    "oshi_usage", "oshi_wins",
+    "deck_usage", "deck_wins",
+    "card_usage", "card_wins",
+    "card_plays", "card_play_wins",
+    "art_uses",
+    "games_reaching_turn", "games_ending_on_turn",
+    "damage_by_turn", "life_lost_by_turn", "downs_by_turn",
+    "matchup_games", "matchup_wins",
+]
+TOTAL_FIELDS = ["total_games", "first_player_wins", "total_turns", "total_time_used", "total_clocks"]
+
+def get_deck_key(player):
+    # This is a unique identifier for the deck.
+    parts = [player["oshi_id"]]
+    parts.extend(f"{card_id}:{count}" for card_id, count in player["deck"].items())
+    parts.extend(f"{card_id}:{count}" for card_id, count in player["cheer_deck"].items())
+    return ",".join(parts)
+
+class MatchStats:
+    """Counters for a set of matches. Stats from separate workers are combined with merge."""
+    def __init__(self):
+        for field in TOTAL_FIELDS:
+            setattr(self, field, 0)
+        for field in COUNTER_FIELDS:
+            setattr(self, field, Counter())
+
+    def merge(self, other : "MatchStats"):
+        for field in TOTAL_FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        for field in COUNTER_FIELDS:
+            getattr(self, field).update(getattr(other, field))
+        return self
+
+    def add_match(self, match_info, events):
+        """Adds one match from its header fields and an iterable of its events."""
+        player_info = match_info["player_info"]
+        winner = match_info["winner"]
+        starting_player = match_info["starting_player"]
+        first_turn_player = match_info.get("first_turn_player", starting_player)
+        turn_number = match_info["turn_number"]
+
+        self.total_games += 1
+        if first_turn_player == winner:
+            self.first_player_wins += 1
+        self.total_turns += turn_number
+        self.total_time_used += sum(match_info["player_clocks"])
+        self.total_clocks += len(match_info["player_clocks"])
+        self.games_ending_on_turn[turn_number] += 1
+        for turn in range(turn_number + 1):
+            self.games_reaching_turn[turn] += 1
+
+        winners = set()
+        for player in player_info:
+            oshi_id = player["oshi_id"]
+            won = player["username"] == winner
+            if won and "player_id" in player:
+                winners.add(player["player_id"])
+            deck_key = get_deck_key(player)
+            self.oshi_usage[oshi_id] += 1
+            self.deck_usage[deck_key] += 1
+            for card_id in player["deck"]:
+                self.card_usage[card_id] += 1
+            if won:
+                self.oshi_wins[oshi_id] += 1
+                self.deck_wins[deck_key] += 1
+                for card_id in player["deck"]:
+                    self.card_wins[card_id] += 1
+
+        if len(player_info) == 2:
+            first_oshi, second_oshi = player_info[0]["oshi_id"], player_info[1]["oshi_id"]
+            self.matchup_games[(first_oshi, second_oshi)] += 1
+            self.matchup_games[(second_oshi, first_oshi)] += 1
+            if player_info[0]["username"] == winner:
+                self.matchup_wins[(first_oshi, second_oshi)] += 1
+            elif player_info[1]["username"] == winner:
+                self.matchup_wins[(second_oshi, first_oshi)] += 1
+
+        self.add_events(events, match_info.get("all_game_cards_map", {}), winners)
+
+    def add_events(self, events, game_cards_map, winners):
+        turn = 0
+        for event in events:
+            event_type = event.get("event_type")
+            if event_type == EventType.EventType_TurnStart:
+                turn = event["turn_count"]
+            elif event_type == EventType.EventType_PlaySupportCard:
+                self.add_card_play(game_cards_map.get(event["card_id"]), event["player_id"], winners)
+            elif event_type == EventType.EventType_Bloom:
+                self.add_card_play(game_cards_map.get(event["bloom_card_id"]), event["bloom_player_id"], winners)
+            elif event_type == EventType.EventType_PerformArt:
+                card_id = game_cards_map.get(event["performer_id"])
+                if card_id:
+                    self.art_uses[(card_id, event["art_id"])] += 1
+            elif event_type == EventType.EventType_DamageDealt:
+                self.damage_by_turn[turn] += event["damage"]
+            elif event_type == EventType.EventType_LifeDamageDealt:
+                self.life_lost_by_turn[turn] += event["life_lost"]
+            elif event_type == EventType.EventType_DownedHolomem:
+                self.downs_by_turn[turn] += 1
+
+    def add_card_play(self, card_id, player_id, winners):
+        if not card_id:
+            return
+        self.card_plays[card_id] += 1
+        if player_id in winners:
+            self.card_play_wins[card_id] += 1
+
+    def get_summary_tables(self):
+        """Returns each summary as columns: {table name: {column name: [values]}}."""
+        total_oshi_usage = sum(self.oshi_usage.values())
+        tables = {}
+        tables["oshi"] = rate_table("oshi_id", self.oshi_usage, self.oshi_wins, total_oshi_usage)
+        tables["deck"] = rate_table("deck", self.deck_usage, self.deck_wins, self.total_games)
+        tables["card"] = rate_table("card_id", self.card_usage, self.card_wins, self.total_games * 2)
+        tables["card_plays"] = rate_table("card_id", self.card_plays, self.card_play_wins, sum(self.card_plays.values()))
+        art_keys = sorted(self.art_uses, key=lambda key: -self.art_uses[key])
+        tables["arts"] = {
+            "card_id": [card_id for card_id, _ in art_keys],
+            "art_id": [art_id for _, art_id in art_keys],
+            "uses": [self.art_uses[key] for key in art_keys],
+        }
+        turns = sorted(self.games_reaching_turn)
+        tables["turns"] = {
+            "turn": turns,
+            "games_reaching_turn": [self.games_reaching_turn[turn] for turn in turns],
+            "games_ending_on_turn": [self.games_ending_on_turn[turn] for turn in turns],
+            "average_damage": [self.damage_by_turn[turn] / self.games_reaching_turn[turn] for turn in turns],
+            "average_life_lost": [self.life_lost_by_turn[turn] / self.games_reaching_turn[turn] for turn in turns],
+            "average_downs": [self.downs_by_turn[turn] / self.games_reaching_turn[turn] for turn in turns],
+        }
+        matchups = sorted(self.matchup_games)
+        tables["matchups"] = {
+            "oshi_id": [oshi_id for oshi_id, _ in matchups],
+            "opponent_oshi_id": [opponent for _, opponent in matchups],
+            "games": [self.matchup_games[key] for key in matchups],
+            "wins": [self.matchup_wins[key] for key in matchups],
+            "win_percentage": [self.matchup_wins[key] / self.matchup_games[key] * 100 for key in matchups],
+        }
+        return tables
+
+def rate_table(key_name, usage, wins, usage_total):
+    # Sorted by win percentage, highest first.
+    keys = sorted(usage, key=lambda key: -(wins[key] / usage[key]))
+    return {
+        key_name: keys,
+        "win_percentage": [wins[key] / usage[key] * 100 for key in keys],
+        "usage_percentage": [usage[key] / usage_total * 100 if usage_total else 0 for key in keys],
+        "wins": [wins[key] for key in keys],
+        "count": [usage[key] for key in keys],
+    }
+
+def add_match_file(stats : MatchStats, file_path):
+    if file_path.endswith(MATCH_LOG_EXTENSION):
+        # Events are counted as they are read, the match is never held in memory all at once.
+        records = iter_match_log_records(file_path)
+        _, match_info = next(records)
+        stats.add_match(match_info, (value for record_type, value in records if record_type == "event"))
+    else:
+        with open(file_path, "r", encoding="utf-8") as f:
+            match_data = json.load(f)
+        stats.add_match(match_data, match_data["all_events"])
+
+def analyze_file_chunk(file_paths):
+    stats = MatchStats()
+    for file_path in file_paths:
+        add_match_file(stats, file_path)
+    return stats
+
+def analyze_store_chunk(store_dir, rows):
+    store = MatchStore(store_dir)
+    stats = MatchStats()
+    for row in rows:
+        match_data = store.read_match(row)
+        stats.add_match(match_data, match_data["all_events"])
+    return stats
+
+def run_chunks(analyze_chunk, chunks, workers=None):
+    stats = MatchStats()
+    if workers == 1:
+        for chunk in chunks:
+            stats.merge(analyze_chunk(chunk))
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_stats in executor.map(analyze_chunk, chunks):
+            stats.merge(chunk_stats)
+    return stats
+
+def split_chunks(items, chunk_size=ANALYTICS_CHUNK_SIZE):
+    return [items[index:index + chunk_size] for index in range(0, len(items), chunk_size)]
+
+def analyze_match_files(match_logs_dir, workers=None):
+    """Analyzes every loose .json or .ndjson.gz match log in a directory using all cores."""
+    file_paths = [
+        os.path.join(match_logs_dir, file_name)
+        for file_name in sorted(os.listdir(match_logs_dir))
+        if is_match_log_file(file_name) and not file_name.startswith("segment_")
+    ]
+    return run_chunks(analyze_file_chunk, split_chunks(file_paths), workers)
+
+def analyze_match_store(store : MatchStore = None, workers=None, **filters):
+    """Analyzes the matches in the store that fit MatchStore.find_matches filters."""
+    store = store or match_store
+    rows = [dict(row) for row in store.find_matches(**filters)]
+    return run_chunks(partial(analyze_store_chunk, store.get_store_dir()), split_chunks(rows), workers)
+
+def write_summary_tables(tables, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    for table_name, columns in tables.items():
+        with open(os.path.join(output_dir, f"{table_name}.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*columns.values()))
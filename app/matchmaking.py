@@ -1,5 +1,6 @@
 from app.gameroom import GameRoom
 from app.playermanager import Player
+from typing import Dict
 import uuid
 import logging
 logger = logging.getLogger(__name__)
@@ -70,52 +71,67 @@ class Matchmaking:
     def __init__(self):
         main_queue = MatchQueue("main_matchmaking_normal", custom_game=False, game_type="versus")
         ai_queue = MatchQueue("main_matchmaking_ai", custom_game=False, game_type="ai")
-        self.all_queues = [main_queue, ai_queue]
+        # Queues by name, in the order they are listed to clients.
+        self.all_queues : Dict[str, MatchQueue] = {
+            main_queue.queue_name: main_queue,
+            ai_queue.queue_name: ai_queue,
+        }
+        # Player id to the queue they are waiting in.
+        self.player_queues : Dict[str, MatchQueue] = {}
 
     def is_game_type_valid(self, game_type: str):
         return game_type in GameTypeInfo
 
     def get_player_queue(self, player: Player):
-        for queue in self.all_queues:
-            if player in queue.players:
-                return queue.queue_name
+        queue = self.player_queues.get(player.player_id)
+        if queue:
+            return queue.queue_name
         return None
 
     def add_player_to_queue(self, player: Player, queue_name: str, custom_game: bool, game_type: str):
         logger.info(f"MATCHMAKING: Adding player {player.get_username()} to queue {queue_name} (game_type: {game_type})")
-        for queue in self.all_queues:
-            if queue.queue_name == queue_name:
-                logger.info(f"MATCHMAKING: Found queue {queue_name}, adding player")
-                room = queue.add_player(player)
-                if room:
-                    logger.info(f"MATCHMAKING: Created room {room.room_id} for queue {queue_name}")
-                    if queue.custom_game:
-                        self.all_queues.remove(queue)
-                    return room
-                logger.info(f"MATCHMAKING: Player added to queue {queue_name}, waiting for more players")
-                return None
+        queue = self.all_queues.get(queue_name)
+        if queue:
+            logger.info(f"MATCHMAKING: Found queue {queue_name}, adding player")
+            room = self.add_player_to_match_queue(queue, player)
+            if room:
+                logger.info(f"MATCHMAKING: Created room {room.room_id} for queue {queue_name}")
+                if queue.custom_game:
+                    del self.all_queues[queue_name]
+                return room
+            logger.info(f"MATCHMAKING: Player added to queue {queue_name}, waiting for more players")
+            return None
 
         if custom_game:
             logger.info(f"MATCHMAKING: Creating custom game queue {queue_name}")
             # The user is creating a new custom game.
             new_queue = MatchQueue(queue_name, game_type=game_type, custom_game=True)
-            room = new_queue.add_player(player)
+            room = self.add_player_to_match_queue(new_queue, player)
             if room:
                 return room
             else:
-                self.all_queues.append(new_queue)
+                self.all_queues[queue_name] = new_queue
         return None
 
+    def add_player_to_match_queue(self, queue: MatchQueue, player: Player):
+        self.player_queues[player.player_id] = queue
+        room = queue.add_player(player)
+        if room:
+            # Everyone waiting went into the match.
+            for room_player in room.players:
+                self.player_queues.pop(room_player.player_id, None)
+        return room
+
     def remove_player_from_queue(self, player: Player):
-        for queue in self.all_queues:
-            if player in queue.players:
-                queue.remove_player(player)
-                if not queue.custom_game and len(queue.players) == 0:
-                    self.all_queues.remove(queue)
+        queue = self.player_queues.pop(player.player_id, None)
+        if queue and player in queue.players:
+            queue.remove_player(player)
+            if not queue.custom_game and len(queue.players) == 0:
+                self.all_queues.pop(queue.queue_name, None)
 
     def get_queue_info(self):
         queue_info = []
-        for queue in self.all_queues:
+        for queue in self.all_queues.values():
             queue_info.append({
                 "queue_name": queue.queue_name,
                 "custom_game": queue.custom_game,
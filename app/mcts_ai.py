@@ -0,0 +1,366 @@
+import json
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from copy import deepcopy
+from app.aiplayer import AIPlayer
+from app.engine.snapshot import save_engine_snapshot, load_engine_snapshot
+from app.gameengine import GameEngine, GameAction, EventType
+from app.selfplay import get_worker_card_db
+import logging
+logger = logging.getLogger(__name__)
+
+# Seconds of search per move, and the hard cap on how long a move can take
+# including waiting for the worker pool. Past the cap the AI plays the greedy move.
+MCTS_TIME_BUDGET = float(os.getenv("MCTS_TIME_BUDGET", "1.0"))
+MCTS_MAX_MOVE_SECONDS = float(os.getenv("MCTS_MAX_MOVE_SECONDS", "2.0"))
+# Worker processes for root parallel search, 1 searches in this process.
+# Half the cores by default, so strong AI rooms leave the rest to the event loop and every other room.
+MCTS_WORKERS = int(os.getenv("MCTS_WORKERS", max(1, (os.cpu_count() or 1) // 2)))
+# Rollouts stop this many turns past the searched move and score the position.
+MCTS_ROLLOUT_TURNS = int(os.getenv("MCTS_ROLLOUT_TURNS", "4"))
+MCTS_ROLLOUT_MAX_MESSAGES = 500
+MCTS_EXPLORATION = 0.7
+# Time kept back from the cap for sending the snapshot and merging results.
+MCTS_MOVE_OVERHEAD_SECONDS = 0.2
+# How often a move waiting on the worker pool checks whether it was cancelled.
+MCTS_CANCEL_POLL_SECONDS = 0.05
+
+# Decisions the search picks, everything else is played by the greedy AI.
+SEARCH_DECISION_EVENTS = [
+    EventType.EventType_Decision_MainStep,
+    EventType.EventType_Decision_PerformanceStep,
+]
+
+def get_decision_moves(available_actions):
+    """Turns the available actions of a main step or performance step into complete game messages.
+
+    Actions with extra choices get one move per option (baton pass targets, art targets).
+    Cheer paid for costs is the first that fits, like the greedy AI.
+    """
+    moves = []
+    for action in available_actions:
+        action_type = action["action_type"]
+        match action_type:
+            case GameAction.MainStepPlaceHolomem | GameAction.MainStepCollab:
+                moves.append((action_type, {"card_id": action["card_id"]}))
+            case GameAction.MainStepBloom:
+                moves.append((action_type, {"card_id": action["card_id"], "target_id": action["target_id"]}))
+            case GameAction.MainStepOshiSkill:
+                moves.append((action_type, {"skill_id": action["skill_id"]}))
+            case GameAction.MainStepSpecialAction:
+                moves.append((action_type, {"effect_id": action["effect_id"], "card_id": action["card_id"]}))
+            case GameAction.MainStepPlaySupport:
+                action_data = {"card_id": action["card_id"]}
+                play_requirements = action.get("play_requirements") or {}
+                if play_requirements:
+                    all_cheer = [cheer_id for cheer_ids in action["cheer_on_each_mem"].values() for cheer_id in cheer_ids]
+                    for requirement_name, requirement_detail in play_requirements.items():
+                        if requirement_name != "cheer_to_archive_from_play" or len(all_cheer) < requirement_detail["length"]:
+                            break
+                        action_data[requirement_name] = all_cheer[:requirement_detail["length"]]
+                    else:
+                        moves.append((action_type, action_data))
+                else:
+                    moves.append((action_type, action_data))
+            case GameAction.MainStepBatonPass:
+                for card_id in action["backstage_options"]:
+                    moves.append((action_type, {"card_id": card_id, "cheer_ids": action["available_cheer"][:action["cost"]]}))
+            case GameAction.PerformanceStepUseArt:
+                for target_id in action["valid_targets"]:
+                    moves.append((action_type, {"performer_id": action["performer_id"], "art_id": action["art_id"], "target_id": target_id}))
+            case _:
+                moves.append((action_type, {}))
+    # The same support card can be in hand twice, only search it once.
+    unique_moves = {}
+    for action_type, action_data in moves:
+        unique_moves.setdefault(get_move_key(action_type, action_data), (action_type, action_data))
+    return unique_moves
+
+def get_move_key(action_type, action_data):
+    return action_type + json.dumps(action_data, sort_keys=True)
+
+def redeal_hidden_cards(player, zone_names, random_gen : random.Random):
+    # Shuffle the cards of these zones together and deal them back out in the same counts.
+    pool = []
+    for zone_name in zone_names:
+        pool.extend(player.get_zone_by_name(zone_name))
+    random_gen.shuffle(pool)
+    for zone_name in zone_names:
+        zone = player.get_zone_by_name(zone_name)
+        count = len(zone)
+        zone[:] = pool[:count]
+        del pool[:count]
+        for position, card in enumerate(zone):
+            player.index_card(card, zone_name, position=position)
+
+def determinize(engine : GameEngine, player_id, random_gen : random.Random):
+    """A headless copy of the game where everything player_id can't see is guessed.
+
+    The opponent's hand, both decks, holopower, cheer decks and life are dealt again at
+    random from the cards that could be there, and the engine gets a new random seed.
+    Cards that were revealed and then hidden again are not tracked.
+    """
+    clone = engine.clone(keep_history=False)
+    clone.headless = True
+    clone.random_gen.seed(random_gen.getrandbits(64))
+    for player in clone.player_states:
+        if player.player_id == player_id:
+            redeal_hidden_cards(player, ["deck", "holopower"], random_gen)
+        else:
+            redeal_hidden_cards(player, ["hand", "deck", "holopower"], random_gen)
+        redeal_hidden_cards(player, ["cheer_deck", "life"], random_gen)
+    return clone
+
+def get_search_moves(events, player_id):
+    for event in events:
+        if event["event_player_id"] == player_id and event["event_type"] in SEARCH_DECISION_EVENTS and event["active_player"] == player_id:
+            return get_decision_moves(event["available_actions"])
+    return None
+
+def evaluate_position(engine : GameEngine, player_id):
+    """1 for a win, 0 for a loss, otherwise scored by the share of life each player has lost."""
+    if engine.is_game_over():
+        return 1.0 if engine.game_over_event["winner_id"] == player_id else 0.0
+    player = engine.get_player(player_id)
+    opponent = engine.other_player(player_id)
+    life_lost = 1 - len(player.life) / max(1, player.oshi_card["life"])
+    opponent_life_lost = 1 - len(opponent.life) / max(1, opponent.oshi_card["life"])
+    return 0.5 + (opponent_life_lost - life_lost) / 2
+
+class MCTSNode:
+    __slots__ = ("action_type", "action_data", "children", "visits", "value", "availability")
+
+    def __init__(self, action_type=None, action_data=None):
+        self.action_type = action_type
+        self.action_data = action_data
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+        # Determinizations where this move could be played, for the exploration term.
+        self.availability = 0
+
+    def get_ucb(self):
+        if not self.visits:
+            return math.inf
+        return self.value / self.visits + MCTS_EXPLORATION * math.sqrt(math.log(self.availability) / self.visits)
+
+def run_search_iteration(engine : GameEngine, player_id, root : MCTSNode, random_gen : random.Random, deadline):
+    """One determinization: select and expand through player_id's search decisions, then
+    play out with the greedy AI. Returns False if the deadline ran out first."""
+    game = determinize(engine, player_id, random_gen)
+    policies = {policy_id: AIPlayer(policy_id) for policy_id in game.player_ids}
+    last_turn = game.turn_number + MCTS_ROLLOUT_TURNS
+    node = root
+    path = [root]
+    in_tree = True
+    moves = get_decision_moves(game.current_decision["available_actions"])
+    events = []
+    while True:
+        if in_tree and moves:
+            for key in moves:
+                if key in node.children:
+                    node.children[key].availability += 1
+            untried = [key for key in moves if key not in node.children]
+            if untried:
+                key = random_gen.choice(untried)
+                child = MCTSNode(*moves[key])
+                child.availability = 1
+                node.children[key] = child
+                # Leave the tree after adding one node.
+                in_tree = False
+            else:
+                child = max((node.children[key] for key in moves), key=MCTSNode.get_ucb)
+            node = child
+            path.append(node)
+            game.handle_game_message(player_id, node.action_type, deepcopy(node.action_data))
+        else:
+            for policy_id, policy in policies.items():
+                performing_action, action = policy.ai_process_events(events)
+                if performing_action:
+                    game.handle_game_message(policy_id, action["action_type"], action["action_data"])
+                    break
+            else:
+                break
+        if game.is_game_over() or game.turn_number > last_turn or len(game.all_game_messages) >= MCTS_ROLLOUT_MAX_MESSAGES:
+            break
+        if time.time() > deadline:
+            return False
+        events = game.grab_events()
+        moves = get_search_moves(events, player_id) if in_tree else None
+
+    value = evaluate_position(game, player_id)
+    for visited in path:
+        visited.visits += 1
+        visited.value += value
+    return True
+
+def search_moves(engine : GameEngine, player_id, time_budget, seed, stop_event : threading.Event = None):
+    """Single observer MCTS from player_id's current decision.
+
+    Returns {move key: {"action_type", "action_data", "visits", "value"}} for the root moves.
+    Setting stop_event ends the search after the current iteration.
+    """
+    random_gen = random.Random(seed)
+    root = MCTSNode()
+    deadline = time.time() + time_budget
+    iterations = 0
+    while time.time() < deadline and not (stop_event and stop_event.is_set()):
+        try:
+            if run_search_iteration(engine, player_id, root, random_gen, deadline):
+                iterations += 1
+        except Exception as e:
+            # A guessed deal can hit engine paths the greedy AI can't play, skip it.
+            logger.debug(f"MCTS: Rollout failed: {e!r}")
+    logger.debug(f"MCTS: {iterations} iterations in {time_budget:.2f}s")
+    return {
+        key: {
+            "action_type": child.action_type,
+            "action_data": child.action_data,
+            "visits": child.visits,
+            "value": child.value,
+        }
+        for key, child in root.children.items()
+    }
+
+def search_snapshot_moves(task):
+    """Worker entry point for root parallel search."""
+    engine = load_engine_snapshot(task["snapshot"], get_worker_card_db())
+    return search_moves(engine, task["player_id"], task["time_budget"], task["seed"])
+
+def merge_move_stats(all_stats):
+    merged = {}
+    for stats in all_stats:
+        for key, move in stats.items():
+            if key in merged:
+                merged[key]["visits"] += move["visits"]
+                merged[key]["value"] += move["value"]
+            else:
+                merged[key] = dict(move)
+    return merged
+
+# Shared by every room so searches never start more processes than MCTS_WORKERS.
+mcts_executor : ProcessPoolExecutor = None
+
+def start_mcts_executor():
+    """Creates the search pool. The server calls this at startup, anything else gets it on first use.
+
+    Workers don't fork the server process, which has threads, held locks and listening sockets.
+    They come from a fork server (spawn where there is none) that only imports the engine.
+    """
+    global mcts_executor
+    if mcts_executor is None:
+        start_methods = multiprocessing.get_all_start_methods()
+        mp_context = multiprocessing.get_context("forkserver" if "forkserver" in start_methods else "spawn")
+        mcts_executor = ProcessPoolExecutor(max_workers=MCTS_WORKERS, mp_context=mp_context)
+    return mcts_executor
+
+def shutdown_mcts_executor():
+    global mcts_executor
+    if mcts_executor is not None:
+        mcts_executor.shutdown(wait=False, cancel_futures=True)
+        mcts_executor = None
+
+def get_mcts_executor():
+    return start_mcts_executor()
+
+class MCTSAIPlayer(AIPlayer):
+    """The strong AI. Main step and performance step moves come from a time limited
+    Monte Carlo tree search over the live engine, every other decision is the greedy AI's.
+    Needs the game engine, see set_engine.
+
+    Moves can be computed on another thread, cancel_move and stop_moves can be called from any thread.
+    """
+
+    def __init__(self, player_id: str, time_budget=MCTS_TIME_BUDGET, max_move_seconds=MCTS_MAX_MOVE_SECONDS, workers=MCTS_WORKERS):
+        super().__init__(player_id)
+        self.engine : GameEngine = None
+        self.time_budget = time_budget
+        self.max_move_seconds = max_move_seconds
+        self.workers = workers
+        self.search_random = random.Random()
+        # Set by cancel_move for the move in progress, every move gets a new one.
+        self.move_cancelled = threading.Event()
+        # Set by stop_moves, the greedy AI plays every move from then on.
+        self.moves_stopped = threading.Event()
+        self.greedy_handlers = {}
+        for event_type in SEARCH_DECISION_EVENTS:
+            self.greedy_handlers[event_type] = self.event_handlers[event_type]
+            self.event_handlers[event_type] = self._handle_search_decision
+
+    def set_engine(self, engine : GameEngine):
+        self.engine = engine
+
+    def ai_process_events(self, events):
+        self.move_cancelled = threading.Event()
+        return super().ai_process_events(events)
+
+    def cancel_move(self):
+        """Stops the search in progress, the greedy AI plays this move. For when the AI ran out of time."""
+        self.move_cancelled.set()
+
+    def stop_moves(self):
+        """Stops the search in progress and every later one. For when the game is ending (resign, disconnect)."""
+        self.moves_stopped.set()
+        self.move_cancelled.set()
+
+    def get_player_game_info(self):
+        return dict(super().get_player_game_info(), username="Strong AI")
+
+    def _handle_search_decision(self, event):
+        if self.player_id != event["active_player"]:
+            # Skip events that aren't meant for me to act.
+            return False, None, None
+
+        greedy_handler = self.greedy_handlers[event["event_type"]]
+        decision = self.engine.current_decision if self.engine else None
+        if not decision or decision["decision_player"] != self.player_id or self.moves_stopped.is_set():
+            return greedy_handler(event)
+        if len(get_decision_moves(event["available_actions"])) <= 1:
+            return greedy_handler(event)
+
+        move = self.choose_move()
+        if not move:
+            logger.info(f"MCTS: No search result in {self.max_move_seconds}s, using the greedy move")
+            return greedy_handler(event)
+        return True, move["action_type"], deepcopy(move["action_data"])
+
+    def choose_move(self):
+        """The most visited root move over all workers, or None if nothing finished in time
+        or the move was cancelled."""
+        start_time = time.time()
+        move_cancelled = self.move_cancelled
+        time_budget = max(0, min(self.time_budget, self.max_move_seconds - MCTS_MOVE_OVERHEAD_SECONDS))
+        if self.workers <= 1:
+            all_stats = [search_moves(self.engine, self.player_id, time_budget, self.search_random.getrandbits(32), move_cancelled)]
+        else:
+            snapshot = save_engine_snapshot(self.engine.clone(keep_history=False))
+            executor = get_mcts_executor()
+            futures = [
+                executor.submit(search_snapshot_moves, {
+                    "snapshot": snapshot,
+                    "player_id": self.player_id,
+                    "time_budget": time_budget,
+                    "seed": self.search_random.getrandbits(32),
+                })
+                for _ in range(self.workers)
+            ]
+            # Workers can't see move_cancelled, so wait in short steps and drop them if it is set.
+            deadline = start_time + self.max_move_seconds
+            done, not_done = set(), futures
+            while not_done and not move_cancelled.is_set() and time.time() < deadline:
+                newly_done, not_done = wait(not_done, timeout=min(MCTS_CANCEL_POLL_SECONDS, max(0, deadline - time.time())))
+                done |= newly_done
+            for future in not_done:
+                future.cancel()
+            all_stats = [future.result() for future in done if not future.exception()]
+        if move_cancelled.is_set():
+            return None
+        stats = merge_move_stats(all_stats)
+        if not stats:
+            return None
+        return max(stats.values(), key=lambda move: move["visits"])
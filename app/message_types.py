@@ -17,6 +17,16 @@ class ServerInfoMessage(Message):
     players_info: List[Dict]
     your_id : str
     your_username : str
+    lobby_version : int = 0
+
+@dataclass
+class ServerInfoDeltaMessage(Message):
+    lobby_version : int
+    queue_info: List[Dict]
+    players_updated: List[Dict]
+    players_removed: List[str]
+    rooms_updated: List[Dict]
+    rooms_removed: List[str]
 
 @dataclass
 class ErrorMessage(Message):
@@ -26,7 +36,8 @@ class ErrorMessage(Message):
 # Server Inbound Messages
 @dataclass
 class JoinServerMessage(Message):
-    pass
+    event_batching: bool = False
+    lobby_deltas: bool = False
 
 @dataclass
 class ObserveRoomMessage(Message):
@@ -48,6 +59,8 @@ class JoinMatchmakingQueueMessage(Message):
     ai_oshi_id: str = ""
     ai_deck: Optional[Dict[str, int]] = None
     ai_cheer_deck: Optional[Dict[str, int]] = None
+    # "normal" is the greedy AI, "strong" searches its moves.
+    ai_strength: str = "normal"
 
 @dataclass
 class LeaveMatchmakingQueueMessage(Message):
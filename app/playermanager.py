@@ -1,9 +1,28 @@
 import os
+import json
+import asyncio
 from fastapi import WebSocket
 from typing import Dict
-from app.message_types import ServerInfoMessage
+from app.message_types import ServerInfoMessage, ServerInfoDeltaMessage
 import random
 import time
+import logging
+logger = logging.getLogger(__name__)
+
+# Messages waiting to be written to one client before it is treated as too slow and disconnected.
+OUTBOUND_QUEUE_LIMIT = int(os.getenv("OUTBOUND_QUEUE_LIMIT", "1000"))
+
+# Lobby changes within this many seconds are sent as one update.
+LOBBY_BROADCAST_WINDOW = 0.1
+
+# Server wide counters for outbound traffic.
+outbound_metrics = {
+    "messages_queued": 0,
+    "messages_sent": 0,
+    "send_failures": 0,
+    "overflow_disconnects": 0,
+    "max_queue_depth": 0,
+}
 
 def generate_username(num_results=1):
     directory_path = os.path.dirname(__file__)
@@ -24,6 +43,19 @@ def generate_username(num_results=1):
 
     return usernames
 
+def serialize_event_data(event):
+    # Same encoding as WebSocket.send_json, so an event can be encoded once and sent to many players.
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+
+def build_game_event_messages(event_texts, batching):
+    # Wraps already encoded events in either one game_event_batch message or one game_event message each.
+    if batching:
+        return ['{"message_type":"game_event_batch","events":[' + ",".join(event_texts) + ']}']
+    return ['{"message_type":"game_event","event_data":' + event_text + '}' for event_text in event_texts]
+
+def serialize_game_event(event):
+    return build_game_event_messages([serialize_event_data(event)], False)[0]
+
 class Player:
     def __init__(self, player_id: str, websocket: WebSocket):
         self.player_id = player_id
@@ -33,12 +65,20 @@ class Player:
         self.username = generate_username(1)[0]
         self.queue_name = ""
         self.last_seen = time.time()
+        # Clients that opt in get all events from one action in a single game_event_batch message.
+        self.event_batching = False
+        self.outbound_queue : asyncio.Queue = None
+        self.writer_task : asyncio.Task = None
+        self.outbound_overflowed = False
+        # Clients that opt in get one lobby snapshot on join and then only server_info_delta messages.
+        self.lobby_deltas = False
 
         self.oshi_id = None
         self.deck = []
         self.cheer_deck = []
         self.ai_deck_name = "random"
         self.ai_custom_deck = None
+        self.ai_strength = "normal"
 
     def save_deck_info(self, oshi_id: str, deck: Dict[str, int], cheer_deck: Dict[str, int]):
         self.oshi_id = oshi_id
@@ -76,58 +116,172 @@ class Player:
         }
 
     async def send_game_event(self, event):
-        await self.websocket.send_json({
-            "message_type": "game_event",
-            "event_data": event
-        })
+        await self.send_serialized_game_event(serialize_game_event(event))
+
+    async def send_serialized_game_event(self, message: str):
+        self.queue_message(message)
+
+    async def send_message(self, message: dict):
+        self.queue_message(serialize_event_data(message))
+
+    def start_writer(self):
+        self.outbound_queue = asyncio.Queue()
+        self.writer_task = asyncio.create_task(self.write_outbound_messages())
+
+    def stop_writer(self):
+        if self.writer_task:
+            self.writer_task.cancel()
+            self.writer_task = None
+
+    def queue_message(self, message: str):
+        # Never waits on the socket; the writer task drains the queue.
+        if not self.connected or self.outbound_overflowed:
+            return
+        if self.writer_task is None:
+            # No writer running (not started or already stopped), so there is nobody to deliver it.
+            return
+        if self.outbound_queue.qsize() >= OUTBOUND_QUEUE_LIMIT:
+            self.handle_outbound_overflow()
+            return
+        self.outbound_queue.put_nowait(message)
+        outbound_metrics["messages_queued"] += 1
+        queue_depth = self.outbound_queue.qsize()
+        if queue_depth > outbound_metrics["max_queue_depth"]:
+            outbound_metrics["max_queue_depth"] = queue_depth
+
+    def handle_outbound_overflow(self):
+        logger.warning(f"Outbound queue full ({OUTBOUND_QUEUE_LIMIT}), disconnecting: {self.get_username()} - {self.player_id}")
+        outbound_metrics["overflow_disconnects"] += 1
+        self.outbound_overflowed = True
+        self.connected = False
+        self.stop_writer()
+        # Closing the socket ends the receive loop, which does the normal disconnect cleanup.
+        asyncio.create_task(self.close_websocket())
+
+    async def close_websocket(self):
+        try:
+            await self.websocket.close()
+        except:
+            pass
+
+    async def write_outbound_messages(self):
+        while True:
+            message = await self.outbound_queue.get()
+            try:
+                await self.websocket.send_text(message)
+                outbound_metrics["messages_sent"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.info(f"Send failed, stopping writer for {self.get_username()} - {self.player_id}: {e}")
+                outbound_metrics["send_failures"] += 1
+                self.connected = False
+                self.writer_task = None
+                return
 
 class PlayerManager:
     def __init__(self):
         self.active_players : Dict[str, Player] = {}
+        # Last lobby state sent to clients.
+        self.lobby_version = 0
+        self.lobby_players : Dict[str, Dict] = {}
+        self.lobby_rooms : Dict[str, Dict] = {}
+        self.lobby_queue_info = []
+        self.lobby_sources = None
+        self.lobby_flush_task : asyncio.Task = None
 
     def add_player(self, player_id: str, websocket: WebSocket):
-        self.active_players[player_id] = Player(player_id, websocket)
-        return self.active_players[player_id]
+        player = Player(player_id, websocket)
+        player.start_writer()
+        self.active_players[player_id] = player
+        return player
 
     def remove_player(self, player_id: str):
         if player_id in self.active_players:
+            self.active_players[player_id].stop_writer()
             del self.active_players[player_id]
 
+    def get_outbound_metrics(self):
+        queue_depths = [
+            player.outbound_queue.qsize()
+            for player in self.active_players.values()
+            if player.outbound_queue
+        ]
+        return {
+            **outbound_metrics,
+            "queued_now": sum(queue_depths),
+            "deepest_queue_now": max(queue_depths, default=0),
+        }
+
     def get_player(self, player_id: str) -> Player:
         return self.active_players.get(player_id)
 
     def get_players_info(self):
         return [player.get_public_player_info() for player in self.active_players.values()]
 
-    async def broadcast_server_info(self, queue_info, game_rooms):
-        players_info = self.get_players_info()
-        failed_players = []
-        room_info = []
-        for room in game_rooms:
-            if not room.is_ai_game():
-                room_info.append(room.get_room_info())
-        player_ids = list(self.active_players.keys())
-        for player_id in player_ids:
-            if player_id not in self.active_players:
-                continue
-            player = self.active_players[player_id]
-            if not player.connected:
+    def diff_lobby_state(self, get_queue_info, game_rooms):
+        # Compares the lobby against the last version sent and records what changed.
+        players = {player_id: player.get_public_player_info() for player_id, player in self.active_players.items()}
+        rooms = {room.room_id: room.get_room_info() for room in game_rooms if not room.is_ai_game()}
+        queue_info = get_queue_info()
+        delta = ServerInfoDeltaMessage(
+            message_type="server_info_delta",
+            lobby_version=self.lobby_version + 1,
+            queue_info=queue_info,
+            players_updated=[info for player_id, info in players.items() if self.lobby_players.get(player_id) != info],
+            players_removed=[player_id for player_id in self.lobby_players if player_id not in players],
+            rooms_updated=[info for room_id, info in rooms.items() if self.lobby_rooms.get(room_id) != info],
+            rooms_removed=[room_id for room_id in self.lobby_rooms if room_id not in rooms],
+        )
+        if not (delta.players_updated or delta.players_removed or delta.rooms_updated or delta.rooms_removed
+                or queue_info != self.lobby_queue_info):
+            return None
+
+        self.lobby_version += 1
+        self.lobby_players = players
+        self.lobby_rooms = rooms
+        self.lobby_queue_info = queue_info
+        return delta
+
+    def create_lobby_snapshot(self, player: Player):
+        return ServerInfoMessage(
+            message_type="server_info",
+            queue_info=self.lobby_queue_info,
+            room_info=list(self.lobby_rooms.values()),
+            players_info=list(self.lobby_players.values()),
+            your_id=player.player_id,
+            your_username=player.get_username(),
+            lobby_version=self.lobby_version,
+        )
+
+    async def update_lobby(self, get_queue_info, game_rooms, skip_player: Player = None):
+        delta = self.diff_lobby_state(get_queue_info, game_rooms)
+        if not delta:
+            return
+        delta_message = serialize_event_data(delta.as_dict())
+        for player in list(self.active_players.values()):
+            if not player.connected or player is skip_player:
                 continue
+            if player.lobby_deltas:
+                player.queue_message(delta_message)
+            else:
+                await player.send_message(self.create_lobby_snapshot(player).as_dict())
 
-            message = ServerInfoMessage(
-                message_type="server_info",
-                queue_info=queue_info,
-                room_info=room_info,
-                players_info=players_info,
-                your_id=player.player_id,
-                your_username=player.get_username()
-            )
+    async def send_lobby_snapshot(self, player: Player, get_queue_info, game_rooms):
+        # Bring everyone else up to date first so the snapshot matches the current version.
+        await self.update_lobby(get_queue_info, game_rooms, skip_player=player)
+        await player.send_message(self.create_lobby_snapshot(player).as_dict())
 
-            try:
-                await player.websocket.send_json(message.as_dict())
-            except:
-                failed_players.append(player.player_id)
+    async def broadcast_server_info(self, get_queue_info, game_rooms):
+        # Coalesce bursts of lobby changes into one update.
+        self.lobby_sources = (get_queue_info, game_rooms)
+        if self.lobby_flush_task is None:
+            self.lobby_flush_task = asyncio.create_task(self.flush_lobby_after_window())
 
-        # Remove any players we can't contact anymore.
-        for player_id in failed_players:
-            self.remove_player(player_id)
\ No newline at end of file
+    async def flush_lobby_after_window(self):
+        await asyncio.sleep(LOBBY_BROADCAST_WINDOW)
+        self.lobby_flush_task = None
+        try:
+            await self.update_lobby(*self.lobby_sources)
+        except Exception as e:
+            logger.error(f"Error broadcasting lobby update: {e}")
@@ -0,0 +1,150 @@
+import json
+from copy import deepcopy
+from typing import Any, Dict, List, Tuple
+from app.card_database import CardDatabase
+from app.gameengine import GameEngine
+from app.engine.constants import EventType
+from app.engine.snapshot import save_engine_snapshot, load_engine_snapshot
+import logging
+logger = logging.getLogger(__name__)
+
+# Game messages between stored engine snapshots.
+REPLAY_CHECKPOINT_INTERVAL = 20
+
+def normalize_event(event):
+    # Stored logs went through json, so compare against the json form.
+    return json.loads(json.dumps(event))
+
+class MatchReplay:
+    """Rebuilds a game from a match log by replaying its game messages with the same seed.
+
+    message_index is how many game messages have been applied, so seek(0) is the state
+    right after begin_game and seek(len(messages)) is the end of the match.
+    Every checkpoint_interval messages a snapshot of the engine is kept, so seeking
+    only replays from the nearest snapshot before the target instead of from game start.
+    """
+    def __init__(self, card_db : CardDatabase, match_data : Dict[str, Any], verify = True, checkpoint_interval = REPLAY_CHECKPOINT_INTERVAL):
+        self.card_db = card_db
+        self.match_data = match_data
+        self.messages : List[Dict] = match_data["all_game_messages"]
+        self.expected_events = match_data.get("all_events")
+        self.verify = verify and self.expected_events is not None
+        # Emotes aren't caused by game messages, so they are put back where they happened.
+        self.emotes_after_message : Dict[int, List[Dict]] = {}
+        for event in match_data.get("all_events", match_data.get("emote_events", [])):
+            if event["event_type"] == EventType.EventType_Emote:
+                self.emotes_after_message.setdefault(event["last_game_message_number"], []).append(event)
+        self.engine : GameEngine = None
+        self.message_index = 0
+        self.mismatches = []
+        self.checkpoint_interval = checkpoint_interval
+        # message_index -> (turn_number, serialized engine)
+        self.checkpoints : Dict[int, Tuple[int, bytes]] = {}
+        self.reset()
+
+    def reset(self):
+        self.engine = GameEngine(self.card_db, self.match_data["game_type"], deepcopy(self.match_data["player_info"]))
+        self.engine.seed = self.match_data["seed"]
+        self.engine.begin_game()
+        self.message_index = 0
+        self.finish_step(-1)
+        self.save_checkpoint()
+
+    def step(self):
+        """Applies the next game message. Returns False if there are none left."""
+        if self.message_index >= len(self.messages):
+            return False
+        message = self.messages[self.message_index]
+        self.engine.handle_game_message(message["player_id"], message["action_type"], deepcopy(message["action_data"]))
+        self.message_index += 1
+        self.finish_step(message["game_message_number"])
+        self.save_checkpoint()
+        return True
+
+    def finish_step(self, game_message_number):
+        for emote_event in self.emotes_after_message.get(game_message_number, []):
+            self.engine.all_events.append(deepcopy(emote_event))
+        # Nobody is listening to a replay.
+        self.engine.grab_events()
+        self.engine.grab_observer_events()
+
+    def save_checkpoint(self):
+        if not self.checkpoint_interval or self.message_index % self.checkpoint_interval != 0:
+            return
+        if self.message_index not in self.checkpoints:
+            self.checkpoints[self.message_index] = (self.engine.turn_number, save_engine_snapshot(self.engine))
+
+    def restore_checkpoint(self, message_index):
+        _, snapshot = self.checkpoints[message_index]
+        self.engine = load_engine_snapshot(snapshot, self.card_db)
+        self.message_index = message_index
+
+    def check_events(self):
+        # Some events hold dicts the engine keeps changing after the event was sent,
+        # so events are compared once the whole match has been replayed.
+        all_events = self.engine.all_events
+        for event_index in range(max(len(all_events), len(self.expected_events))):
+            expected = self.expected_events[event_index] if event_index < len(self.expected_events) else None
+            actual = normalize_event(all_events[event_index]) if event_index < len(all_events) else None
+            if actual != expected:
+                self.mismatches.append({
+                    "event_index": event_index,
+                    "expected": expected,
+                    "actual": actual,
+                })
+
+    def seek(self, message_index):
+        """Moves the engine to the state after message_index game messages."""
+        message_index = max(0, min(message_index, len(self.messages)))
+        checkpoint_index = max((index for index in self.checkpoints if index <= message_index), default=None)
+        if checkpoint_index is None:
+            if message_index < self.message_index:
+                self.reset()
+        elif message_index < self.message_index or checkpoint_index > self.message_index:
+            self.restore_checkpoint(checkpoint_index)
+        while self.message_index < message_index:
+            self.step()
+        return self.engine
+
+    def seek_turn(self, turn_number):
+        """Moves the engine to the first message that reaches turn_number, or the end of the match."""
+        # Start from the last checkpoint from an earlier turn.
+        earlier = [index for index, (checkpoint_turn, _) in self.checkpoints.items() if checkpoint_turn < turn_number]
+        start_index = max(earlier, default=0)
+        if self.engine.turn_number >= turn_number or start_index > self.message_index:
+            self.seek(start_index)
+        while self.engine.turn_number < turn_number and self.step():
+            pass
+        return self.engine
+
+    def run_to_end(self):
+        """Replays every message. Returns the mismatches against the stored events, if any."""
+        self.seek(len(self.messages))
+        self.mismatches = []
+        if self.verify:
+            self.check_events()
+        return self.mismatches
+
+def verify_match_log(card_db : CardDatabase, match_data):
+    """Returns True if replaying the match reproduces every stored event."""
+    mismatches = MatchReplay(card_db, match_data).run_to_end()
+    if mismatches:
+        logger.warning(f"Replay mismatch at event {mismatches[0]['event_index']}: expected {mismatches[0]['expected']} got {mismatches[0]['actual']}")
+    return not mismatches
+
+def strip_match_log(match_data):
+    """Returns the match log without the events, which replay can rebuild.
+
+    Emotes are kept since they don't come from game messages.
+    """
+    stripped = {key: value for key, value in match_data.items() if key != "all_events"}
+    stripped["emote_events"] = [event for event in match_data["all_events"] if event["event_type"] == EventType.EventType_Emote]
+    return stripped
+
+def rebuild_match_log(card_db : CardDatabase, stripped_match_data):
+    """Rebuilds the full match log from one made by strip_match_log."""
+    replay = MatchReplay(card_db, stripped_match_data, verify=False)
+    replay.run_to_end()
+    match_data = {key: value for key, value in stripped_match_data.items() if key != "emote_events"}
+    match_data["all_events"] = [normalize_event(event) for event in replay.engine.all_events]
+    return match_data
@@ -0,0 +1,245 @@
+import json
+import os
+import random
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+from app.aiplayer import AIPlayer, get_ai_deck_by_name, load_ai_deck_pool
+from app.card_database import CardDatabase
+from app.gameengine import GameEngine, GameAction
+import logging
+logger = logging.getLogger(__name__)
+
+# A game that takes more messages than this is stuck, most games take a few hundred.
+SELFPLAY_MAX_MESSAGES = 3000
+SELFPLAY_PLAYER_IDS = ["p1", "p2"]
+
+# Actions that put a card from the hand into play, by the field holding the game card id.
+CARD_PLAY_ACTIONS = {
+    GameAction.MainStepPlaceHolomem: "card_id",
+    GameAction.MainStepBloom: "card_id",
+    GameAction.MainStepPlaySupport: "card_id",
+}
+
+# Loaded once per worker process.
+worker_card_db : CardDatabase = None
+
+def get_worker_card_db():
+    global worker_card_db
+    if worker_card_db is None:
+        worker_card_db = CardDatabase()
+    return worker_card_db
+
+def play_selfplay_game(card_db : CardDatabase, first_deck, second_deck, seed, max_messages=SELFPLAY_MAX_MESSAGES):
+    """Plays one headless AI vs AI game. The same decks and seed always play the same game."""
+    # The engine seed and every AI choice come from the global random generator.
+    random.seed(seed)
+    ai_players = {}
+    player_infos = []
+    for player_id, deck in zip(SELFPLAY_PLAYER_IDS, [first_deck, second_deck]):
+        ai_player = AIPlayer(player_id)
+        ai_player.set_deck(deck)
+        ai_players[player_id] = ai_player
+        player_infos.append(dict(ai_player.get_player_game_info(), username=player_id))
+    engine = GameEngine(card_db, "versus", player_infos, headless=True)
+    engine.begin_game()
+    events = engine.grab_events()
+    while not engine.is_game_over():
+        if len(engine.all_game_messages) >= max_messages:
+            raise RuntimeError(f"Game did not finish in {max_messages} messages.")
+        for player_id, ai_player in ai_players.items():
+            performing_action, action = ai_player.ai_process_events(events)
+            if performing_action:
+                engine.handle_game_message(player_id, action["action_type"], action["action_data"])
+                events = engine.grab_events()
+                break
+        else:
+            raise RuntimeError("Neither AI had an action to take.")
+    return engine
+
+def get_card_plays(engine : GameEngine):
+    """Returns {player_id: Counter(card_id)} of cards played from hand."""
+    card_plays = {player_id: Counter() for player_id in engine.player_ids}
+    for message in engine.all_game_messages:
+        card_field = CARD_PLAY_ACTIONS.get(message["action_type"])
+        if card_field:
+            game_card_id = message["action_data"].get(card_field)
+            card_plays[message["player_id"]][engine.all_game_cards_map.get(game_card_id, game_card_id)] += 1
+    return card_plays
+
+def run_selfplay_game(task):
+    """Worker entry point. Engine errors are returned in the result, never raised."""
+    result = {
+        "game_index": task["game_index"],
+        "seed": task["seed"],
+        "decks": task["deck_names"],
+    }
+    start_time = time.time()
+    try:
+        engine = play_selfplay_game(get_worker_card_db(), task["decks"][0], task["decks"][1], task["seed"])
+        card_plays = get_card_plays(engine)
+        winner_id = engine.game_over_event["winner_id"]
+        result.update({
+            "winner": task["deck_names"][engine.player_ids.index(winner_id)],
+            "winner_index": engine.player_ids.index(winner_id),
+            "first_player_index": engine.player_ids.index(engine.first_turn_player_id),
+            "game_over_reason": engine.game_over_event["reason_id"],
+            "turns": engine.turn_number,
+            "messages": len(engine.all_game_messages),
+            "card_plays": [dict(card_plays[player_id]) for player_id in engine.player_ids],
+        })
+    except Exception as e:
+        result["error"] = repr(e)
+        result["traceback"] = traceback.format_exc()
+    result["duration"] = time.time() - start_time
+    return result
+
+def build_selfplay_tasks(deck_names, games_per_pair, seed=0):
+    """One task per game, with a seed per game made from the base seed.
+
+    Every pair of different decks plays games_per_pair games, switching seats each game.
+    A single deck plays mirror matches.
+    """
+    decks = {}
+    pool = load_ai_deck_pool()
+    for deck_name in deck_names:
+        # get_ai_deck_by_name falls back to a random deck, which would make the results meaningless.
+        if deck_name not in pool:
+            raise ValueError(f"Unknown AI deck {deck_name}. Available: {', '.join(sorted(pool))}")
+        decks[deck_name] = get_ai_deck_by_name(deck_name)
+    pairs = list(combinations(deck_names, 2)) or [(deck_names[0], deck_names[0])]
+    seed_gen = random.Random(seed)
+    tasks = []
+    for first_name, second_name in pairs:
+        for game in range(games_per_pair):
+            seat_names = [first_name, second_name] if game % 2 == 0 else [second_name, first_name]
+            tasks.append({
+                "game_index": len(tasks),
+                "seed": seed_gen.getrandbits(32),
+                "deck_names": seat_names,
+                "decks": [decks[name] for name in seat_names],
+            })
+    return tasks
+
+class SelfPlayStats:
+    def __init__(self):
+        self.games = 0
+        self.errors = 0
+        self.first_player_wins = 0
+        self.total_turns = 0
+        self.total_messages = 0
+        self.total_duration = 0
+        self.deck_games = Counter()
+        self.deck_wins = Counter()
+        # (deck, opponent) -> count
+        self.matchup_games = Counter()
+        self.matchup_wins = Counter()
+        # (deck, card_id) -> count
+        self.card_plays = Counter()
+        self.card_play_wins = Counter()
+        self.error_games = []
+
+    def add_result(self, result):
+        self.total_duration += result["duration"]
+        if "error" in result:
+            self.errors += 1
+            self.error_games.append({key: result[key] for key in ["game_index", "seed", "decks", "error"]})
+            return
+        self.games += 1
+        self.total_turns += result["turns"]
+        self.total_messages += result["messages"]
+        if result["winner_index"] == result["first_player_index"]:
+            self.first_player_wins += 1
+        for index, deck_name in enumerate(result["decks"]):
+            opponent_name = result["decks"][1 - index]
+            won = index == result["winner_index"]
+            self.deck_games[deck_name] += 1
+            self.matchup_games[(deck_name, opponent_name)] += 1
+            if won:
+                self.deck_wins[deck_name] += 1
+                self.matchup_wins[(deck_name, opponent_name)] += 1
+            for card_id, count in result["card_plays"][index].items():
+                self.card_plays[(deck_name, card_id)] += count
+                if won:
+                    self.card_play_wins[(deck_name, card_id)] += count
+
+    def get_summary(self):
+        games = self.games
+        return {
+            "games": games,
+            "errors": self.errors,
+            "first_player_win_percentage": self.first_player_wins / games * 100 if games else 0,
+            "average_turns": self.total_turns / games if games else 0,
+            "average_messages": self.total_messages / games if games else 0,
+            "average_game_seconds": self.total_duration / (games + self.errors) if games + self.errors else 0,
+            "decks": {
+                deck_name: {
+                    "games": self.deck_games[deck_name],
+                    "wins": self.deck_wins[deck_name],
+                    "win_percentage": self.deck_wins[deck_name] / self.deck_games[deck_name] * 100,
+                }
+                for deck_name in sorted(self.deck_games)
+            },
+            "matchups": [
+                {
+                    "deck": deck_name,
+                    "opponent": opponent_name,
+                    "games": self.matchup_games[(deck_name, opponent_name)],
+                    "wins": self.matchup_wins[(deck_name, opponent_name)],
+                    "win_percentage": self.matchup_wins[(deck_name, opponent_name)] / self.matchup_games[(deck_name, opponent_name)] * 100,
+                }
+                for deck_name, opponent_name in sorted(self.matchup_games)
+            ],
+            "card_plays": [
+                {
+                    "deck": deck_name,
+                    "card_id": card_id,
+                    "plays": self.card_plays[(deck_name, card_id)],
+                    "plays_per_game": self.card_plays[(deck_name, card_id)] / self.deck_games[deck_name],
+                    "plays_in_wins": self.card_play_wins[(deck_name, card_id)],
+                }
+                for deck_name, card_id in sorted(self.card_plays)
+            ],
+            "error_games": self.error_games,
+        }
+
+def iter_selfplay_results(tasks, workers=None):
+    """Yields game results as they finish. workers=1 plays in this process."""
+    if workers == 1:
+        for task in tasks:
+            yield run_selfplay_game(task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for future in as_completed([executor.submit(run_selfplay_game, task) for task in tasks]):
+            yield future.result()
+
+def run_selfplay(deck_names=None, games_per_pair=10, seed=0, workers=None, output_dir=None):
+    """Plays the games and returns SelfPlayStats.
+
+    With output_dir, each game is appended to games.ndjson as soon as it finishes and
+    summary.json is written at the end.
+    """
+    deck_names = deck_names or sorted(load_ai_deck_pool())
+    tasks = build_selfplay_tasks(deck_names, games_per_pair, seed)
+    stats = SelfPlayStats()
+    games_file = None
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        games_file = open(os.path.join(output_dir, "games.ndjson"), "w", encoding="utf-8")
+    try:
+        for result in iter_selfplay_results(tasks, workers):
+            stats.add_result(result)
+            if "error" in result:
+                logger.error(f"Self-play game {result['game_index']} (seed {result['seed']}, {result['decks']}) failed: {result['error']}")
+            if games_file:
+                games_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+                games_file.flush()
+    finally:
+        if games_file:
+            games_file.close()
+    if output_dir:
+        with open(os.path.join(output_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(stats.get_summary(), f, indent=2, ensure_ascii=False)
+    return stats
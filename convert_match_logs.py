@@ -0,0 +1,33 @@
+import os
+import sys
+from app.dbaccess import MATCH_LOGS_DIR, import_match_log_file, is_match_log_file, match_store
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 기존 매치 로그 파일을 매치 저장소(세그먼트 + 인덱스)로 옮깁니다.
+# Usage: python convert_match_logs.py [match_logs_dir] [--remove-original]
+match_logs_dir = MATCH_LOGS_DIR
+remove_original = "--remove-original" in sys.argv
+args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+if args:
+    match_logs_dir = args[0]
+
+original_bytes = 0
+imported_count = 0
+for file_name in sorted(os.listdir(match_logs_dir)):
+    # Segment files already belong to the store.
+    if not is_match_log_file(file_name) or file_name.startswith("segment_"):
+        continue
+    file_path = os.path.join(match_logs_dir, file_name)
+    try:
+        original_size = os.path.getsize(file_path)
+        import_match_log_file(file_path, remove_original=remove_original)
+        original_bytes += original_size
+        imported_count += 1
+    except Exception as e:
+        logger.error(f"Failed to import {file_name}: {e}")
+
+match_store.close()
+logger.info(f"Imported {imported_count} match logs ({original_bytes} bytes) into {MATCH_LOGS_DIR}")
@@ -0,0 +1,41 @@
+import sys
+from app.selfplay import run_selfplay
+import logging
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+# Usage: python run_selfplay.py [deck_name ...] [--games N] [--seed N] [--workers N] [--output results_dir]
+# With no deck names every deck in the AI pool plays every other deck.
+def get_option(name, default=None):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+if __name__ == "__main__":
+    deck_names = [arg for index, arg in enumerate(sys.argv[1:], 1) if not arg.startswith("--") and not sys.argv[index - 1].startswith("--")]
+    games_per_pair = int(get_option("--games", 10))
+    seed = int(get_option("--seed", 0))
+    workers = get_option("--workers")
+    output_dir = get_option("--output")
+
+    stats = run_selfplay(deck_names, games_per_pair, seed, workers=int(workers) if workers else None, output_dir=output_dir)
+    summary = stats.get_summary()
+
+    print(f"\nGames: {summary['games']}  Errors: {summary['errors']}")
+    print(f"Average turns: {summary['average_turns']:.2f}  Average messages: {summary['average_messages']:.1f}  Average seconds per game: {summary['average_game_seconds']:.3f}")
+    print(f"First player win percentage: {summary['first_player_win_percentage']:.2f}%")
+
+    print("\nDecks:")
+    print(f"{'Deck':<25} {'Win %':<10} {'Wins':<8} {'Games':<8}")
+    for deck_name, deck in summary["decks"].items():
+        print(f"{deck_name:<25} {deck['win_percentage']:<10.2f} {deck['wins']:<8} {deck['games']:<8}")
+
+    print("\nMatchups:")
+    for matchup in summary["matchups"]:
+        print(f"{matchup['deck']:<25} vs {matchup['opponent']:<25} {matchup['win_percentage']:.2f}% of {matchup['games']}")
+
+    for error_game in summary["error_games"]:
+        print(f"\nGame {error_game['game_index']} failed (seed {error_game['seed']}, decks {error_game['decks']}): {error_game['error']}")
+
+    if output_dir:
+        print(f"\nResults written to {output_dir}")
@@ -2,6 +2,8 @@ import traceback
 import os
 import uuid
 import time
+import asyncio
+import heapq
 from typing import List
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -12,10 +14,11 @@ from app.matchmaking import Matchmaking
 import app.message_types as message_types
 from app.playermanager import PlayerManager, Player
 from app.gameengine import GamePhase
-from app.gameroom import GameRoom
+from app.gameroom import GameRoom, GameRoomRegistry
 from app.card_database import CardDatabase
-from app.dbaccess import is_game_package_available
+from app.dbaccess import is_game_package_available, flush_match_logs, get_match_log_metrics
 from app.aiplayer import get_ai_deck_names
+from app.mcts_ai import start_mcts_executor, shutdown_mcts_executor
 import logging
 from dotenv import load_dotenv
 
@@ -47,10 +50,15 @@ async def lifespan(app: FastAPI):
             async def game_not_available():
                 return {"message": "Game package not available. Place HTML5 export files in data/game_package/"}
 
+    idle_reaper = asyncio.create_task(idle_reaper_task())
+    start_mcts_executor()
+
     yield  # Application runs here
 
     # Actions to perform during shutdown (if needed)
-    # Clean up or additional teardown actions can be added here if necessary.
+    idle_reaper.cancel()
+    shutdown_mcts_executor()
+    await asyncio.to_thread(flush_match_logs)
 
 app = FastAPI(lifespan=lifespan)
 
@@ -67,7 +75,13 @@ app.add_middleware(
 # Health check endpoint for Railway
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "holoduel-server"}
+    return {
+        "status": "healthy",
+        "service": "holoduel-server",
+        "outbound": player_manager.get_outbound_metrics(),
+        "idle_reaper": idle_metrics,
+        "match_logs": get_match_log_metrics(),
+    }
 
 @app.get("/")
 async def root():
@@ -113,21 +127,31 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 player_manager : PlayerManager = PlayerManager()
-game_rooms : List[GameRoom] = []
+game_rooms : GameRoomRegistry = GameRoomRegistry()
 matchmaking : Matchmaking = Matchmaking()
 card_db : CardDatabase = CardDatabase()
-last_idle_check = time.time()
+# (idle deadline, player_id) for every connected player, checked by the idle reaper.
+idle_deadlines : List[tuple] = []
+idle_metrics = {
+    "reaper_runs": 0,
+    "players_evicted": 0,
+    "rooms_evicted": 0,
+    "last_run_seconds": 0.0,
+}
 
 async def broadcast_server_info():
-    await player_manager.broadcast_server_info(matchmaking.get_queue_info(), game_rooms)
+    await player_manager.broadcast_server_info(matchmaking.get_queue_info, game_rooms)
 
-async def send_error_message(websocket: WebSocket, error_id, error_str : str):
-    message = message_types.ErrorMessage(
+def create_error_message(error_id, error_str : str):
+    return message_types.ErrorMessage(
         message_type="error",
         error_id = error_id,
         error_message=error_str,
     )
-    await websocket.send_json(message.as_dict())
+
+async def send_error_message(player: Player, error_id, error_str : str):
+    # Goes through the player's outbound queue so it stays in order with game events.
+    await player.send_message(create_error_message(error_id, error_str).as_dict())
 
 
 @app.websocket("/ws")
@@ -143,6 +167,7 @@ async def websocket_endpoint(websocket: WebSocket):
             player.websocket = websocket
         else:
             player = player_manager.add_player(player_id, websocket)
+        heapq.heappush(idle_deadlines, (player.last_seen + PLAYER_TIMEOUT_THRESHOLD, player_id))
 
         # ConnectionManager에 추가 (이미 accept됨)
         manager.active_connections.append(websocket)
@@ -157,39 +182,40 @@ async def websocket_endpoint(websocket: WebSocket):
                 message = message_types.parse_message(data)
             except Exception as e:
                 logger.error("Error in message parsing: {e}\nMessage: {data}")
-                await send_error_message(websocket, "invalid_message", f"ERROR: Invalid JSON: {data}")
+                await send_error_message(player, "invalid_message", f"ERROR: Invalid JSON: {data}")
                 continue
 
             player.last_seen = time.time()
 
             if isinstance(message, message_types.JoinServerMessage):
-                await broadcast_server_info()
+                player.event_batching = message.event_batching
+                player.lobby_deltas = message.lobby_deltas
+                await player_manager.send_lobby_snapshot(player, matchmaking.get_queue_info, game_rooms)
 
             elif isinstance(message, message_types.ObserveRoomMessage):
-                room_id = message.room_id
-                for room in game_rooms:
-                    if room.room_id == room_id:
-                        player.current_game_room = room
-                        await room.join_as_observer(player)
-                        await broadcast_server_info()
-                        break
+                room = game_rooms.get_room(message.room_id)
+                if room:
+                    player.current_game_room = room
+                    game_rooms.add_observer(room, player)
+                    await room.join_as_observer(player)
+                    await broadcast_server_info()
                 else:
-                    await send_error_message(websocket, "invalid_room", f"ERROR: Match not found.")
+                    await send_error_message(player, "invalid_room", f"ERROR: Match not found.")
             elif isinstance(message, message_types.ObserverGetEventsMessage):
                 if not player.current_game_room:
-                    await send_error_message(websocket, "not_in_room", f"ERROR: Not in a game room.")
+                    await send_error_message(player, "not_in_room", f"ERROR: Not in a game room.")
                     break
                 await player.current_game_room.observer_request_next_events(player, message.next_event_index)
             elif isinstance(message, message_types.JoinMatchmakingQueueMessage):
                 # Ensure player is in a joinable state.
                 if not can_player_join_queue(player):
-                    await send_error_message(websocket, "joinmatch_invalid_alreadyinmatch", "Already in a match.")
+                    await send_error_message(player, "joinmatch_invalid_alreadyinmatch", "Already in a match.")
                 elif not matchmaking.is_game_type_valid(message.game_type):
-                    await send_error_message(websocket, "joinmatch_invalid_gametype", "Invalid game type.")
+                    await send_error_message(player, "joinmatch_invalid_gametype", "Invalid game type.")
                 else:
                     queue_name = message.queue_name.strip()
                     if not matchmaking.is_valid_queue_name(queue_name):
-                        await send_error_message(websocket, "joinmatch_invalid_queuename", "Invalid queue name.")
+                        await send_error_message(player, "joinmatch_invalid_queuename", "Invalid queue name.")
                     else:
                         is_valid = card_db.validate_deck(
                             oshi_id=message.oshi_id,
@@ -205,6 +231,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             )
                             player.ai_deck_name = getattr(message, "ai_deck_name", "random")
                             player.ai_custom_deck = None
+                            player.ai_strength = getattr(message, "ai_strength", "normal")
                             ai_oshi_id = getattr(message, "ai_oshi_id", "")
                             ai_deck_data = getattr(message, "ai_deck", None)
                             ai_cheer_data = getattr(message, "ai_cheer_deck", None)
@@ -226,12 +253,12 @@ async def websocket_endpoint(websocket: WebSocket):
                                 game_type=message.game_type,
                             )
                             if match:
-                                game_rooms.append(match)
+                                game_rooms.add_room(match)
                                 await match.start(card_db)
 
                             await broadcast_server_info()
                         else:
-                            await send_error_message(websocket, "joinmatch_invaliddeck", "Invalid deck list.")
+                            await send_error_message(player, "joinmatch_invaliddeck", "Invalid deck list.")
 
             elif isinstance(message, message_types.LeaveMatchmakingQueueMessage):
                 matchmaking.remove_player_from_queue(player)
@@ -244,7 +271,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     check_cleanup_room(player_room)
                     await broadcast_server_info()
                 else:
-                    await send_error_message(websocket, "not_in_room", f"ERROR: Not in a game room to leave.")
+                    await send_error_message(player, "not_in_room", f"ERROR: Not in a game room to leave.")
 
             elif isinstance(message, message_types.GameActionMessage):
                 #logger.info(f"GAMEACTION: {message.action_type}")
@@ -253,7 +280,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     await player_room.handle_game_message(player.player_id, message.action_type, message.action_data)
                     check_cleanup_room(player_room)
                 else:
-                    await send_error_message(websocket, "not_in_room", f"ERROR: Not in a game room to send a game message.")
+                    await send_error_message(player, "not_in_room", f"ERROR: Not in a game room to send a game message.")
             
             elif isinstance(message, message_types.EmoteMessage):
                 logger.info(f"Received emote message from player {player.get_username()} - {player.player_id}: emote_id = {message.emote_id}")
@@ -262,7 +289,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     await player_room.handle_emote_message(player.player_id, message.emote_id)
                 else:
                     logger.warning(f"Player {player.get_username()} - {player.player_id} tried to send emote but not in a game room")
-                    await send_error_message(websocket, "not_in_room", f"ERROR: Not in a game room to send emote.")
+                    await send_error_message(player, "not_in_room", f"ERROR: Not in a game room to send emote.")
 
             elif isinstance(message, message_types.RequestAIDeckListMessage):
                 deck_names = get_ai_deck_names()
@@ -270,22 +297,19 @@ async def websocket_endpoint(websocket: WebSocket):
                     "message_type": "ai_deck_list",
                     "deck_list": deck_names,
                 }
-                await websocket.send_json(response)
+                await player.send_message(response)
 
             else:
-                await send_error_message(websocket, "invalid_game_message", f"ERROR: Invalid message: {data}")
-
-            await check_idle_users_task()
+                await send_error_message(player, "invalid_game_message", f"ERROR: Invalid message: {data}")
 
     except WebSocketDisconnect:
         logger.info(f"Client disconnected: {player.get_username()} - {player.player_id}")
         player.connected = False
         matchmaking.remove_player_from_queue(player)
-        for room in game_rooms:
-            if player in room.players or player in room.observers:
-                await room.handle_player_disconnect(player)
-                check_cleanup_room(room)
-                break
+        room = game_rooms.get_player_room(player)
+        if room:
+            await room.handle_player_disconnect(player)
+            check_cleanup_room(room)
 
         player_manager.remove_player(player_id)
         await manager.disconnect(websocket)
@@ -294,26 +318,27 @@ async def websocket_endpoint(websocket: WebSocket):
         error_details = traceback.format_exc()
         logger.error(f"Error websocket loop from player {player.get_username()} - {player.player_id}: {e} Callstack: {error_details}")
         try:
-            await send_error_message(websocket, "server_exception", f"Server error: {str(e)}")
+            # Stop the writer so this direct send doesn't race it.
+            player.stop_writer()
+            await websocket.send_json(create_error_message("server_exception", f"Server error: {str(e)}").as_dict())
         except:
             pass
         player.connected = False
         matchmaking.remove_player_from_queue(player)
-        for room in game_rooms:
-            if player in room.players or player in room.observers:
-                try:
-                    await room.handle_player_disconnect(player)
-                    check_cleanup_room(room)
-                except:
-                    pass
-                break
+        room = game_rooms.get_player_room(player)
+        if room:
+            try:
+                await room.handle_player_disconnect(player)
+                check_cleanup_room(room)
+            except:
+                pass
         player_manager.remove_player(player_id)
         await manager.disconnect(websocket)
         await broadcast_server_info()
 
 def cleanup_room(room: GameRoom):
     logger.info("Cleanup game room ID: %s" % room.room_id)
-    game_rooms.remove(room)
+    game_rooms.remove_room(room)
     for player in room.players:
         player.current_game_room = None
     for observer in room.observers:
@@ -338,38 +363,62 @@ def can_player_join_queue(player: Player):
         return False
     return True
 
-async def check_idle_users_task():
-    global last_idle_check
-    if last_idle_check + IDLE_TASK_TIMER > time.time():
-        return
-    last_idle_check = time.time()
-
-    # Check for idle players.
+async def idle_reaper_task():
+    while True:
+        await asyncio.sleep(IDLE_TASK_TIMER)
+        start_time = time.time()
+        try:
+            await reap_idle_players()
+            reap_stuck_rooms()
+        except Exception as e:
+            error_details = traceback.format_exc()
+            logger.error(f"Error in idle reaper: {e} Callstack: {error_details}")
+        idle_metrics["reaper_runs"] += 1
+        idle_metrics["last_run_seconds"] = time.time() - start_time
+
+async def reap_idle_players():
+    # Only players whose deadline passed are looked at.
+    # Anyone seen since their entry was pushed gets a new deadline instead.
     removed_players = False
-    player_keys = list(player_manager.active_players.keys())
-    for player_id in player_keys:
+    now = time.time()
+    while idle_deadlines and idle_deadlines[0][0] <= now:
+        _, player_id = heapq.heappop(idle_deadlines)
         player = player_manager.get_player(player_id)
-        if player:
-            if time.time() - player.last_seen > PLAYER_TIMEOUT_THRESHOLD:
-                logger.info(f"Player timed out: {player.get_username()} - {player.player_id}")
-                matchmaking.remove_player_from_queue(player)
-                for room in game_rooms:
-                    if player in room.players or player in room.observers:
-                        await room.handle_player_quit(player)
-                        check_cleanup_room(room)
-                        break
-                player.connected = False
-                player_manager.remove_player(player_id)
-                await manager.disconnect(player.websocket, True)
-                removed_players = True
-        else:
-            # Don't know exactly how this could happen but it did?
-            # Probably during an await something else removed the player.
-            player_manager.remove_player(player_id)
-            removed_players = True
+        if not player:
+            continue
+        deadline = player.last_seen + PLAYER_TIMEOUT_THRESHOLD
+        if deadline > now:
+            heapq.heappush(idle_deadlines, (deadline, player_id))
+            continue
+
+        logger.info(f"Player timed out: {player.get_username()} - {player.player_id}")
+        matchmaking.remove_player_from_queue(player)
+        room = game_rooms.get_player_room(player)
+        if room:
+            await room.handle_player_quit(player)
+            check_cleanup_room(room)
+        player.connected = False
+        player_manager.remove_player(player_id)
+        await manager.disconnect(player.websocket, True)
+        idle_metrics["players_evicted"] += 1
+        removed_players = True
     if removed_players:
         await broadcast_server_info()
 
+def reap_stuck_rooms():
+    for room in game_rooms:
+        try:
+            if not any(player.connected for player in room.players):
+                logger.info(f"Room {room.room_id} has no connected players.")
+                cleanup_room(room)
+            else:
+                check_cleanup_room(room)
+        except Exception as e:
+            error_details = traceback.format_exc()
+            logger.error(f"Error reaping room {room.room_id}: {e} Callstack: {error_details}")
+        if not game_rooms.get_room(room.room_id):
+            idle_metrics["rooms_evicted"] += 1
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,78 @@
+import pickle
+import unittest
+from copy import deepcopy
+
+from app.card_database import CardDatabase, FrozenDict, FrozenList
+from tests.helpers import SORA_STARTER_DECK, DEFAULT_CHEER, DEFAULT_OSHI
+
+
+class Test_CardDatabase(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+
+    def test_lookup_by_id(self):
+        card = self.card_db.get_card_definition("hSD01-003")
+        self.assertEqual(card["card_id"], "hSD01-003")
+        self.assertIsNone(self.card_db.get_card_definition("not-a-card"))
+        self.assertIsNone(self.card_db.get_card_by_id("not-a-card"))
+
+    def test_definitions_are_shared_and_read_only(self):
+        card = self.card_db.get_card_definition("hSD01-003")
+        self.assertIs(card, self.card_db.get_card_definition("hSD01-003"))
+        self.assertIsInstance(card, FrozenDict)
+        self.assertIsInstance(card["arts"], FrozenList)
+        with self.assertRaises(TypeError):
+            card["damage"] = 10
+        with self.assertRaises(TypeError):
+            card["arts"].append({})
+        with self.assertRaises(TypeError):
+            card["arts"][0]["power"] = 999
+
+    def test_copies_are_mutable(self):
+        card = self.card_db.get_card_by_id("hSD01-003")
+        self.assertIs(type(card), dict)
+        self.assertIs(type(card["arts"]), list)
+        card["arts"][0]["power"] = 999
+        self.assertNotEqual(self.card_db.get_card_definition("hSD01-003")["arts"][0]["power"], 999)
+
+        copied = deepcopy(self.card_db.get_card_definition("hSD01-003"))
+        self.assertIs(type(copied), dict)
+        copied["damage"] = 10
+
+    def test_definitions_pickle(self):
+        card = self.card_db.get_card_definition("hSD01-003")
+        restored = pickle.loads(pickle.dumps(card))
+        self.assertIsInstance(restored, FrozenDict)
+        self.assertEqual(restored, card)
+
+    def test_alternates_indexed(self):
+        for alt_id, card_ids in self.card_db.card_ids_by_alt_id.items():
+            self.assertIn(alt_id, card_ids)
+            for card_id in card_ids:
+                self.assertEqual(self.card_db.get_card_definition(card_id)["alt_id"], alt_id)
+
+    def test_validate_deck(self):
+        self.assertTrue(self.card_db.validate_deck(DEFAULT_OSHI, SORA_STARTER_DECK, DEFAULT_CHEER))
+        too_many = dict(SORA_STARTER_DECK)
+        too_many["hSD01-003"] = 5
+        too_many["hSD01-004"] = 2
+        self.assertFalse(self.card_db.validate_deck(DEFAULT_OSHI, too_many, DEFAULT_CHEER))
+        self.assertFalse(self.card_db.validate_deck("hSD01-003", SORA_STARTER_DECK, DEFAULT_CHEER))
+
+    def test_validate_deck_counts_alternates_together(self):
+        card_ids = next(
+            card_ids for card_ids in self.card_db.card_ids_by_alt_id.values()
+            if len(card_ids) > 1 and self.card_db.get_card_definition(card_ids[0])["card_type"] == "holomem_debut"
+        )
+        deck = dict(SORA_STARTER_DECK)
+        deck["hSD01-003"] -= 4
+        deck[card_ids[0]] = 2
+        deck[card_ids[1]] = 3
+        self.assertFalse(self.card_db.validate_deck(DEFAULT_OSHI, deck, DEFAULT_CHEER))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from app.gameengine import GameEngine
+from app.engine.player_state import PlayerState
+from tests.helpers import *
+
+
+class Test_CardIndex(unittest.TestCase):
+    engine: GameEngine
+    player1: str
+    player2: str
+
+    def setUp(self):
+        initialize_game_to_third_turn(self, generate_deck_with(None, {}))
+
+    def assert_index_consistent(self):
+        self.assertEqual(self.engine.check_card_indexes(), [])
+
+    def test_index_consistent_after_setup(self):
+        self.assert_index_consistent()
+
+    def test_move_card_updates_index(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        card_id = p1.hand[0]["game_card_id"]
+        p1.move_card(card_id, "archive")
+        card, zone, zone_name = p1.find_card(card_id)
+        self.assertEqual(zone_name, "archive")
+        self.assertIs(zone, p1.archive)
+        self.assertIs(card, p1.archive[0])
+        self.assert_index_consistent()
+
+    def test_attachments_found_through_index(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        center = p1.center[0]
+        cheer_id = p1.cheer_deck[0]["game_card_id"]
+        p1.move_card(cheer_id, "holomem", zone_card_id=center["game_card_id"])
+        self.assertIs(p1.find_attachment(cheer_id), center["attached_cheer"][-1])
+        self.assertEqual(p1.find_card(cheer_id), (None, None, None))
+        self.assertIs(self.engine.find_card(cheer_id), center["attached_cheer"][-1])
+
+        card, previous_holder_id = p1.find_and_remove_attached(cheer_id)
+        self.assertEqual(card["game_card_id"], cheer_id)
+        self.assertEqual(previous_holder_id, center["game_card_id"])
+        self.assertIsNone(p1.find_attachment(cheer_id))
+        self.assert_index_consistent()
+
+    def test_direct_zone_changes_are_detected(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        card = p1.deck.pop(0)
+        p1.backstage.append(card)
+        found, zone, zone_name = p1.find_card(card["game_card_id"])
+        self.assertIs(found, card)
+        self.assertEqual(zone_name, "backstage")
+
+        p1.backstage.remove(card)
+        self.assertEqual(p1.find_card(card["game_card_id"]), (None, None, None))
+        with self.assertRaises(Exception):
+            self.engine.find_card(card["game_card_id"])
+        self.assert_index_consistent()
+
+    def test_bloom_reindexes_stacked_and_attached(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        p1.center = []
+        center = put_card_in_play(self, p1, "hSD01-003", p1.center)
+        spawn_cheer_on_card(self, p1, center["game_card_id"], "white", "w1")
+        bloom_card = add_card_to_hand(self, p1, "hSD01-006")
+        p1.bloom(bloom_card["game_card_id"], center["game_card_id"], lambda: None)
+
+        self.assertIs(p1.center[0], bloom_card)
+        self.assertIs(p1.find_attachment(center["game_card_id"]), center)
+        self.assertIs(p1.find_attachment("p1_cheer_w1"), bloom_card["attached_cheer"][0])
+        self.assert_index_consistent()
+
+    def test_archive_lookups_survive_inserts_at_the_front(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        archived_ids = [card["game_card_id"] for card in p1.hand[:3]]
+        for card_id in archived_ids:
+            p1.move_card(card_id, "archive")
+        # Every stored position still points at its card, no zone scan needed.
+        for card_id in archived_ids:
+            card, zone_name, _, position = p1.card_locations[card_id]
+            self.assertEqual(zone_name, "archive")
+            self.assertIs(p1.archive[position], card)
+        self.assert_index_consistent()
+
+    def test_attachment_of_holder_off_stage_is_not_found(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        center = p1.center[0]
+        cheer_id = p1.cheer_deck[0]["game_card_id"]
+        p1.move_card(cheer_id, "holomem", zone_card_id=center["game_card_id"])
+        self.assertIsNotNone(p1.find_attachment(cheer_id))
+        # Take the holder off stage without going through move_card, the index entry is now stale.
+        p1.center.remove(center)
+        p1.hand.append(center)
+        self.assertIsNone(p1.find_attachment(cheer_id))
+
+    def test_engine_lookup_goes_to_the_owner(self):
+        p1: PlayerState = self.engine.get_player(self.player1)
+        p2: PlayerState = self.engine.get_player(self.player2)
+        scans = []
+        scan_card_location = p1._scan_card_location
+        p1._scan_card_location = lambda card_id: scans.append(card_id) or scan_card_location(card_id)
+        card = p2.hand[0]
+        self.assertIs(self.engine.find_card(card["game_card_id"]), card)
+        self.assertIs(self.engine.find_card(p2.center[0]["game_card_id"]), p2.center[0])
+        self.assertEqual(scans, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
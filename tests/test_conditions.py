@@ -0,0 +1,39 @@
+import unittest
+
+from app.gameengine import GameEngine
+from app.engine.constants import Condition
+from app.engine.player_state import PlayerState
+from tests.helpers import *
+
+
+class Test_Conditions(unittest.TestCase):
+    engine: GameEngine
+    player1: str
+    player2: str
+
+    def setUp(self):
+        initialize_game_to_third_turn(self, generate_deck_with(None, {}))
+        self.p1: PlayerState = self.engine.get_player(self.player1)
+        self.p2: PlayerState = self.engine.get_player(self.player2)
+
+    def test_condition_checks(self):
+        my_turn = {"condition": Condition.Condition_MyTurn}
+        self.assertTrue(self.engine.is_condition_met(self.p1, None, my_turn))
+        self.assertFalse(self.engine.is_condition_met(self.p2, None, my_turn))
+
+    def test_or_condition(self):
+        condition = {"condition": Condition.Condition_Or, "or_conditions": [
+            {"condition": Condition.Condition_MyTurn},
+            {"condition": Condition.Condition_StageHasSpace},
+        ]}
+        self.assertTrue(self.engine.is_condition_met(self.p2, None, condition))
+        condition["or_conditions"].pop()
+        self.assertFalse(self.engine.is_condition_met(self.p2, None, condition))
+
+    def test_unknown_condition(self):
+        with self.assertRaises(NotImplementedError):
+            self.engine.is_condition_met(self.p1, None, {"condition": "not_a_condition"})
+
+
+if __name__ == '__main__':
+    unittest.main()
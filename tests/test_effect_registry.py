@@ -0,0 +1,49 @@
+import unittest
+
+from app.gameengine import GameEngine
+from app.engine.player_state import PlayerState
+from tests.helpers import *
+
+
+class Test_EffectRegistry(unittest.TestCase):
+    engine: GameEngine
+    player1: str
+    player2: str
+
+    def setUp(self):
+        initialize_game_to_third_turn(self, generate_deck_with(None, {"hBP07-016": 2, "hBP05-086": 1}))
+        self.p1: PlayerState = self.engine.get_player(self.player1)
+
+    def test_registry_reused_until_stage_changes(self):
+        registry = self.p1.get_stage_effect_registry()
+        self.assertIs(self.p1.get_stage_effect_registry(), registry)
+        self.assertEqual(self.p1.get_effects_at_timing("check_hp", None), [])
+
+        holomem = put_card_in_play(self, self.p1, "hBP07-016", self.p1.backstage)
+        effects = self.p1.get_effects_at_timing("check_hp", None)
+        self.assertEqual(len(effects), 1)
+        self.assertEqual(effects[0]["source_card_id"], holomem["game_card_id"])
+        self.assertEqual(effects[0]["player_id"], self.player1)
+
+        self.p1.move_card(holomem["game_card_id"], "archive")
+        self.assertEqual(self.p1.get_effects_at_timing("check_hp", None), [])
+
+    def test_attached_global_effects(self):
+        center = self.p1.center[0]
+        self.assertEqual(self.p1.get_effects_at_timing("on_kill", None), [])
+        mascot = add_card_to_hand(self, self.p1, "hBP05-086")
+        self.p1.move_card(mascot["game_card_id"], "holomem", zone_card_id=center["game_card_id"])
+        effects = self.p1.get_effects_at_timing("on_kill", None)
+        self.assertEqual(len(effects), 1)
+        self.assertEqual(effects[0]["source_card_id"], mascot["game_card_id"])
+
+    def test_returned_effects_are_copies(self):
+        holomem = put_card_in_play(self, self.p1, "hBP07-016", self.p1.backstage)
+        effect = self.p1.get_effects_at_timing("check_hp", None)[0]
+        effect["amount"] = 0
+        self.assertEqual(self.p1.get_effects_at_timing("check_hp", None)[0]["amount"], 30)
+        self.assertEqual(holomem["gift_effects"][0]["amount"], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from copy import deepcopy
+
+from app.card_database import CardDatabase
+from app.engine.models import Continuation
+from app.replay import MatchReplay, normalize_event
+from tests.test_replay import play_ai_game
+
+
+class Test_EngineClone(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+        cls.match_data = play_ai_game(cls.card_db, 1)
+
+    def setUp(self):
+        self.message_index = len(self.match_data["all_game_messages"]) // 2
+        self.engine = MatchReplay(self.card_db, self.match_data, checkpoint_interval=0).seek(self.message_index)
+
+    def play_remaining_messages(self, engine):
+        for message in self.match_data["all_game_messages"][self.message_index:]:
+            engine.handle_game_message(message["player_id"], message["action_type"], deepcopy(message["action_data"]))
+
+    def test_clone_shares_definitions(self):
+        clone = self.engine.clone()
+        self.assertIs(clone.card_db, self.card_db)
+        player, clone_player = self.engine.player_states[0], clone.player_states[0]
+        self.assertIsNot(clone_player, player)
+        self.assertIs(clone_player.engine, clone)
+        self.assertIsNot(clone_player.hand, player.hand)
+        self.assertIsNot(clone_player.oshi_card, player.oshi_card)
+        self.assertIs(clone_player.oshi_card.definition, player.oshi_card.definition)
+        self.assertEqual(clone.check_card_indexes(), [])
+
+    def test_clone_is_independent(self):
+        clone = self.engine.clone()
+        clone_player = clone.player_states[0]
+        hand_size = len(self.engine.player_states[0].hand)
+        clone_player.move_card(clone_player.hand[0]["game_card_id"], "archive")
+        self.assertEqual(len(self.engine.player_states[0].hand), hand_size)
+        self.assertEqual(len(clone_player.hand), hand_size - 1)
+        continuation = clone.current_decision["continuation"]
+        if isinstance(continuation, Continuation):
+            self.assertIs(continuation.engine, clone)
+        else:
+            self.assertIs(continuation.__self__, clone)
+
+    def test_clone_plays_out_the_same(self):
+        clone = self.engine.clone()
+        self.play_remaining_messages(clone)
+        self.assertEqual([normalize_event(event) for event in clone.all_events], self.match_data["all_events"])
+        # The original is untouched and can still play out the match.
+        self.assertEqual(len(self.engine.all_game_messages), self.message_index)
+        self.play_remaining_messages(self.engine)
+        self.assertEqual([normalize_event(event) for event in self.engine.all_events], self.match_data["all_events"])
+
+    def test_clone_without_history(self):
+        clone = self.engine.clone(keep_history=False)
+        self.assertEqual(clone.all_events, [])
+        self.assertEqual(clone.all_game_messages, [])
+        self.assertEqual(clone.observer_event_log, [])
+        self.assertTrue(self.engine.all_events)
+        event_count = len(self.match_data["all_events"]) - len(self.engine.all_events)
+        self.play_remaining_messages(clone)
+        self.assertTrue(clone.is_game_over())
+        self.assertEqual(len(clone.all_events), event_count)
+        # Event numbers count from the clone.
+        self.assertEqual(clone.all_events[0]["event_number"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import pickle
+import unittest
+from copy import deepcopy
+
+from app.card_database import CardDatabase
+from app.engine.models import GameCard
+from app.gameengine import GameEngine
+from tests.helpers import generate_deck_with
+
+
+class Test_GameCard(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+
+    def make_card(self, card_id="hSD01-003", game_card_id="p1_1"):
+        return GameCard(self.card_db.get_card_definition(card_id), {
+            "game_card_id": game_card_id,
+            "damage": 0,
+            "attached_cheer": [],
+        })
+
+    def test_reads_fall_through_to_definition(self):
+        card = self.make_card()
+        self.assertEqual(card["card_id"], "hSD01-003")
+        self.assertEqual(card["hp"], self.card_db.get_card_definition("hSD01-003")["hp"])
+        self.assertIn("arts", card)
+        self.assertNotIn("bloom_blocked", card)
+        self.assertEqual(card.get("bloom_blocked", False), False)
+
+    def test_writes_stay_on_instance(self):
+        card = self.make_card()
+        card["damage"] = 30
+        card["hp"] = 10
+        self.assertEqual(card["damage"], 30)
+        self.assertEqual(card["hp"], 10)
+        self.assertNotEqual(self.card_db.get_card_definition("hSD01-003")["hp"], 10)
+
+    def test_nested_fields_copied_before_modification(self):
+        card = self.make_card()
+        other = self.make_card(game_card_id="p1_2")
+        card["arts"][0]["power"] = 999
+        self.assertEqual(card["arts"][0]["power"], 999)
+        self.assertNotEqual(other["arts"][0]["power"], 999)
+        self.assertNotEqual(self.card_db.get_card_definition("hSD01-003")["arts"][0]["power"], 999)
+
+    def test_equality_and_truthiness(self):
+        card = self.make_card()
+        self.assertTrue(card)
+        self.assertEqual(card, card)
+        self.assertNotEqual(card, self.make_card(game_card_id="p1_2"))
+        self.assertIn(card, [self.make_card(game_card_id="p1_2"), card])
+
+    def test_copy_and_pickle(self):
+        card = self.make_card()
+        card["attached_cheer"].append(self.make_card("hY01-001", "p1_1001"))
+        for copied in [deepcopy(card), pickle.loads(pickle.dumps(card))]:
+            self.assertIsInstance(copied, GameCard)
+            self.assertEqual(copied, card)
+            self.assertIsNot(copied["attached_cheer"], card["attached_cheer"])
+        self.assertIs(deepcopy(card).definition, card.definition)
+
+    def test_player_cards_share_definitions(self):
+        deck = generate_deck_with(None, {})
+        player_infos = [
+            {"player_id": "p1", "username": "Player1", **deck},
+            {"player_id": "p2", "username": "Player2", **deck},
+        ]
+        engine = GameEngine(self.card_db, "versus", player_infos)
+        p1 = engine.get_player("p1")
+        p2 = engine.get_player("p2")
+        first = next(card for card in p1.deck if card["card_id"] == "hSD01-003")
+        second = next(card for card in p2.deck if card["card_id"] == "hSD01-003")
+        self.assertIs(first.definition, second.definition)
+        self.assertEqual(first["damage"], 0)
+        self.assertEqual(first["attached_support"], [])
+        self.assertEqual(p1.oshi_card["game_card_id"], "p1_oshi")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from app.card_database import CardDatabase
+from app.engine.constants import EventType
+from app.gameengine import GameEngine
+from app.replay import rebuild_match_log
+from tests.test_replay import play_ai_game
+
+
+class Test_Headless(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+        cls.full_match = play_ai_game(cls.card_db, 1)
+        cls.headless_match = play_ai_game(cls.card_db, 1, headless=True)
+
+    def test_same_game_without_history(self):
+        self.assertEqual(self.headless_match["all_events"], [])
+        self.assertEqual(self.headless_match["winner"], self.full_match["winner"])
+        self.assertEqual(self.headless_match["turn_number"], self.full_match["turn_number"])
+        # Messages point at the event history, which headless games don't have.
+        self.assertEqual(
+            [{**message, "last_event_number": -1} for message in self.full_match["all_game_messages"]],
+            self.headless_match["all_game_messages"],
+        )
+
+    def test_only_decision_events(self):
+        player_infos = [dict(info, player_id=player_id) for info, player_id in zip(self.full_match["player_info"], ["p1", "p2"])]
+        engine = GameEngine(self.card_db, "versus", player_infos, headless=True)
+        engine.begin_game()
+        events = [event for event in engine.grab_events() if event["event_type"] != EventType.EventType_GameStartInfo]
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["event_type"], EventType.EventType_Decision_Choice)
+        self.assertEqual(events[0]["event_player_id"], events[0]["effect_player_id"])
+        self.assertEqual(engine.grab_observer_events(), [])
+        self.assertEqual(engine.all_events, [])
+
+    def test_rebuild_full_log(self):
+        rebuilt = rebuild_match_log(self.card_db, dict(self.headless_match, emote_events=[]))
+        self.assertEqual(len(rebuilt["all_events"]), len(self.full_match["all_events"]))
+        self.assertEqual(rebuilt["all_events"][-1], self.full_match["all_events"][-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.card_database import CardDatabase
+from app.dbaccess import (
+    MIN_INTERNED_STRING_LENGTH, compress_match_log, decompress_match_log, read_match_log, write_match_log,
+)
+from tests.test_replay import play_ai_game
+
+
+def json_round_trip(value):
+    return json.loads(json.dumps(value))
+
+
+class Test_MatchLog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def make_match_data(self, events):
+        return {
+            "player_info": [{"username": "a", "oshi_id": "hSD01-001"}, {"username": "b", "oshi_id": "hSD01-002"}],
+            "winner": "a",
+            "turn_number": 3,
+            "all_events": events,
+            "all_game_messages": [{"player_id": "p1", "action_type": "resign", "action_data": {}}],
+        }
+
+    def assert_round_trip(self, match_data):
+        self.assertEqual(decompress_match_log(compress_match_log(match_data)), json_round_trip(match_data))
+
+    def test_strings_starting_with_at(self):
+        long_string = "@" * MIN_INTERNED_STRING_LENGTH + "card"
+        self.assert_round_trip(self.make_match_data([
+            {"@": "@", "@@": "@@", "@0": "@1", "text": long_string, "again": long_string},
+            {"@@@": "@@" + long_string, long_string: ["@", "@@", "@0"]},
+        ]))
+
+    def test_short_strings(self):
+        short_strings = ["", "a", "ab", "x" * (MIN_INTERNED_STRING_LENGTH - 1)]
+        self.assert_round_trip(self.make_match_data([{value: value for value in short_strings}, {"list": short_strings * 2}]))
+
+    def test_scalars_and_tuples(self):
+        self.assert_round_trip(self.make_match_data([
+            {"none": None, "float": 1.5, "negative": -0.25, "int": 7, "bool": False},
+            {"tuple": ("center", ("p1_1", 2), None), "nested": [(1.5, None)]},
+        ]))
+
+    def test_non_string_keys(self):
+        self.assert_round_trip(self.make_match_data([{1: "one", 2.5: "two", None: "none", False: "false"}]))
+        with self.assertRaises(TypeError):
+            compress_match_log(self.make_match_data([{("a", "b"): 1}]))
+
+    def test_game_round_trip(self):
+        match_data = play_ai_game(CardDatabase(), 1)
+        file_path = os.path.join(self.temp_dir.name, "match.ndjson.gz")
+        write_match_log(file_path, match_data)
+        self.assertEqual(read_match_log(file_path), json_round_trip(match_data))
+
+    def test_read_legacy_json(self):
+        match_data = self.make_match_data([{"event_type": "game_over", "@": "@x"}])
+        file_path = os.path.join(self.temp_dir.name, "match.json")
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(match_data, f)
+        self.assertEqual(read_match_log(file_path), match_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
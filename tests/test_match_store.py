@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import app.dbaccess as dbaccess
+from app.dbaccess import MatchStore, import_match_log_file, write_match_log
+
+
+def make_match_data(first_player, second_player, winner, turn_number=5):
+    return {
+        "player_info": [
+            {"username": first_player[0], "oshi_id": first_player[1]},
+            {"username": second_player[0], "oshi_id": second_player[1]},
+        ],
+        "queue_name": "main",
+        "game_type": "versus",
+        "winner": winner,
+        "turn_number": turn_number,
+        "all_events": [{"event_type": "game_over", "winner_id": winner, "turn": turn_number}],
+        "all_game_messages": [{"player_id": "p1", "action_type": "resign", "action_data": {}}],
+    }
+
+
+class Test_MatchStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store = MatchStore(self.temp_dir.name)
+        self.addCleanup(self.store.close)
+        # Every match after the first starts a new segment.
+        segment_max_bytes = dbaccess.MATCH_SEGMENT_MAX_BYTES
+        dbaccess.MATCH_SEGMENT_MAX_BYTES = 1
+        self.addCleanup(setattr, dbaccess, "MATCH_SEGMENT_MAX_BYTES", segment_max_bytes)
+
+        self.matches = [
+            make_match_data(("alice", "hSD01-001"), ("bob", "hSD01-002"), "alice", 3),
+            make_match_data(("bob", "hSD01-002"), ("carol", "hBP01-001"), "carol", 6),
+            make_match_data(("carol", "hBP01-001"), ("alice", "hSD01-001"), "alice", 9),
+        ]
+        self.match_ids = [
+            self.store.append(match_data, f"match_{index}.ndjson.gz", 1000 + index * 100)
+            for index, match_data in enumerate(self.matches)
+        ]
+
+    def get_match_ids(self, **filters):
+        return [row["match_id"] for row in self.store.find_matches(**filters)]
+
+    def test_segments_roll(self):
+        rows = self.store.find_matches()
+        self.assertEqual(len({row["segment"] for row in rows}), 3)
+        for row in rows:
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, row["segment"])))
+
+    def test_find_matches(self):
+        self.assertEqual(self.get_match_ids(), self.match_ids)
+        self.assertEqual(self.get_match_ids(start_time=1100), self.match_ids[1:])
+        self.assertEqual(self.get_match_ids(end_time=1100), self.match_ids[:2])
+        self.assertEqual(self.get_match_ids(start_time=datetime.fromtimestamp(1050), end_time=datetime.fromtimestamp(1150)), [self.match_ids[1]])
+        self.assertEqual(self.get_match_ids(username="alice"), [self.match_ids[0], self.match_ids[2]])
+        self.assertEqual(self.get_match_ids(oshi_id="hBP01-001"), self.match_ids[1:])
+        self.assertEqual(self.get_match_ids(winner="alice"), [self.match_ids[0], self.match_ids[2]])
+        self.assertEqual(self.get_match_ids(username="bob", winner="carol"), [self.match_ids[1]])
+        self.assertEqual(self.get_match_ids(username="dave"), [])
+
+    def test_read_match(self):
+        for row, match_data in zip(self.store.find_matches(), self.matches):
+            self.assertEqual(row["filename"], f"match_{row['match_id'] - 1}.ndjson.gz")
+            self.assertEqual(self.store.read_match(row), match_data)
+
+    def test_import_match_log_file(self):
+        legacy_match = make_match_data(("dave", "hSD01-001"), ("erin", "hSD01-002"), "erin")
+        legacy_path = os.path.join(self.temp_dir.name, "match_legacy.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump(legacy_match, f)
+        os.utime(legacy_path, (2000, 2000))
+        compact_match = make_match_data(("erin", "hSD01-002"), ("dave", "hSD01-001"), "dave")
+        compact_path = os.path.join(self.temp_dir.name, "match_compact.ndjson.gz")
+        write_match_log(compact_path, compact_match)
+        os.utime(compact_path, (2100, 2100))
+
+        legacy_id = import_match_log_file(legacy_path, self.store, remove_original=True)
+        compact_id = import_match_log_file(compact_path, self.store)
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertTrue(os.path.exists(compact_path))
+
+        rows = self.store.find_matches(start_time=2000)
+        self.assertEqual([row["match_id"] for row in rows], [legacy_id, compact_id])
+        self.assertEqual([row["filename"] for row in rows], ["match_legacy.ndjson.gz", "match_compact.ndjson.gz"])
+        self.assertEqual(self.store.read_match(rows[0]), legacy_match)
+        self.assertEqual(self.store.read_match(rows[1]), compact_match)
+        self.assertEqual(self.get_match_ids(username="erin"), [legacy_id, compact_id])
+
+
+if __name__ == '__main__':
+    unittest.main()
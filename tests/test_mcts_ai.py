@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+import unittest
+
+from app.aiplayer import AIPlayer
+from app.card_database import CardDatabase
+from app.gameengine import GameAction, EventType
+from app.mcts_ai import MCTSAIPlayer, determinize, get_decision_moves, search_moves
+from app.replay import MatchReplay
+from tests.test_replay import play_ai_game
+
+
+class Test_MCTSAI(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+        cls.match_data = play_ai_game(cls.card_db, 3)
+
+    def setUp(self):
+        # Stop at a main step with a few moves to choose from.
+        replay = MatchReplay(self.card_db, self.match_data, checkpoint_interval=0)
+        for index, message in enumerate(self.match_data["all_game_messages"]):
+            if message["action_type"] == GameAction.MainStepBloom:
+                self.engine = replay.seek(index)
+                self.player_id = message["player_id"]
+                break
+        self.available_actions = self.engine.current_decision["available_actions"]
+
+    def get_decision_event(self):
+        return {
+            "event_type": EventType.EventType_Decision_MainStep,
+            "event_player_id": self.player_id,
+            "active_player": self.player_id,
+            "available_actions": self.available_actions,
+        }
+
+    def test_determinize_hides_only_unknown_cards(self):
+        player = self.engine.get_player(self.player_id)
+        opponent = self.engine.other_player(self.player_id)
+        game = determinize(self.engine, self.player_id, random.Random(1))
+        game_player = game.get_player(self.player_id)
+        game_opponent = game.other_player(self.player_id)
+        self.assertTrue(game.headless)
+        self.assertEqual([card["game_card_id"] for card in game_player.hand], [card["game_card_id"] for card in player.hand])
+        self.assertEqual(len(game_opponent.hand), len(opponent.hand))
+        self.assertEqual(
+            sorted(card["game_card_id"] for card in game_opponent.hand + game_opponent.deck + game_opponent.holopower),
+            sorted(card["game_card_id"] for card in opponent.hand + opponent.deck + opponent.holopower),
+        )
+        self.assertEqual(len(game_player.life), len(player.life))
+        self.assertEqual(game.check_card_indexes(), [])
+        self.assertEqual(self.engine.check_card_indexes(), [])
+
+    def test_decision_moves(self):
+        moves = get_decision_moves([
+            {"action_type": GameAction.MainStepBatonPass, "center_id": "c", "backstage_options": ["b1", "b2"], "cost": 1, "available_cheer": ["y1", "y2"]},
+            {"action_type": GameAction.MainStepPlaySupport, "card_id": "s1", "play_requirements": {}, "cheer_on_each_mem": {}},
+            {"action_type": GameAction.MainStepPlaySupport, "card_id": "s1", "play_requirements": {}, "cheer_on_each_mem": {}},
+            {"action_type": GameAction.MainStepEndTurn},
+        ])
+        self.assertEqual(list(moves.values()), [
+            (GameAction.MainStepBatonPass, {"card_id": "b1", "cheer_ids": ["y1"]}),
+            (GameAction.MainStepBatonPass, {"card_id": "b2", "cheer_ids": ["y1"]}),
+            (GameAction.MainStepPlaySupport, {"card_id": "s1"}),
+            (GameAction.MainStepEndTurn, {}),
+        ])
+
+    def test_search_visits_legal_moves(self):
+        message_count = len(self.engine.all_game_messages)
+        stats = search_moves(self.engine, self.player_id, 0.5, 1)
+        self.assertTrue(stats)
+        self.assertLessEqual(set(stats), set(get_decision_moves(self.available_actions)))
+        self.assertTrue(all(move["visits"] > 0 for move in stats.values()))
+        # Searching never touches the real game.
+        self.assertEqual(len(self.engine.all_game_messages), message_count)
+
+    def test_strong_ai_move_is_accepted(self):
+        ai_player = MCTSAIPlayer(self.player_id, time_budget=0.3, workers=1)
+        ai_player.set_engine(self.engine)
+        performing_action, action = ai_player.ai_process_events([self.get_decision_event()])
+        self.assertTrue(performing_action)
+        message_count = len(self.engine.all_game_messages)
+        self.engine.handle_game_message(self.player_id, action["action_type"], action["action_data"])
+        self.assertEqual(len(self.engine.all_game_messages), message_count + 1)
+        self.assertNotEqual(self.engine.all_events[-1]["event_type"], EventType.EventType_GameError)
+
+    def test_move_cap_falls_back_to_greedy(self):
+        ai_player = MCTSAIPlayer(self.player_id, max_move_seconds=0, workers=1)
+        ai_player.set_engine(self.engine)
+        random.seed(2)
+        _, action = ai_player.ai_process_events([self.get_decision_event()])
+        random.seed(2)
+        _, greedy_action = AIPlayer(self.player_id).ai_process_events([self.get_decision_event()])
+        self.assertEqual(action, greedy_action)
+
+    def test_cancel_stops_the_search(self):
+        ai_player = MCTSAIPlayer(self.player_id, time_budget=30, max_move_seconds=30, workers=1)
+        ai_player.set_engine(self.engine)
+        # Cancel from another thread, like a room does when the player resigns.
+        timer = threading.Timer(0.2, ai_player.cancel_move)
+        timer.start()
+        start_time = time.time()
+        random.seed(2)
+        _, action = ai_player.ai_process_events([self.get_decision_event()])
+        self.assertLess(time.time() - start_time, 5)
+        random.seed(2)
+        _, greedy_action = AIPlayer(self.player_id).ai_process_events([self.get_decision_event()])
+        self.assertEqual(action, greedy_action)
+        timer.join()
+
+    def test_cancel_only_stops_one_move(self):
+        ai_player = MCTSAIPlayer(self.player_id, time_budget=0.1, workers=1)
+        ai_player.set_engine(self.engine)
+        searches = []
+        choose_move = ai_player.choose_move
+        ai_player.choose_move = lambda: searches.append(True) or choose_move()
+        # A move that timed out doesn't stop the next one from searching.
+        ai_player.cancel_move()
+        performing_action, _ = ai_player.ai_process_events([self.get_decision_event()])
+        self.assertTrue(performing_action)
+        self.assertEqual(len(searches), 1)
+        # Once the game is ending every move is greedy.
+        ai_player.stop_moves()
+        performing_action, _ = ai_player.ai_process_events([self.get_decision_event()])
+        self.assertTrue(performing_action)
+        self.assertEqual(len(searches), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from app.gameengine import GameEngine
+from app.engine.constants import EventType, UNKNOWN_CARD_ID
+from tests.helpers import *
+
+
+class Test_ObserverLog(unittest.TestCase):
+    engine: GameEngine
+    player1: str
+    player2: str
+
+    def setUp(self):
+        initialize_game_to_third_turn(self, generate_deck_with(None, {}))
+
+    def test_log_matches_all_events(self):
+        events = self.engine.get_observer_catchup_events()
+        self.assertEqual(len(events), len(self.engine.all_events) + 1)
+        self.assertEqual(self.engine.get_observer_catchup_event_count(), len(events))
+        start = events[0]
+        self.assertEqual(start["event_type"], EventType.EventType_GameStartInfo)
+        self.assertEqual(start["event_number"], -1)
+        for observer_event, event in zip(events[1:], self.engine.all_events):
+            self.assertEqual(observer_event["event_player_id"], "observer")
+            self.assertEqual(observer_event["event_number"], event["event_number"])
+
+    def test_log_is_sanitized(self):
+        for observer_event in self.engine.observer_event_log:
+            for field in observer_event.get("hidden_info_fields", []):
+                value = observer_event[field]
+                if field in observer_event.get("hidden_info_erase", []):
+                    self.assertIsNone(value)
+                elif isinstance(value, str):
+                    self.assertEqual(value, UNKNOWN_CARD_ID)
+                elif isinstance(value, list):
+                    self.assertTrue(all(item == UNKNOWN_CARD_ID for item in value))
+
+    def test_pages_cover_log(self):
+        all_events = self.engine.get_observer_catchup_events()
+        paged = []
+        for start in range(0, len(all_events), 7):
+            paged.extend(self.engine.get_observer_catchup_events(start, 7))
+        self.assertEqual(paged, all_events)
+        self.assertEqual(self.engine.get_observer_catchup_events(len(all_events), 7), [])
+
+    def test_broadcast_sanitizes_per_audience(self):
+        self.engine.grab_events()
+        self.engine.grab_observer_events()
+        self.engine.broadcast_event({
+            "event_type": EventType.EventType_Draw,
+            "drawing_player_id": self.player1,
+            "drawn_card_ids": ["a", "b"],
+            "hidden_info_player": self.player1,
+            "hidden_info_fields": ["drawn_card_ids"],
+        })
+        events = self.engine.grab_events()
+        owner_event = next(event for event in events if event["event_player_id"] == self.player1)
+        opponent_event = next(event for event in events if event["event_player_id"] == self.player2)
+        observer_event = self.engine.grab_observer_events()[0]
+        self.assertEqual(owner_event["drawn_card_ids"], ["a", "b"])
+        self.assertEqual(opponent_event["drawn_card_ids"], [UNKNOWN_CARD_ID] * 2)
+        self.assertEqual(observer_event["drawn_card_ids"], [UNKNOWN_CARD_ID] * 2)
+        self.assertEqual(self.engine.all_events[-1]["drawn_card_ids"], ["a", "b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
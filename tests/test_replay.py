@@ -0,0 +1,115 @@
+import json
+import random
+import unittest
+
+from app.aiplayer import AIPlayer, DefaultAIDeck
+from app.card_database import CardDatabase
+from app.engine.models import Continuation
+from app.engine.snapshot import load_engine_snapshot
+from app.gameengine import GameEngine
+from app.replay import MatchReplay, verify_match_log, strip_match_log, rebuild_match_log
+
+
+def play_ai_game(card_db, seed, emote_after_message=None, headless=False):
+    random.seed(seed)
+    ai_players = {}
+    player_infos = []
+    for player_id in ["p1", "p2"]:
+        ai_player = AIPlayer(player_id)
+        ai_player.set_deck(DefaultAIDeck)
+        ai_players[player_id] = ai_player
+        player_infos.append(dict(ai_player.get_player_game_info(), username=player_id))
+    engine = GameEngine(card_db, "versus", player_infos, headless=headless)
+    engine.begin_game()
+    events = engine.grab_events()
+    while not engine.is_game_over():
+        for player_id, ai_player in ai_players.items():
+            performing_action, action = ai_player.ai_process_events(events)
+            if performing_action:
+                engine.handle_game_message(player_id, action["action_type"], action["action_data"])
+                if len(engine.all_game_messages) == emote_after_message:
+                    engine.handle_emote("p1", 1)
+                events = engine.grab_events()
+                break
+        else:
+            break
+    # Match logs are stored as json.
+    return json.loads(json.dumps(engine.get_match_log()))
+
+
+class Test_Replay(unittest.TestCase):
+    card_db: CardDatabase
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_db = CardDatabase()
+        cls.match_data = play_ai_game(cls.card_db, 1, emote_after_message=5)
+
+    def test_replay_matches_log(self):
+        self.assertTrue(verify_match_log(self.card_db, self.match_data))
+
+    def test_replay_detects_changed_log(self):
+        match_data = json.loads(json.dumps(self.match_data))
+        match_data["all_events"][20]["event_type"] = "changed"
+        mismatches = MatchReplay(self.card_db, match_data).run_to_end()
+        self.assertEqual(mismatches[0]["event_index"], 20)
+
+    def test_seek(self):
+        replay = MatchReplay(self.card_db, self.match_data)
+        messages = self.match_data["all_game_messages"]
+        for message_index in [10, 3, len(messages) // 2]:
+            engine = replay.seek(message_index)
+            self.assertEqual(replay.message_index, message_index)
+            self.assertEqual(len(engine.all_game_messages), message_index)
+            self.assertEqual(len(engine.all_events) - 1, messages[message_index]["last_event_number"])
+        replay.run_to_end()
+        self.assertTrue(replay.engine.is_game_over())
+
+    def test_seek_from_checkpoints(self):
+        messages = self.match_data["all_game_messages"]
+        replay = MatchReplay(self.card_db, self.match_data, checkpoint_interval=10)
+        replay.run_to_end()
+        self.assertEqual(sorted(replay.checkpoints), list(range(0, len(messages) + 1, 10)))
+        target = len(messages) // 2 + 3
+        engine = replay.seek(target)
+        expected_engine = MatchReplay(self.card_db, self.match_data, checkpoint_interval=0).seek(target)
+        self.assertEqual(len(engine.all_game_messages), target)
+        self.assertEqual(engine.all_events, expected_engine.all_events)
+        self.assertEqual(engine.random_gen.getstate(), expected_engine.random_gen.getstate())
+        for player_state, expected_state in zip(engine.player_states, expected_engine.player_states):
+            self.assertEqual(player_state.hand, expected_state.hand)
+            self.assertEqual(player_state.deck, expected_state.deck)
+        # The restored engine carries on from the checkpoint and still matches the log.
+        self.assertEqual(replay.run_to_end(), [])
+
+    def test_snapshot_at_every_message(self):
+        # Pending decisions and effect resolution hold no closures, so any point of the game can be saved.
+        replay = MatchReplay(self.card_db, self.match_data, checkpoint_interval=1)
+        self.assertEqual(replay.run_to_end(), [])
+        self.assertEqual(len(replay.checkpoints), len(self.match_data["all_game_messages"]) + 1)
+        pending_steps = []
+        for message_index in sorted(replay.checkpoints):
+            engine = load_engine_snapshot(replay.checkpoints[message_index][1], self.card_db)
+            self.assertIs(engine.card_db, self.card_db)
+            if engine.current_decision and isinstance(engine.current_decision["continuation"], Continuation):
+                pending_steps.append(engine.current_decision["continuation"])
+                break
+        self.assertIs(pending_steps[0].engine, engine)
+
+    def test_seek_turn(self):
+        replay = MatchReplay(self.card_db, self.match_data, checkpoint_interval=10)
+        replay.run_to_end()
+        engine = replay.seek_turn(3)
+        self.assertEqual(engine.turn_number, 3)
+        self.assertEqual(replay.seek(replay.message_index - 1).turn_number, 2)
+
+    def test_rebuild_stripped_log(self):
+        stripped = strip_match_log(self.match_data)
+        self.assertNotIn("all_events", stripped)
+        self.assertEqual(len(stripped["emote_events"]), 1)
+        rebuilt = rebuild_match_log(self.card_db, stripped)
+        self.assertEqual(rebuilt["all_events"], self.match_data["all_events"])
+
+
+if __name__ == '__main__':
+    unittest.main()
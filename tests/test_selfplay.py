@@ -0,0 +1,50 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.selfplay import build_selfplay_tasks, run_selfplay, run_selfplay_game
+
+
+class Test_SelfPlay(unittest.TestCase):
+    def test_tasks_are_reproducible(self):
+        tasks = build_selfplay_tasks(["whale", "starter_sora", "starter_azki"], 2, seed=5)
+        self.assertEqual(len(tasks), 6)
+        self.assertEqual(tasks, build_selfplay_tasks(["whale", "starter_sora", "starter_azki"], 2, seed=5))
+        # Seats switch every game.
+        self.assertEqual(tasks[0]["deck_names"], ["whale", "starter_sora"])
+        self.assertEqual(tasks[1]["deck_names"], ["starter_sora", "whale"])
+        with self.assertRaises(ValueError):
+            build_selfplay_tasks(["not_a_deck"], 1)
+
+    def test_same_seed_same_game(self):
+        task = build_selfplay_tasks(["whale", "starter_sora"], 1, seed=2)[0]
+        result = run_selfplay_game(task)
+        self.assertNotIn("error", result)
+        repeat = run_selfplay_game(task)
+        for key in ["winner", "turns", "messages", "card_plays"]:
+            self.assertEqual(result[key], repeat[key])
+        self.assertTrue(result["card_plays"][0])
+
+    def test_engine_errors_are_reported(self):
+        task = build_selfplay_tasks(["whale", "starter_sora"], 1, seed=2)[0]
+        task["decks"][0] = dict(task["decks"][0], oshi_id="missing-oshi")
+        result = run_selfplay_game(task)
+        self.assertIn("error", result)
+        self.assertIn("Traceback", result["traceback"])
+
+    def test_results_written_to_disk(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            stats = run_selfplay(["whale", "starter_sora"], 2, seed=1, workers=1, output_dir=output_dir)
+            with open(os.path.join(output_dir, "games.ndjson"), "r", encoding="utf-8") as f:
+                results = [json.loads(line) for line in f]
+            with open(os.path.join(output_dir, "summary.json"), "r", encoding="utf-8") as f:
+                summary = json.load(f)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(summary["games"] + summary["errors"], 2)
+        self.assertEqual(summary["games"], stats.games)
+        self.assertEqual(sum(deck["wins"] for deck in summary["decks"].values()), summary["games"])
+
+
+if __name__ == '__main__':
+    unittest.main()